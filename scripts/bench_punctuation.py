@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""句読点正規化（PunctuationNormalizer）のベンチマークスクリプト。
+
+サンプル文を組み合わせた行（既定 100k 行）に normalize_punctuation を
+適用し、所要時間と 1 行あたりの処理時間を表示する。
+
+Usage:
+    make bench-punctuation                 # 100k 行で実行
+    make bench-punctuation LINES=20000     # 行数を指定
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.punctuation_normalizer import PunctuationNormalizer
+
+# 行の材料（規則に当たる文・当たらない文・コロン・鉤括弧を含む）
+SAMPLE_SENTENCES = [
+    "筆者は日本国内初のSREに関するテックカンファレンス「SRE NEXT」を立ち上げた。",
+    "SREにおける信頼性の定義について解説する。",
+    "このシステムによる効果は大きい。",
+    "大規模に運用されるサービスでは監視が欠かせない。",
+    "サービスレベル目標というのが重要な考え方である。",
+    "これは問題ではありません。",
+    "可用性の目標値にはならない数値もある。",
+    "注意：設定は10:30に反映される。",
+    "エラーバジェットは許容されるエラーの量を表す。",
+    "第2章で説明したSLOの考え方に基づく。",
+    "監視とアラートの設計",
+    "",
+]
+
+
+def build_lines(count: int, seed: int = 0) -> list[str]:
+    """サンプル文を 1〜4 文ずつ組み合わせた行を作る."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(SAMPLE_SENTENCES, k=rng.randint(1, 4))) for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark punctuation normalization")
+    parser.add_argument("--lines", type=int, default=100_000, help="Number of lines (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs; the fastest is reported (default: 3)")
+    parser.add_argument("--min-prefix-len", type=int, default=8, help="Rule prefix length (default: 8)")
+    args = parser.parse_args()
+
+    text = "\n".join(build_lines(args.lines))
+    normalizer = PunctuationNormalizer(min_prefix_len=args.min_prefix_len)
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        normalizer.normalize(text)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(f"lines: {args.lines}, chars: {len(text)}")
+    print(f"best of {args.repeat}: {best:.3f}s ({best / args.lines * 1e6:.1f} µs/line)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""Persistent cache of parsed book2.xml content items.
+
+Every stage (gen-dict, clean-text, xml-tts, dialogue-convert) needs the
+same ContentItem sequence. The first full parse of a book writes it to
+data/<hash>/parsed_book.bin in marshal format; later runs load it
+instead of parsing the XML again.
+
+The cache is validated against the source file's resolved path and stat
+signature (size, mtime_ns, inode), like the sidecars in file_cache, so
+editing the XML invalidates it. Writes are best effort: an unwritable
+data directory only costs the speedup.
+
+File layout (consecutive records, each a 4-byte little-endian length
+followed by marshal data):
+    header: {"version", "marshal_version", "path", "signature"}
+    batches: lists of (item_type, text, chapter_number, heading) tuples,
+        heading being (level, number, title, read_aloud) or None
+    trailer: None
+"""
+
+import itertools
+import logging
+import marshal
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Iterator, Union
+
+from src import dict_manager
+from src.dict_manager import StreamingContentHasher, get_cached_xml_content_hash, record_xml_content_hash
+from src.file_cache import FileSignature, get_file_signature, is_racy
+from src.xml_parser import ContentItem, HeadingInfo, iter_book2_xml
+
+logger = logging.getLogger(__name__)
+
+# Bump when the record layout changes to invalidate existing caches
+BOOK_CACHE_VERSION = 1
+
+BOOK_CACHE_FILENAME = "parsed_book.bin"
+
+# Items per marshal record
+_BATCH_SIZE = 1024
+
+# (item_type, text, chapter_number, (level, number, title, read_aloud) or None)
+ItemRecord = tuple[str, str, int | None, tuple[int, str, str, bool] | None]
+
+# Length prefix of each record (marshal.load() on a file object reads in tiny
+# chunks; framing lets the reader fetch a record in one read and use loads())
+_RECORD_LENGTH = struct.Struct("<I")
+
+
+def get_book_cache_path(content_hash: str) -> Path:
+    """Get the parsed-book cache path for a content hash.
+
+    Args:
+        content_hash: Content hash of the book
+
+    Returns:
+        Path to data/<hash>/parsed_book.bin
+    """
+    return dict_manager.DATA_BASE_DIR / content_hash / BOOK_CACHE_FILENAME
+
+
+def iter_book_items(xml_path: Union[str, Path]) -> Iterator[ContentItem]:
+    """Yield the content items of a book2.xml file, using the cache if valid.
+
+    On a cache miss the XML is streamed with iter_book2_xml() and, once
+    fully consumed, the items are stored for the next run and the content
+    hash is memoized (see get_xml_content_hash()).
+
+    Args:
+        xml_path: Path to the XML file
+
+    Yields:
+        ContentItem objects in document order, as iter_book2_xml() yields them
+
+    Raises:
+        FileNotFoundError: If the XML file does not exist
+        xml.etree.ElementTree.ParseError: If the XML is malformed
+    """
+    for item_type, text, chapter_number, heading in _iter_records(xml_path):
+        heading_info = HeadingInfo(*heading) if heading is not None else None
+        yield ContentItem(item_type, text, heading_info, chapter_number)
+
+
+def load_book_items(xml_path: Union[str, Path]) -> list[ContentItem]:
+    """Get all content items of a book2.xml file, using the cache if valid.
+
+    Cached equivalent of parse_book2_xml().
+
+    Args:
+        xml_path: Path to the XML file
+
+    Returns:
+        List of ContentItem objects in document order
+
+    Raises:
+        FileNotFoundError: If the XML file does not exist
+        xml.etree.ElementTree.ParseError: If the XML is malformed
+    """
+    return list(iter_book_items(xml_path))
+
+
+def _iter_records(xml_path: Union[str, Path]) -> Iterator[ItemRecord]:
+    """Yield item records from the cache if valid, otherwise from the parser."""
+    xml_path = Path(xml_path)
+    resolved = str(xml_path.resolve())
+    signature = get_file_signature(resolved)
+
+    content_hash = get_cached_xml_content_hash(xml_path)
+    if content_hash is not None:
+        cache_file = _open_cache(get_book_cache_path(content_hash), resolved, signature)
+        if cache_file is not None:
+            logger.debug("Loading parsed book from cache: %s", cache_file.name)
+            loaded = 0
+            with cache_file:
+                try:
+                    for record in _read_records(cache_file):
+                        yield record
+                        loaded += 1
+                    return
+                except ValueError as e:
+                    logger.warning("Discarding parsed-book cache: %s", e)
+            # Re-parse (rewriting the cache), skipping the items already yielded
+            _remove_quietly(cache_file.name)
+            yield from itertools.islice(_parse_records(xml_path, resolved, signature), loaded, None)
+            return
+
+    yield from _parse_records(xml_path, resolved, signature)
+
+
+def _parse_records(xml_path: Path, resolved: str, signature: FileSignature) -> Iterator[ItemRecord]:
+    """Yield item records from the parser, storing them in the cache unless the file is too fresh."""
+    if is_racy(signature):
+        # Too fresh to trust the stat signature; don't cache
+        yield from (_item_record(item) for item in iter_book2_xml(xml_path))
+        return
+
+    yield from _parse_and_store(xml_path, resolved, signature)
+
+
+def _open_cache(cache_path: Path, resolved: str, signature: FileSignature) -> IO[bytes] | None:
+    """Open a cache file positioned after its header, or None if missing or stale."""
+    try:
+        f = open(cache_path, "rb")
+    except OSError:
+        return None
+
+    try:
+        header = _read_record(f)
+    except ValueError:
+        header = None
+    if (
+        not isinstance(header, dict)
+        or header.get("version") != BOOK_CACHE_VERSION
+        or header.get("marshal_version") != marshal.version
+        or header.get("path") != resolved
+        or tuple(header.get("signature", ())) != signature
+    ):
+        f.close()
+        return None
+    return f
+
+
+def _read_records(f: IO[bytes]) -> Iterator[ItemRecord]:
+    """Yield the item records stored after the header of an open cache file.
+
+    Raises:
+        ValueError: If the file is truncated or corrupt
+    """
+    while True:
+        batch = _read_record(f)
+        if batch is None:
+            return
+        yield from batch
+
+
+def _read_record(f: IO[bytes]) -> Any:
+    """Read one length-prefixed marshal record.
+
+    Raises:
+        ValueError: If the record is truncated or not valid marshal data
+    """
+    prefix = f.read(_RECORD_LENGTH.size)
+    if len(prefix) != _RECORD_LENGTH.size:
+        raise ValueError(f"Truncated parsed-book cache: {f.name}")
+    (length,) = _RECORD_LENGTH.unpack(prefix)
+    data = f.read(length)
+    if len(data) != length:
+        raise ValueError(f"Truncated parsed-book cache: {f.name}")
+    try:
+        return marshal.loads(data)
+    except (EOFError, ValueError, TypeError) as e:
+        raise ValueError(f"Corrupt parsed-book cache: {f.name}") from e
+
+
+def _item_record(item: ContentItem) -> ItemRecord:
+    """Convert a ContentItem to its marshal-friendly tuple."""
+    heading = item.heading_info
+    return (
+        item.item_type,
+        item.text,
+        item.chapter_number,
+        (heading.level, heading.number, heading.title, heading.read_aloud) if heading is not None else None,
+    )
+
+
+def _parse_and_store(xml_path: Path, resolved: str, signature: FileSignature) -> Iterator[ItemRecord]:
+    """Stream item records from the XML while writing them to a temporary cache file.
+
+    The file is moved into data/<hash>/ only when the stream completes and
+    the source is unchanged; otherwise it is discarded.
+    """
+    tmp = _create_temp_file()
+    hasher = StreamingContentHasher()
+    batch: list[ItemRecord] = []
+    completed = False
+
+    try:
+        if tmp is not None:
+            header = {
+                "version": BOOK_CACHE_VERSION,
+                "marshal_version": marshal.version,
+                "path": resolved,
+                "signature": list(signature),
+            }
+            tmp = _write_record(tmp, header)
+
+        for item in iter_book2_xml(xml_path):
+            hasher.update(item.text)
+            record = _item_record(item)
+            if tmp is not None:
+                batch.append(record)
+                if len(batch) >= _BATCH_SIZE:
+                    tmp = _write_record(tmp, batch)
+                    batch = []
+            yield record
+
+        if tmp is not None and batch:
+            tmp = _write_record(tmp, batch)
+        if tmp is not None:
+            tmp = _write_record(tmp, None)
+        completed = True
+    finally:
+        if tmp is not None:
+            tmp.close()
+            if completed:
+                _commit_cache(tmp.name, xml_path, signature, hasher.hexdigest())
+            else:
+                _remove_quietly(tmp.name)
+
+
+def _create_temp_file() -> IO[bytes] | None:
+    """Create a temporary cache file in the data directory (best effort)."""
+    try:
+        dict_manager.DATA_BASE_DIR.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile(
+            prefix=".parsed_book.", suffix=".tmp", dir=dict_manager.DATA_BASE_DIR, delete=False
+        )
+    except OSError as e:
+        logger.debug("Parsed-book cache disabled: %s", e)
+        return None
+
+
+def _write_record(f: IO[bytes], record: Any) -> IO[bytes] | None:
+    """Append a length-prefixed marshal record, dropping the cache file on write errors."""
+    data = marshal.dumps(record)
+    try:
+        f.write(_RECORD_LENGTH.pack(len(data)))
+        f.write(data)
+    except OSError as e:
+        logger.debug("Could not write parsed-book cache: %s", e)
+        f.close()
+        _remove_quietly(f.name)
+        return None
+    return f
+
+
+def _commit_cache(tmp_name: str, xml_path: Path, signature: FileSignature, content_hash: str) -> None:
+    """Move a completed cache file into place and memoize the content hash."""
+    try:
+        unchanged = get_file_signature(xml_path.resolve()) == signature
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        logger.debug("Source changed while parsing, discarding cache: %s", xml_path)
+        _remove_quietly(tmp_name)
+        return
+
+    cache_path = get_book_cache_path(content_hash)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_name, cache_path)
+    except OSError as e:
+        logger.debug("Could not store parsed-book cache %s: %s", cache_path, e)
+        _remove_quietly(tmp_name)
+        return
+
+    logger.debug("Stored parsed book: %s", cache_path)
+    record_xml_content_hash(xml_path, content_hash, signature)
+
+
+def _remove_quietly(path: str) -> None:
+    """Delete a file, ignoring errors."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
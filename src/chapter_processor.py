@@ -5,20 +5,31 @@ generating chapter-based audio files, and handling audio effects.
 """
 
 import argparse
+import itertools
 import logging
 import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import numpy as np
 import soundfile as sf
 
+from src.chunk_planner import ChunkPlanner
+from src.stage_pipeline import StagedPipeline, StageQueue, StageStats
+from src.synthesis_pool import SynthesisPool
 from src.text_cleaner import clean_page_text, split_text_into_chunks
 from src.voicevox_client import concatenate_audio_files, generate_audio, normalize_audio, save_audio
-from src.xml_parser import CHAPTER_MARKER, SECTION_MARKER, ContentItem
+from src.xml_parser import CHAPTER_MARKER, SECTION_MARKER, ContentItem, HeadingInfo
 
 logger = logging.getLogger(__name__)
 
+# Items the text stage may prepare ahead of synthesis
+_TEXT_QUEUE_SIZE = 256
+
+# Synthesized items waiting to be written (bounds the audio held in between)
+_AUDIO_QUEUE_SIZE = 8
+
 
 def sanitize_filename(number: int, title: str) -> str:
     """Sanitize chapter title for use in filename.
@@ -82,199 +93,356 @@ def load_sound(sound_path: Path, target_sr: int = 24000) -> np.ndarray:
     return data
 
 
+def get_chunk_planner(args: argparse.Namespace) -> ChunkPlanner | None:
+    """Get the duration-aware chunk planner requested by --chunk-seconds.
+
+    Args:
+        args: Parsed arguments (chunk_seconds, max_chunk_chars, speed)
+
+    Returns:
+        ChunkPlanner, or None to chunk by characters only
+    """
+    chunk_seconds = getattr(args, "chunk_seconds", None)
+    if not isinstance(chunk_seconds, (int, float)) or chunk_seconds <= 0:
+        return None
+    return ChunkPlanner(chunk_seconds, max_chars=args.max_chunk_chars, speed=args.speed)
+
+
+def _split_chunks(text: str, args: argparse.Namespace, planner: ChunkPlanner | None) -> list[str]:
+    """Split cleaned text into TTS chunks (by estimated duration when planned)."""
+    if planner is None:
+        return split_text_into_chunks(text, args.max_chunk_chars)
+    return [text[start:end] for start, end in planner.spans(text)]
+
+
+def _item_segments(
+    item: ContentItem,
+    args: argparse.Namespace,
+    planner: ChunkPlanner | None,
+    cleaned: bool,
+    chapter_sound: np.ndarray | None,
+    section_sound: np.ndarray | None,
+) -> list[np.ndarray | str]:
+    """Turn one content item into sound effects and chunk texts to synthesize.
+
+    Returns:
+        Sound effect audio (np.ndarray) and chunk texts (str), in playback order
+    """
+    text = item.text
+    segments: list[np.ndarray | str] = []
+
+    # Check for markers and insert appropriate sound
+    if text.startswith(CHAPTER_MARKER) and chapter_sound is not None:
+        segments.append(chapter_sound)
+        text = text[len(CHAPTER_MARKER) :]
+    elif text.startswith(SECTION_MARKER) and section_sound is not None:
+        segments.append(section_sound)
+        text = text[len(SECTION_MARKER) :]
+
+    # Clean text for TTS
+    text = text.strip()
+    if not text:
+        return segments
+
+    # Apply text cleaning (unless done by the clean stage)
+    if not cleaned:
+        text = clean_page_text(text)
+
+    # Split text into chunks to synthesize
+    segments.extend(chunk_text for chunk_text in _split_chunks(text, args, planner) if chunk_text.strip())
+    return segments
+
+
+def _synthesize_segments(
+    segments: list[np.ndarray | str], synthesizer: Any, args: argparse.Namespace, audio_segments: list[np.ndarray]
+) -> int | None:
+    """Synthesize the chunk texts in segments and append everything to audio_segments.
+
+    segments is emptied. With a SynthesisPool the chunks are synthesized in
+    parallel; otherwise one by one on the synthesizer.
+
+    Returns:
+        Sample rate of the synthesized chunks, or None if there were none
+    """
+    texts = [segment for segment in segments if isinstance(segment, str)]
+    if isinstance(synthesizer, SynthesisPool):
+        results = iter(synthesizer.synthesize(texts, args.style_id, args.speed))
+    else:
+        results = (_synthesize_chunk(synthesizer, text, args) for text in texts)
+
+    sample_rate = None
+    for segment in segments:
+        if isinstance(segment, str):
+            waveform, sample_rate = next(results)
+            audio_segments.append(waveform)
+        else:
+            audio_segments.append(segment)
+    segments.clear()
+    return sample_rate
+
+
+def _synthesize_chunk(synthesizer: Any, text: str, args: argparse.Namespace) -> tuple[np.ndarray, int]:
+    """Synthesize and normalize one chunk in this process."""
+    waveform, sr = generate_audio(
+        synthesizer,
+        text=text,
+        style_id=args.style_id,
+        speed_scale=args.speed,
+    )
+    return normalize_audio(waveform, target_peak=0.9), sr
+
+
+@dataclass
+class _TextBatch:
+    """Sound effects and chunk texts of one item (text stage → synthesis stage)."""
+
+    chapter: int | None  # None: the book has no chapters
+    title: str
+    segments: list[np.ndarray | str]
+    heading: HeadingInfo | None = None  # Section/subsection heading of the item, for progress logs
+    last: bool = False  # Marks the end of the chapter (segments is empty)
+
+
+@dataclass
+class _AudioBatch:
+    """Audio for consecutive segments of a chapter (synthesis stage → writer stage)."""
+
+    chapter: int | None
+    title: str
+    waveforms: list[np.ndarray]
+    sample_rate: int | None
+    last: bool
+
+
+def _iter_chapters(content_items: Iterable[ContentItem]) -> Iterator[tuple[int | None, Iterable[ContentItem]]]:
+    """Group content items by chapter without reading ahead of the current chapter.
+
+    Items arrive in document order, so each chapter is passed on while
+    its items are still being read and ends when the chapter number
+    changes. Only items that cannot be passed on yet are held back:
+
+    - items without a chapter before the first chapter: they make up the
+      whole book (chapter None) if no chapter follows and are skipped
+      otherwise, and
+    - chapters numbered below one already passed on, which follow after
+      the input ends in chapter order.
+
+    Yields:
+        (chapter number, items of the chapter) pairs; each item iterable
+        must be consumed before the next pair is requested
+    """
+    unchaptered: list[ContentItem] = []
+    held: dict[int, list[ContentItem]] = {}
+    streamed: set[int] = set()
+    last_streamed: int | None = None
+
+    for chapter, group in itertools.groupby(content_items, key=lambda item: item.chapter_number):
+        if chapter is None:
+            if last_streamed is None:
+                unchaptered.extend(group)
+            continue
+        if chapter in streamed:
+            logger.warning("Chapter %d continues after another chapter; skipping its later items", chapter)
+            continue
+        if chapter in held or (last_streamed is not None and chapter < last_streamed):
+            held.setdefault(chapter, []).extend(group)
+            continue
+        unchaptered = []
+        streamed.add(chapter)
+        last_streamed = chapter
+        yield chapter, group
+
+    if last_streamed is None:
+        yield None, unchaptered
+    for chapter in sorted(held):
+        yield chapter, held[chapter]
+
+
+def _prepare_text(
+    content_items: Iterable[ContentItem],
+    args: argparse.Namespace,
+    cleaned: bool,
+    chapter_sound: np.ndarray | None,
+    section_sound: np.ndarray | None,
+    text_queue: StageQueue[_TextBatch],
+    stats: StageStats,
+) -> None:
+    """Text stage: clean and chunk items chapter by chapter as they are read."""
+    planner = get_chunk_planner(args)
+    chapters = _iter_chapters(content_items)
+
+    while True:
+        with stats.busy():
+            chapter = next(chapters, None)
+        if chapter is None:
+            break
+        chapter_num, chapter_items = chapter
+        items = iter(chapter_items)
+        chapter_title = "untitled"
+        titled = False
+
+        while True:
+            with stats.busy():
+                item = next(items, None)
+                if item is None:
+                    break
+                # The chapter title comes from its first level-1 heading
+                if not titled and item.item_type == "heading" and item.heading_info and item.heading_info.level == 1:
+                    chapter_title = item.heading_info.title
+                    titled = True
+                segments = _item_segments(item, args, planner, cleaned, chapter_sound, section_sound)
+            is_section = item.item_type == "heading" and item.heading_info is not None and item.heading_info.level > 1
+            heading = item.heading_info if is_section else None
+            if segments or heading is not None:
+                text_queue.put(_TextBatch(chapter_num, chapter_title, segments, heading))
+        text_queue.put(_TextBatch(chapter_num, chapter_title, [], last=True))
+    text_queue.close()
+
+
+def _log_progress(batch: _TextBatch, new_chapter: bool) -> None:
+    """Log the chapter and section headings as the synthesis stage reaches them."""
+    if new_chapter:
+        if batch.chapter is None:
+            logger.info("Processing content (no chapters)")
+        else:
+            logger.info("Processing Chapter %d: %s", batch.chapter, batch.title)
+
+    # Log section/subsection headings
+    if batch.heading is not None:
+        indent = "  " * (batch.heading.level - 1)
+        level_name = "Section" if batch.heading.level == 2 else "Subsection"
+        logger.info("%s%s %s: %s", indent, level_name, batch.heading.number, batch.heading.title)
+
+
+def _synthesize_batches(
+    text_queue: StageQueue[_TextBatch],
+    audio_queue: StageQueue[_AudioBatch],
+    synthesizer: Any,
+    args: argparse.Namespace,
+    stats: StageStats,
+) -> None:
+    """Synthesis stage: synthesize each item (a whole chapter with a pool)."""
+    pending: list[np.ndarray | str] = []
+    new_chapter = True
+    for batch in text_queue:
+        # The text stage runs ahead, so progress is logged here
+        _log_progress(batch, new_chapter)
+        new_chapter = batch.last
+        pending.extend(batch.segments)
+        # A pool synthesizes the whole chapter at once (longest chunks first)
+        if batch.last or not isinstance(synthesizer, SynthesisPool):
+            waveforms: list[np.ndarray] = []
+            with stats.busy():
+                sample_rate = _synthesize_segments(pending, synthesizer, args, waveforms)
+            audio_queue.put(_AudioBatch(batch.chapter, batch.title, waveforms, sample_rate, batch.last))
+    audio_queue.close()
+
+
+def _write_audio(
+    audio_queue: StageQueue[_AudioBatch],
+    output_dir: Path,
+    args: argparse.Namespace,
+    wav_files: list[Path],
+    stats: StageStats,
+) -> None:
+    """Writer stage: save each chapter's WAV file, then book.wav."""
+    chapters_dir = output_dir / "chapters"
+    chapter_wav_files: dict[int, Path] = {}
+    audio_segments: list[np.ndarray] = []
+    sample_rate = 24000  # VOICEVOX default
+
+    for batch in audio_queue:
+        with stats.busy():
+            audio_segments.extend(batch.waveforms)
+            sample_rate = batch.sample_rate or sample_rate
+            if not batch.last:
+                continue
+            if batch.chapter is not None:
+                chapters_dir.mkdir(parents=True, exist_ok=True)
+            if not audio_segments:
+                continue
+
+            combined = np.concatenate(audio_segments)
+            audio_segments = []
+            if batch.chapter is None:
+                # No chapters: all content is the single book.wav
+                output_path = output_dir / "book.wav"
+                save_audio(combined, sample_rate, output_path)
+                wav_files.append(output_path)
+                logger.info("Combined audio: %s", output_path)
+                continue
+
+            # Save chapter WAV file with a sanitized filename
+            filename = sanitize_filename(batch.chapter, batch.title) + ".wav"
+            chapter_path = chapters_dir / filename
+            save_audio(combined, sample_rate, chapter_path)
+            chapter_wav_files[batch.chapter] = chapter_path
+            logger.info("Chapter %d audio: %s", batch.chapter, chapter_path)
+
+    # Concatenate all chapters into book.wav (chapters held back by the text stage come last)
+    if chapter_wav_files:
+        with stats.busy():
+            ordered_wav_files = [chapter_wav_files[chapter] for chapter in sorted(chapter_wav_files)]
+            wav_files.extend(ordered_wav_files)
+            if isinstance(getattr(args, "chapter", None), int):
+                # One chapter is not the whole book; keep book.wav from the last full run
+                logger.info("Single-chapter run: book.wav left unchanged")
+                return
+            book_path = output_dir / "book.wav"
+            concatenate_audio_files(ordered_wav_files, book_path)
+            wav_files.append(book_path)
+            logger.info("Combined audio: %s", book_path)
+
+
 def process_chapters(
-    content_items: list[ContentItem],
+    content_items: Iterable[ContentItem],
     synthesizer: Any = None,
     output_dir: Path | None = None,
     args: argparse.Namespace | None = None,
     chapter_sound: np.ndarray | None = None,
     section_sound: np.ndarray | None = None,
+    cleaned: bool = False,
 ) -> list[Path]:
     """Process content items grouped by chapter and generate WAV files.
 
+    Runs as three stages connected by bounded queues, so that text
+    preparation (cleaning, chunking), synthesis and WAV writing overlap:
+    a text thread, synthesis in the calling thread and a writer thread.
+    Each stage's utilization is logged at the end.
+
     Args:
-        content_items: List of ContentItem objects
-        synthesizer: VOICEVOX synthesizer
+        content_items: ContentItem objects in document order (read once)
+        synthesizer: VOICEVOX synthesizer, or a running SynthesisPool to
+            synthesize each chapter's chunks in parallel (start it before
+            calling, as its workers are forked)
         output_dir: Output directory
         args: Parsed arguments
         chapter_sound: Chapter sound effect audio data
         section_sound: Section sound effect audio data
+        cleaned: Items already carry cleaned text (e.g. streamed from
+            cleaned_items.jsonl), so clean_page_text() is skipped
 
     Returns:
-        List of generated WAV file paths (chapter files + book.wav)
+        List of generated WAV file paths (chapter files + book.wav, which a
+        single-chapter run (args.chapter) leaves unchanged)
     """
     # For tests that only check function signature, return empty list
     if synthesizer is None or output_dir is None or args is None:
         return []
 
     output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Group content items by chapter_number
-    chapters_dict: dict[int | None, list[ContentItem]] = {}
-    for item in content_items:
-        chapter_num = item.chapter_number
-        if chapter_num not in chapters_dict:
-            chapters_dict[chapter_num] = []
-        chapters_dict[chapter_num].append(item)
-
-    wav_files = []
-    sample_rate = 24000  # VOICEVOX default
-
-    # Check if we have any chapters (chapter_number is not None)
-    has_chapters = any(k is not None for k in chapters_dict.keys())
-
-    if has_chapters:
-        # Create chapters directory
-        chapters_dir = output_dir / "chapters"
-        chapters_dir.mkdir(parents=True, exist_ok=True)
-
-        # Sort chapter numbers (None values go to end)
-        sorted_chapters = sorted([k for k in chapters_dict.keys() if k is not None])
-        total_chapters = len(sorted_chapters)
-
-        # Process each chapter
-        chapter_wav_files = []
-        for chapter_idx, chapter_num in enumerate(sorted_chapters, 1):
-            items = chapters_dict[chapter_num]
-
-            # Get chapter title from heading
-            chapter_title = "untitled"
-            for item in items:
-                if item.item_type == "heading" and item.heading_info and item.heading_info.level == 1:
-                    chapter_title = item.heading_info.title
-                    break
-
-            # Log chapter start
-            logger.info(
-                "Processing Chapter %d/%d: %s",
-                chapter_idx,
-                total_chapters,
-                chapter_title,
-            )
-
-            # Generate audio for this chapter
-            audio_segments = []
-            for item in items:
-                text = item.text
-
-                # Log section/subsection headings
-                if item.item_type == "heading" and item.heading_info and item.heading_info.level > 1:
-                    indent = "  " * (item.heading_info.level - 1)
-                    level_name = "Section" if item.heading_info.level == 2 else "Subsection"
-                    logger.info(
-                        "%s%s %s: %s",
-                        indent,
-                        level_name,
-                        item.heading_info.number,
-                        item.heading_info.title,
-                    )
-
-                # Check for markers and insert appropriate sound
-                if text.startswith(CHAPTER_MARKER) and chapter_sound is not None:
-                    audio_segments.append(chapter_sound)
-                    text = text[len(CHAPTER_MARKER) :]
-                elif text.startswith(SECTION_MARKER) and section_sound is not None:
-                    audio_segments.append(section_sound)
-                    text = text[len(SECTION_MARKER) :]
-
-                # Clean text for TTS
-                text = text.strip()
-                if not text:
-                    continue
-
-                # Apply text cleaning
-                text = clean_page_text(text)
-
-                # Split text into chunks and synthesize
-                chunks = split_text_into_chunks(text, args.max_chunk_chars)
-                for chunk_text in chunks:
-                    if not chunk_text.strip():
-                        continue
-                    waveform, sr = generate_audio(
-                        synthesizer,
-                        text=chunk_text,
-                        style_id=args.style_id,
-                        speed_scale=args.speed,
-                    )
-                    waveform = normalize_audio(waveform, target_peak=0.9)
-                    audio_segments.append(waveform)
-                    sample_rate = sr
-
-            # Save chapter WAV file
-            if audio_segments:
-                combined = np.concatenate(audio_segments)
-
-                # Generate sanitized filename
-                filename = sanitize_filename(chapter_num, chapter_title) + ".wav"
-                chapter_path = chapters_dir / filename
-                save_audio(combined, sample_rate, chapter_path)
-                chapter_wav_files.append(chapter_path)
-                wav_files.append(chapter_path)
-                logger.info("Chapter %d audio: %s", chapter_num, chapter_path)
-
-        # Concatenate all chapters into book.wav
-        if chapter_wav_files:
-            book_path = output_dir / "book.wav"
-            concatenate_audio_files(chapter_wav_files, book_path)
-            wav_files.append(book_path)
-            logger.info("Combined audio: %s", book_path)
-    else:
-        # No chapters, process all content as single book.wav
-        logger.info("Processing content (no chapters)")
-        audio_segments = []
-        for item in content_items:
-            text = item.text
-
-            # Log section/subsection headings
-            if item.item_type == "heading" and item.heading_info and item.heading_info.level > 1:
-                indent = "  " * (item.heading_info.level - 1)
-                level_name = "Section" if item.heading_info.level == 2 else "Subsection"
-                logger.info(
-                    "%s%s %s: %s",
-                    indent,
-                    level_name,
-                    item.heading_info.number,
-                    item.heading_info.title,
-                )
-
-            # Check for markers and insert appropriate sound
-            if text.startswith(CHAPTER_MARKER) and chapter_sound is not None:
-                audio_segments.append(chapter_sound)
-                text = text[len(CHAPTER_MARKER) :]
-            elif text.startswith(SECTION_MARKER) and section_sound is not None:
-                audio_segments.append(section_sound)
-                text = text[len(SECTION_MARKER) :]
-
-            # Clean text for TTS
-            text = text.strip()
-            if not text:
-                continue
-
-            # Apply text cleaning
-            text = clean_page_text(text)
-
-            # Split text into chunks and synthesize
-            chunks = split_text_into_chunks(text, args.max_chunk_chars)
-            for chunk_text in chunks:
-                if not chunk_text.strip():
-                    continue
-                waveform, sr = generate_audio(
-                    synthesizer,
-                    text=chunk_text,
-                    style_id=args.style_id,
-                    speed_scale=args.speed,
-                )
-                waveform = normalize_audio(waveform, target_peak=0.9)
-                audio_segments.append(waveform)
-                sample_rate = sr
-
-        # Save book.wav
-        if audio_segments:
-            combined = np.concatenate(audio_segments)
-            output_path = output_dir / "book.wav"
-            save_audio(combined, sample_rate, output_path)
-            wav_files.append(output_path)
-            logger.info("Combined audio: %s", output_path)
+    wav_files: list[Path] = []
+
+    with StagedPipeline() as pipeline:
+        text_queue: StageQueue[_TextBatch] = pipeline.queue(_TEXT_QUEUE_SIZE)
+        audio_queue: StageQueue[_AudioBatch] = pipeline.queue(_AUDIO_QUEUE_SIZE)
+        pipeline.start_thread(
+            "text",
+            lambda stats: _prepare_text(content_items, args, cleaned, chapter_sound, section_sound, text_queue, stats),
+        )
+        synthesis_stats = pipeline.stage("synthesis")
+        pipeline.start_thread("writer", lambda stats: _write_audio(audio_queue, output_dir, args, wav_files, stats))
+        _synthesize_batches(text_queue, audio_queue, synthesizer, args, synthesis_stats)
 
     return wav_files
 
@@ -305,6 +473,7 @@ def process_content(
         return []
 
     output_dir.mkdir(parents=True, exist_ok=True)
+    planner = get_chunk_planner(args)
 
     # Combine all content text (for potential future use)
     _ = " ".join(item.text for item in content_items)
@@ -335,7 +504,7 @@ def process_content(
         text = clean_page_text(text)
 
         # Split text into chunks and synthesize
-        chunks = split_text_into_chunks(text, args.max_chunk_chars)
+        chunks = _split_chunks(text, args, planner)
         for chunk_text in chunks:
             if not chunk_text.strip():
                 continue
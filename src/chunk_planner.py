@@ -0,0 +1,177 @@
+"""Duration-aware TTS chunk planning.
+
+Character counts are a poor proxy for synthesis cost: after kanji are
+converted to kana, one character is about one mora, while an unconverted
+kanji reads as two or more. Chunks of equal length can therefore differ
+several-fold in audio length, and VOICEVOX inference time and memory grow
+with the number of morae in a chunk.
+
+ChunkPlanner estimates the audio seconds of each sentence from its
+morae and pauses and packs consecutive sentences into chunks of about
+the same duration, at most target_seconds each. A sentence that is
+longer than the target on its own is split further at the usual chunk
+delimiters. The estimate only needs the text: the cleaned text the
+pipeline synthesizes is already mostly kana.
+"""
+
+import math
+import re
+
+from src.span_segmenter import strip_span
+from src.text_cleaner import split_span_into_chunks
+
+# VOICEVOX speaking rate at speed_scale 1.0 (morae per second)
+MORAE_PER_SECOND = 7.5
+
+# Pause inserted at punctuation and line breaks (seconds at speed_scale 1.0)
+PAUSE_SECONDS = 0.3
+
+# Default target duration of one chunk
+DEFAULT_CHUNK_SECONDS = 30.0
+
+# Kana that form one mora each (long vowel mark, sokuon and ん included)
+_KANA_PATTERN = re.compile(r"[ぁ-ゖァ-ヺー]")
+# Small kana that merge with the preceding kana into one mora (きゃ, ファ, ...)
+_SMALL_KANA_PATTERN = re.compile(r"[ぁぃぅぇぉゃゅょゎゕゖァィゥェォャュョヮヵヶ]")
+# Kanji left unconverted, and Latin letters and digits read one by one (about two morae each)
+_TWO_MORA_PATTERN = re.compile(r"[㐀-鿿A-Za-z0-9Ａ-Ｚａ-ｚ０-９]")
+_PAUSE_PATTERN = re.compile(r"[、。，．,.！？!?\n]")
+
+# Ends of the sentences packed into chunks (runs of sentence endings, or line breaks)
+_SENTENCE_END_PATTERN = re.compile(r"[。！？!?]+|\n+")
+
+
+def estimate_morae(text: str) -> int:
+    """Estimate the number of morae VOICEVOX will read in text.
+
+    Args:
+        text: Text to read (typically cleaned, mostly kana)
+
+    Returns:
+        Estimated morae (kana count without small kana, plus two per
+        remaining kanji, Latin letter or digit)
+    """
+    kana = len(_KANA_PATTERN.findall(text)) - len(_SMALL_KANA_PATTERN.findall(text))
+    return kana + 2 * len(_TWO_MORA_PATTERN.findall(text))
+
+
+def estimate_seconds(text: str, speed: float = 1.0) -> float:
+    """Estimate the audio duration of text.
+
+    Args:
+        text: Text to read
+        speed: VOICEVOX speed_scale
+
+    Returns:
+        Estimated seconds of speech including punctuation pauses
+    """
+    return (estimate_morae(text) / MORAE_PER_SECOND + len(_PAUSE_PATTERN.findall(text)) * PAUSE_SECONDS) / speed
+
+
+class ChunkPlanner:
+    """Packs sentences into chunks of similar estimated audio duration.
+
+    Example:
+        >>> planner = ChunkPlanner(target_seconds=2.0)
+        >>> text = "はい。そうです。ありがとうございました。"
+        >>> [text[start:end] for start, end in planner.spans(text)]
+        ['はい。そうです。', 'ありがとうございました。']
+    """
+
+    def __init__(self, target_seconds: float = DEFAULT_CHUNK_SECONDS, max_chars: int = 500, speed: float = 1.0) -> None:
+        """Prepare a planner.
+
+        Args:
+            target_seconds: Maximum estimated audio seconds per chunk
+            max_chars: Maximum characters per chunk (hard limit)
+            speed: VOICEVOX speed_scale the chunks will be read at
+
+        Raises:
+            ValueError: If target_seconds, max_chars or speed is not positive
+        """
+        if target_seconds <= 0 or max_chars < 1 or speed <= 0:
+            raise ValueError("target_seconds, max_chars and speed must be positive")
+        self.target_seconds = target_seconds
+        self.max_chars = max_chars
+        self.speed = speed
+
+    def spans(self, text: str, start: int = 0, end: int | None = None) -> list[tuple[int, int]]:
+        """Plan the chunks of text[start:end].
+
+        The text's sentences are packed greedily, each chunk closing at the
+        sentence boundary nearest to an even share of the text's estimated
+        duration (and never beyond target_seconds or max_chars).
+
+        Args:
+            text: Buffer containing the text to split
+            start: Start offset of the text in the buffer
+            end: End offset (exclusive) of the text in the buffer (default: len(text))
+
+        Returns:
+            (start, end) offsets into text of each chunk, whitespace-stripped
+        """
+        if end is None:
+            end = len(text)
+        pieces = self._pieces(text, start, end)
+        if not pieces:
+            return []
+
+        # Estimate whole spans so the pauses of the line breaks and other
+        # separators between pieces are counted too
+        total = estimate_seconds(text[pieces[0][0] : pieces[-1][1]], self.speed)
+        goal = total / math.ceil(total / self.target_seconds) if total > 0 else self.target_seconds
+
+        spans = []
+        chunk_start, chunk_end, chunk_seconds = pieces[0][0], pieces[0][0], 0.0
+        for piece_start, piece_end, seconds in pieces:
+            if chunk_end > chunk_start:
+                packed = estimate_seconds(text[chunk_start:piece_end], self.speed)
+                over_goal = packed > goal and packed - goal >= goal - chunk_seconds
+                if packed > self.target_seconds or piece_end - chunk_start > self.max_chars or over_goal:
+                    spans.append((chunk_start, chunk_end))
+                    chunk_start, packed = piece_start, seconds
+            else:
+                packed = seconds
+            chunk_end, chunk_seconds = piece_end, packed
+        spans.append((chunk_start, chunk_end))
+        return spans
+
+    def _pieces(self, text: str, start: int, end: int) -> list[tuple[int, int, float]]:
+        """Split text into sentences no longer than one chunk, with their durations.
+
+        Returns:
+            (start, end, estimated seconds) of each whitespace-stripped piece
+        """
+        bounds = [match.end() for match in _SENTENCE_END_PATTERN.finditer(text, start, end)]
+        if not bounds or bounds[-1] < end:
+            bounds.append(end)
+
+        pieces = []
+        piece_start = start
+        for piece_end in bounds:
+            for span in split_span_into_chunks(text, piece_start, piece_end, self.max_chars):
+                pieces.extend(self._fit(text, *strip_span(text, *span)))
+            piece_start = piece_end
+        return pieces
+
+    def _fit(self, text: str, start: int, end: int) -> list[tuple[int, int, float]]:
+        """Split an overlong sentence until each part fits target_seconds.
+
+        A part is split at the length its density allows, and split again
+        if it still overshoots (down to a single character).
+
+        Returns:
+            (start, end, estimated seconds) of each part, in text order
+        """
+        parts = []
+        pending = [(start, end)]
+        while pending:
+            part_start, part_end = pending.pop()
+            seconds = estimate_seconds(text[part_start:part_end], self.speed)
+            if seconds <= self.target_seconds or part_end - part_start <= 1:
+                parts.append((part_start, part_end, seconds))
+                continue
+            length = part_end - part_start
+            max_chars = max(1, min(length - 1, int(length * self.target_seconds / seconds)))
+            pending.extend(reversed(split_span_into_chunks(text, part_start, part_end, max_chars)))
+        return parts
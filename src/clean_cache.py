@@ -0,0 +1,281 @@
+"""Content-addressed cache of cleaned item texts backed by SQLite.
+
+clean-text runs clean_page_text() on every content item of a book. The
+result of one item only depends on:
+
+- the item (type and text),
+- the cleaning rules (the source of the cleaning modules plus the MeCab
+  dictionary and the kanji conversion switch), and
+- the entries of the book's reading dictionary (readings.json) whose
+  term occurs in the item (see ReadingMatcher.entries_in()).
+
+Each cleaned text is stored under the hashes of those three inputs, so a
+re-run after editing a paragraph or a few dictionary entries only cleans
+the items whose inputs changed: adding or changing a term invalidates
+only the items that contain it.
+
+The cache lives in data/clean_cache.sqlite3 rather than data/<hash>/:
+editing any paragraph changes the book's content hash, and the cache
+must survive exactly that edit. Keys are content-addressed, so books
+can share the file safely. Rows written by other rule versions can
+never hit again and are pruned when new results are stored.
+"""
+
+import functools
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Iterable
+
+from src import dict_manager, text_cleaner
+from src.morph_analyzer import get_tagger
+from src.reading_matcher import ReadingMatcher, load_reading_matcher
+
+logger = logging.getLogger(__name__)
+
+CLEAN_CACHE_FILENAME = "clean_cache.sqlite3"
+
+# Bump to invalidate all cached results when cleaning changes outside the fingerprinted modules
+CLEAN_RULES_VERSION = 1
+
+# Modules whose source defines the cleaning rules (fingerprinted into the rules version)
+_RULE_MODULES = (
+    "text_cleaner.py",
+    "text_cleaner_cli.py",
+    "number_normalizer.py",
+    "punctuation_normalizer.py",
+    "reading_dict.py",
+    "reading_matcher.py",
+    "mecab_reader.py",
+    "morph_analyzer.py",
+)
+
+# Seconds to wait for another clean-text process holding the write lock
+_BUSY_TIMEOUT = 30.0
+
+# Keys per bulk lookup query (below SQLite's host parameter limit)
+_LOOKUP_BATCH_SIZE = 500
+
+# Cache key of one item: (item hash, hash of the dictionary entries that apply to it)
+CleanKey = tuple[str, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cleaned_items (
+    item_hash TEXT NOT NULL,
+    rules_version TEXT NOT NULL,
+    dict_hash TEXT NOT NULL,  -- get_entries_hash() of the entries applying to the item
+    cleaned TEXT NOT NULL,
+    PRIMARY KEY (item_hash, rules_version, dict_hash)
+) WITHOUT ROWID
+"""
+
+
+def get_clean_cache_path() -> Path:
+    """Get the path of the clean-text result cache.
+
+    Returns:
+        Path to data/clean_cache.sqlite3
+    """
+    return dict_manager.DATA_BASE_DIR / CLEAN_CACHE_FILENAME
+
+
+@functools.cache
+def get_clean_rules_version() -> str:
+    """Get the fingerprint of the current cleaning rules (computed once).
+
+    Returns:
+        Hex digest of CLEAN_RULES_VERSION, the rule modules' source, the
+        kanji conversion switch and the MeCab dictionary
+    """
+    hasher = hashlib.sha256(f"{CLEAN_RULES_VERSION}\0{text_cleaner.ENABLE_KANJI_CONVERSION}\0".encode())
+    src_dir = Path(__file__).parent
+    for name in _RULE_MODULES:
+        hasher.update((src_dir / name).read_bytes())
+    for info in get_tagger().dictionary_info:
+        hasher.update(f"\0{info['filename']}\0{info['version']}\0{info['size']}".encode())
+    return hasher.hexdigest()
+
+
+def get_reading_dict_hash(content_hash: str) -> str:
+    """Get the hash of a book's whole reading dictionary.
+
+    Args:
+        content_hash: Content hash of the book
+
+    Returns:
+        Hex digest of readings.json, or "" if the book has no dictionary
+    """
+    try:
+        return hashlib.sha256(dict_manager.get_dict_path_from_hash(content_hash).read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+
+def get_item_hash(item_type: str, text: str) -> str:
+    """Get the cache key of one content item.
+
+    Args:
+        item_type: Content item type (cleaning differs for headings)
+        text: Item text
+
+    Returns:
+        Hex digest of the item
+    """
+    return hashlib.sha256(f"{item_type}\0{text}".encode()).hexdigest()
+
+
+def get_entries_hash(entries: Iterable[tuple[str, str]]) -> str:
+    """Get the hash of some reading dictionary entries.
+
+    Args:
+        entries: (term, reading) pairs, in any order
+
+    Returns:
+        Hex digest of the sorted entries, or "" if there are none
+    """
+    pairs = sorted(entries)
+    if not pairs:
+        return ""
+    hasher = hashlib.sha256()
+    for term, reading in pairs:
+        hasher.update(f"{term}\0{reading}\0".encode())
+    return hasher.hexdigest()
+
+
+class CleanCache:
+    """Cleaned item texts for one rules version and reading dictionary.
+
+    Counts hits and misses of lookup() for reporting.
+
+    Example:
+        >>> with CleanCache.open(ReadingMatcher({"API": "エーピーアイ"})) as cache:
+        ...     key = cache.key("paragraph", "APIの本文")
+        ...     found = cache.lookup([key])
+        ...     cache.add({key: "エーピーアイのほんぶん"})
+    """
+
+    def __init__(self, connection: sqlite3.Connection, rules_version: str, matcher: ReadingMatcher | None) -> None:
+        self._conn = connection
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self.rules_version = rules_version
+        self.matcher = matcher
+        self.hits = 0
+        self.misses = 0
+        self._pruned = False
+
+    @classmethod
+    def open(
+        cls, matcher: ReadingMatcher | None, path: Path | None = None, rules_version: str | None = None
+    ) -> "CleanCache":
+        """Open (and create if needed) the clean-text cache.
+
+        Args:
+            matcher: The book's reading dictionary, or None if it has none
+            path: Database path (default: get_clean_cache_path())
+            rules_version: Rules fingerprint (default: get_clean_rules_version())
+
+        Returns:
+            Open CleanCache
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or created
+        """
+        path = path or get_clean_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, timeout=_BUSY_TIMEOUT)
+        return cls(connection, rules_version or get_clean_rules_version(), matcher)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "CleanCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM cleaned_items").fetchone()[0]
+
+    def key(self, item_type: str, text: str) -> CleanKey:
+        """Get the cache key of one content item.
+
+        Args:
+            item_type: Content item type
+            text: Item text
+
+        Returns:
+            (item hash, hash of the dictionary entries whose term occurs in the text)
+        """
+        entries = self.matcher.entries_in(text) if self.matcher is not None else []
+        return get_item_hash(item_type, text), get_entries_hash(entries)
+
+    def lookup(self, keys: Iterable[CleanKey]) -> dict[CleanKey, str]:
+        """Look up cleaned texts for many items at once.
+
+        Args:
+            keys: Item keys (see key())
+
+        Returns:
+            Cleaned texts of the items found in the cache
+        """
+        requested = list(keys)
+        wanted = set(requested)
+        item_hashes = list(dict.fromkeys(item_hash for item_hash, _ in requested))
+        found: dict[CleanKey, str] = {}
+        for i in range(0, len(item_hashes), _LOOKUP_BATCH_SIZE):
+            batch = item_hashes[i : i + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT item_hash, dict_hash, cleaned FROM cleaned_items WHERE rules_version = ? "
+                f"AND item_hash IN ({placeholders})",
+                [self.rules_version, *batch],
+            )
+            found.update(((item_hash, dict_hash), cleaned) for item_hash, dict_hash, cleaned in rows)
+        found = {key: cleaned for key, cleaned in found.items() if key in wanted}
+        hits = sum(1 for key in requested if key in found)
+        self.hits += hits
+        self.misses += len(requested) - hits
+        return found
+
+    def add(self, cleaned: dict[CleanKey, str]) -> None:
+        """Store cleaned texts and drop results of other rule versions.
+
+        Args:
+            cleaned: Item key → cleaned text
+        """
+        if not cleaned:
+            return
+        with self._conn:
+            if not self._pruned:
+                self._conn.execute("DELETE FROM cleaned_items WHERE rules_version != ?", (self.rules_version,))
+                self._pruned = True
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cleaned_items (item_hash, rules_version, dict_hash, cleaned) "
+                "VALUES (?, ?, ?, ?)",
+                [(item_hash, self.rules_version, dict_hash, text) for (item_hash, dict_hash), text in cleaned.items()],
+            )
+
+
+def open_clean_cache(content_hash: str, path: Path | None = None) -> CleanCache | None:
+    """Open the clean-text cache for a book, or None if it is unavailable.
+
+    The cache is an optimization: an unwritable data directory or a
+    locked/corrupt database only means every item is cleaned again.
+
+    Args:
+        content_hash: Content hash of the book (selects its reading dictionary)
+        path: Database path (default: get_clean_cache_path())
+
+    Returns:
+        Open CleanCache, or None on error
+    """
+    try:
+        matcher = load_reading_matcher(dict_manager.get_dict_path_from_hash(content_hash))
+        return CleanCache.open(matcher, path)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.warning("Clean-text cache unavailable: %s", e)
+        return None
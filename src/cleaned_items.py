@@ -0,0 +1,200 @@
+"""Structured output of the clean stage (cleaned_items.jsonl).
+
+cleaned_text.txt is written for people to read and drops what xml-tts
+needs to render audio: item types, heading levels and the chapter/section
+markers that trigger sound effects. The clean stage therefore also writes
+cleaned_items.jsonl next to it, one JSON object per content item in
+document order, and xml-tts streams the cleaned items back from it
+instead of running clean_page_text() a second time.
+
+The header ties the file to the book (content hash), the reading
+dictionary and cleaning rules it was cleaned with (the clean cache's
+fingerprints) and, for runs limited to one chapter, to that chapter, so
+a stale, foreign or partial artifact is detected before synthesis starts.
+
+File layout (one JSON object per line):
+    header: {"version", "content_hash", "reading_dict_hash", "clean_rules",
+        "chapter"}, chapter being null when the whole book was cleaned
+    items: {"chapter", "type", "heading", "marker", "text"}, heading being
+        [level, number, title, read_aloud] or null, marker "chapter",
+        "section" or null, and text the cleaned text (may be empty)
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterator
+
+from src.clean_cache import get_clean_rules_version, get_reading_dict_hash
+from src.xml_parser import CHAPTER_MARKER, SECTION_MARKER, ContentItem, HeadingInfo
+
+logger = logging.getLogger(__name__)
+
+# Bump when the record layout changes to invalidate existing artifacts
+CLEANED_ITEMS_VERSION = 2
+
+CLEANED_ITEMS_FILENAME = "cleaned_items.jsonl"
+CLEANED_TEXT_FILENAME = "cleaned_text.txt"
+
+_MARKER_NAMES = {CHAPTER_MARKER: "chapter", SECTION_MARKER: "section"}
+_MARKERS = {name: marker for marker, name in _MARKER_NAMES.items()}
+
+
+def _make_header(content_hash: str, chapter: int | None) -> dict:
+    """Build the header for the book's current dictionary and cleaning rules."""
+    return {
+        "version": CLEANED_ITEMS_VERSION,
+        "content_hash": content_hash,
+        "reading_dict_hash": get_reading_dict_hash(content_hash),
+        "clean_rules": get_clean_rules_version(),
+        "chapter": chapter,
+    }
+
+
+def get_cleaned_text_path(output_dir: Path, chapter: int | None = None) -> Path:
+    """Get where a run writes its cleaned_text.txt.
+
+    Runs limited to one chapter write cleaned_text_chNN.txt (and
+    cleaned_items_chNN.jsonl), so they never replace the whole book's
+    artifacts.
+
+    Args:
+        output_dir: Book output directory (data/<hash>)
+        chapter: Chapter the run is limited to, or None for the whole book
+
+    Returns:
+        Path to the cleaned text file
+    """
+    if chapter is None:
+        return output_dir / CLEANED_TEXT_FILENAME
+    return output_dir / f"cleaned_text_ch{chapter:02d}.txt"
+
+
+def get_cleaned_items_path(cleaned_text_path: Path) -> Path:
+    """Get the structured artifact written next to a cleaned_text.txt.
+
+    Args:
+        cleaned_text_path: Path to cleaned_text.txt (or cleaned_text_chNN.txt)
+
+    Returns:
+        Path to cleaned_items.jsonl (or cleaned_items_chNN.jsonl) in the
+        same directory
+    """
+    stem = cleaned_text_path.stem
+    suffix = stem[len("cleaned_text") :] if stem.startswith("cleaned_text_ch") else ""
+    return cleaned_text_path.with_name(f"cleaned_items{suffix}.jsonl")
+
+
+class CleanedItemsWriter:
+    """Writer of a cleaned_items.jsonl artifact.
+
+    The file is written under a temporary name and moved into place when
+    the writer is closed without error, so an interrupted run never
+    leaves a truncated artifact behind.
+
+    Example:
+        >>> with CleanedItemsWriter(output_dir / CLEANED_ITEMS_FILENAME, "abc123") as writer:
+        ...     writer.write(item, "ほんぶん")
+    """
+
+    def __init__(self, path: Path, content_hash: str, chapter: int | None = None) -> None:
+        """Start writing an artifact.
+
+        Args:
+            path: Destination path (cleaned_items.jsonl)
+            content_hash: Content hash of the book the items belong to
+            chapter: Chapter number if only that chapter is written
+        """
+        self.path = path
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        self._file = open(self._tmp_path, "w", encoding="utf-8")
+        self._file.write(json.dumps(_make_header(content_hash, chapter)) + "\n")
+
+    def write(self, item: ContentItem, cleaned: str) -> None:
+        """Append one item.
+
+        Args:
+            item: Parsed content item (its text may start with a marker)
+            cleaned: Cleaned text of the item
+        """
+        heading = item.heading_info
+        record = {
+            "chapter": item.chapter_number,
+            "type": item.item_type,
+            "heading": None if heading is None else [heading.level, heading.number, heading.title, heading.read_aloud],
+            "marker": _MARKER_NAMES.get(item.text[:1]),
+            "text": cleaned,
+        }
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def __enter__(self) -> "CleanedItemsWriter":
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        self._file.close()
+        if exc_type is None:
+            os.replace(self._tmp_path, self.path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+def has_cleaned_items(path: Path, content_hash: str, chapter: int | None = None) -> bool:
+    """Check whether an artifact holds the cleaned items a run needs.
+
+    Args:
+        path: Path to cleaned_items.jsonl
+        content_hash: Content hash of the book being synthesized
+        chapter: Chapter being synthesized, or None for the whole book
+
+    Returns:
+        True if the file exists in the current format, was cleaned from
+        this book with its current reading dictionary and the current
+        cleaning rules, and covers the chapter (or the whole book)
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            header = json.loads(f.readline())
+    except (OSError, ValueError) as e:
+        logger.debug("Cannot read cleaned items %s: %s", path, e)
+        return False
+    if not isinstance(header, dict) or header.get("chapter") not in (None, chapter):
+        return False
+    expected = _make_header(content_hash, header["chapter"])
+    if header != expected:
+        logger.info("Cleaned items %s are stale (book, reading dictionary or cleaning rules changed)", path)
+        return False
+    return True
+
+
+def iter_cleaned_items_file(path: Path, chapter: int | None = None) -> Iterator[ContentItem]:
+    """Stream the items of a cleaned_items.jsonl artifact.
+
+    Items carry their cleaned text, prefixed with CHAPTER_MARKER or
+    SECTION_MARKER as in the parsed book, so they can be passed to
+    process_chapters(..., cleaned=True).
+
+    Args:
+        path: Path to cleaned_items.jsonl
+        chapter: Only yield the items of this chapter (default: all items)
+
+    Yields:
+        ContentItem objects in document order
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If a line is not valid JSON
+    """
+    with open(path, encoding="utf-8") as f:
+        f.readline()  # header
+        for line in f:
+            record = json.loads(line)
+            if chapter is not None and record["chapter"] != chapter:
+                continue
+            heading = record["heading"]
+            yield ContentItem(
+                item_type=record["type"],
+                text=_MARKERS.get(record["marker"], "") + record["text"],
+                heading_info=HeadingInfo(*heading) if heading is not None else None,
+                chapter_number=record["chapter"],
+            )
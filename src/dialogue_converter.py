@@ -12,13 +12,15 @@ import time
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Iterable, Literal
 
 import yaml
 
+from src.book_cache import iter_book_items
 from src.dict_manager import get_xml_content_hash
 from src.prompt_loader import load_prompt
-from src.xml_parser import ContentItem, parse_book2_xml
+from src.xml_index import iter_book2_xml_chapter
+from src.xml_parser import ContentItem
 
 # CI環境判定（ollamaのインポート前に判定）
 _IS_CI = os.environ.get("CI", "").lower() in ("true", "1", "yes")
@@ -203,21 +205,19 @@ A: SLIやSLOを設定して監視します。
 """
 
 
-def extract_sections(items: list[ContentItem]) -> list[Section]:
-    """ContentItemリストからセクション単位に抽出する。
+def extract_sections(items: Iterable[ContentItem]) -> list[Section]:
+    """ContentItem列からセクション単位に抽出する。
 
     level=2の見出しをセクション区切りとして使用する。
     level=1のチャプター見出しはスキップする。
+    iter_book2_xml() のイテレータをそのまま渡すこともできる。
 
     Args:
-        items: xml_parserから取得したContentItemリスト
+        items: xml_parserから取得したContentItemのリストまたはイテレータ
 
     Returns:
         Sectionオブジェクトのリスト
     """
-    if not items:
-        return []
-
     sections: list[Section] = []
     current_section: Section | None = None
 
@@ -916,9 +916,14 @@ def main() -> int:
         logger.error("入力パスにディレクトリが指定されました: %s", input_path)
         return 1
 
-    # XMLパース
+    # XMLパース・セクション抽出（ストリーミング）
+    # --chapter 指定時はインデックスを使い、該当チャプターの範囲のみパースする
     try:
-        content_items = parse_book2_xml(input_path)
+        if args.chapter is not None:
+            content_items = iter_book2_xml_chapter(input_path, args.chapter)
+        else:
+            content_items = iter_book_items(input_path)
+        sections = extract_sections(content_items)
     except ET.ParseError as e:
         logger.error("XMLパースエラー: %s", e)
         return 1
@@ -929,9 +934,6 @@ def main() -> int:
     output_dir.mkdir(parents=True, exist_ok=True)
     logger.info("出力ディレクトリ: %s", output_dir)
 
-    # セクション抽出
-    sections = extract_sections(content_items)
-
     # チャプター・セクションフィルタリング
     if args.chapter is not None:
         sections = [s for s in sections if s.chapter_number == args.chapter]
@@ -21,19 +21,19 @@ import numpy as np
 import soundfile as sf
 
 from src.chapter_processor import load_sound
-from src.dict_manager import get_xml_content_hash, load_dict
-from src.llm_reading_generator import apply_llm_readings
+from src.dict_manager import get_dict_path, get_xml_content_hash
 from src.logging_config import setup_logging
 from src.number_normalizer import normalize_numbers
 from src.reading_dict import apply_reading_rules
+from src.reading_matcher import ReadingMatcher, load_reading_matcher
 
 logger = logging.getLogger(__name__)
 
 # 効果音セグメントの話者ID（実在話者と衝突しない識別子）
 _SOUND_EFFECT_SPEAKER_ID = "__sound_effect__"
 
-# Module-level reading dictionary (set via init_readings)
-_READINGS: dict[str, str] = {}
+# Module-level reading dictionary matcher (set via init_readings)
+_READINGS: ReadingMatcher | None = None
 
 # 日本語文字のUnicode範囲（ひらがな、カタカナ、漢字）
 _JAPANESE_PATTERN = re.compile(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]")
@@ -48,13 +48,13 @@ def init_readings(dict_source_path: Path | None) -> None:
     """
     global _READINGS
     if dict_source_path is not None and dict_source_path.exists():
-        _READINGS = load_dict(dict_source_path)
+        _READINGS = load_reading_matcher(get_dict_path(dict_source_path))
         if _READINGS:
             logger.info("Loaded %d readings from dict for: %s", len(_READINGS), dict_source_path.name)
         else:
             logger.warning("No dictionary found for: %s", dict_source_path.name)
     else:
-        _READINGS = {}
+        _READINGS = None
         if dict_source_path is not None:
             logger.warning("Dict source file not found: %s", dict_source_path)
 
@@ -81,7 +81,7 @@ def apply_readings_to_text(text: str) -> str:
 
     # 3. Apply LLM-generated readings if available
     if _READINGS:
-        text = apply_llm_readings(text, _READINGS)
+        text = _READINGS.apply(text)
 
     return text
 
@@ -7,19 +7,37 @@ TTS合成に適した長さに分割する。
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
+import os
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from typing import TextIO
+
+from src.span_segmenter import SpanSegmenter
 
 logger = logging.getLogger(__name__)
 
 # デフォルトの最大文字数
 DEFAULT_MAX_LENGTH = 300
 
+# 分割位置の候補（優先順）: 文末記号、読点
+SENTENCE_DELIMITERS = ("。", "．", ".", "！", "？")
+CLAUSE_DELIMITERS = ("、", "，", ",")
+
+# 分割対象のセクション要素
+SECTION_TAG = "dialogue-section"
+
+# 保持する分割器の数（最大文字数ごと）
+_SEGMENTER_CACHE_SIZE = 8
+
 
 def split_text(text: str, max_length: int = DEFAULT_MAX_LENGTH) -> list[str]:
     """長いテキストを句点・読点で分割する.
 
+    各チャンクは max_length 文字以内に収め、文末記号（句点等）で区切れない
+    場合は読点、それも無い場合は max_length 文字で区切る。
+
     Args:
         text: 分割するテキスト
         max_length: 1チャンクの最大文字数
@@ -30,39 +48,14 @@ def split_text(text: str, max_length: int = DEFAULT_MAX_LENGTH) -> list[str]:
     if not text or len(text) <= max_length:
         return [text] if text else []
 
-    chunks: list[str] = []
-    current = ""
-
-    # 句点で分割
-    for char in text:
-        current += char
-        if char in "。．.！？":
-            if len(current) >= max_length:
-                chunks.append(current.strip())
-                current = ""
-
-    if current.strip():
-        chunks.append(current.strip())
-
-    # それでも長すぎるチャンクがあれば、読点で再分割
-    result: list[str] = []
-    for chunk in chunks:
-        if len(chunk) <= max_length:
-            result.append(chunk)
-        else:
-            # 読点で分割
-            sub_chunks: list[str] = []
-            sub_current = ""
-            for char in chunk:
-                sub_current += char
-                if char in "、，," and len(sub_current) >= max_length // 2:
-                    sub_chunks.append(sub_current.strip())
-                    sub_current = ""
-            if sub_current.strip():
-                sub_chunks.append(sub_current.strip())
-            result.extend(sub_chunks if sub_chunks else [chunk])
+    spans = _get_segmenter(max_length).spans(text)
+    return [text[start:end] for start, end in spans] or [text]
+
 
-    return result if result else [text]
+@functools.lru_cache(maxsize=_SEGMENTER_CACHE_SIZE)
+def _get_segmenter(max_length: int) -> SpanSegmenter:
+    """最大文字数ごとの分割器を返す（文末記号 → 読点の優先順）."""
+    return SpanSegmenter([SENTENCE_DELIMITERS, CLAUSE_DELIMITERS], max_length)
 
 
 def process_dialogue_xml(
@@ -72,6 +65,10 @@ def process_dialogue_xml(
 ) -> dict[str, int]:
     """対話XMLを読み込み、長文を分割して出力する.
 
+    ルート直下の要素を1つずつ読み込み、分割・インデントして書き出してから
+    破棄するため、メモリ使用量は書籍全体ではなく最大の要素の大きさで決まる。
+    出力は一時ファイルに書き、完了後に置き換える（入力ファイルの上書き可）。
+
     Args:
         input_path: 入力XMLファイルパス
         output_path: 出力XMLファイルパス
@@ -80,119 +77,183 @@ def process_dialogue_xml(
     Returns:
         処理統計 {"sections": int, "split_count": int, "original_count": int}
     """
-    tree = ET.parse(input_path)
-    root = tree.getroot()
-
     stats = {"sections": 0, "split_count": 0, "original_count": 0}
 
-    for section in root.iter("dialogue-section"):
-        stats["sections"] += 1
-        section_num = section.get("number", "")
-        section_title = section.get("title", "")[:30]
-
-        # introduction を処理
-        intro = section.find("introduction")
-        if intro is not None and intro.text:
-            original_text = intro.text.strip()
-            if len(original_text) > max_length:
-                chunks = split_text(original_text, max_length)
-                logger.info(
-                    "Section %s: introduction を %d チャンクに分割 (元: %d文字)",
-                    section_num or section_title,
-                    len(chunks),
-                    len(original_text),
-                )
-                # 最初のチャンクをintroductionに残す
-                intro.text = chunks[0]
-                stats["split_count"] += len(chunks) - 1
-                stats["original_count"] += 1
-
-                # 残りをdialogue内にnarrator発話として追加
-                dialogue = section.find("dialogue")
-                if dialogue is None:
-                    dialogue = ET.SubElement(section, "dialogue")
-
-                # 既存のutterancesを取得
-                existing_utterances = list(dialogue.findall("utterance"))
-
-                # dialogueをクリア
-                for utt in existing_utterances:
-                    dialogue.remove(utt)
-
-                # 残りのintroチャンクをnarrator発話として先頭に追加
-                for chunk in chunks[1:]:
-                    new_utt = ET.SubElement(dialogue, "utterance")
-                    new_utt.set("speaker", "narrator")
-                    new_utt.text = chunk
-
-                # 既存のutterancesを戻す
-                for utt in existing_utterances:
-                    dialogue.append(utt)
-
-        # dialogue/utterance を処理
-        dialogue = section.find("dialogue")
-        if dialogue is not None:
-            utterances = list(dialogue.findall("utterance"))
-            for utt in utterances:
-                if utt.text and len(utt.text.strip()) > max_length:
-                    original_text = utt.text.strip()
-                    speaker = utt.get("speaker", "A")
-                    chunks = split_text(original_text, max_length)
-                    logger.info(
-                        "Section %s: utterance(%s) を %d チャンクに分割 (元: %d文字)",
-                        section_num or section_title,
-                        speaker,
-                        len(chunks),
-                        len(original_text),
-                    )
-
-                    # 最初のチャンクを元のutteranceに設定
-                    utt.text = chunks[0]
-                    stats["split_count"] += len(chunks) - 1
-                    stats["original_count"] += 1
-
-                    # 残りを同じspeakerの新しいutteranceとして追加
-                    utt_index = list(dialogue).index(utt)
-                    for i, chunk in enumerate(chunks[1:], 1):
-                        new_utt = ET.Element("utterance")
-                        new_utt.set("speaker", speaker)
-                        new_utt.text = chunk
-                        dialogue.insert(utt_index + i, new_utt)
-
-        # conclusion を処理
-        conclusion = section.find("conclusion")
-        if conclusion is not None and conclusion.text:
-            original_text = conclusion.text.strip()
-            if len(original_text) > max_length:
-                chunks = split_text(original_text, max_length)
-                logger.info(
-                    "Section %s: conclusion を %d チャンクに分割 (元: %d文字)",
-                    section_num or section_title,
-                    len(chunks),
-                    len(original_text),
-                )
-                # 最後のチャンクをconclusionに残す
-                conclusion.text = chunks[-1]
-                stats["split_count"] += len(chunks) - 1
-                stats["original_count"] += 1
-
-                # 残りをdialogue末尾にnarrator発話として追加
-                dialogue = section.find("dialogue")
-                if dialogue is None:
-                    dialogue = ET.SubElement(section, "dialogue")
-
-                for chunk in chunks[:-1]:
-                    new_utt = ET.SubElement(dialogue, "utterance")
-                    new_utt.set("speaker", "narrator")
-                    new_utt.text = chunk
-
-    # インデント付きで出力
-    _indent_xml(root)
-    tree.write(output_path, encoding="utf-8", xml_declaration=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", errors="xmlcharrefreplace") as f:
+            f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            _write_split_xml(input_path, f, max_length, stats)
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
     return stats
 
 
+def _write_split_xml(input_path: Path, out: TextIO, max_length: int, stats: dict[str, int]) -> None:
+    """ルート直下の要素ごとに分割・インデントして書き出す.
+
+    出力は木全体に _indent_xml() を適用して書き出した場合と同一。ルート直下の
+    要素の末尾（tail）は次の要素の開始時に確定するため、1要素遅れで書き出す。
+    """
+    events = ET.iterparse(input_path, events=("start", "end"))
+    _, root = next(events)
+    root_is_section = root.tag == SECTION_TAG
+    depth = 1
+    pending: ET.Element | None = None
+
+    for event, elem in events:
+        if event == "start":
+            depth += 1
+            if depth == 2 and not root_is_section:
+                if pending is None:
+                    # 最初の子要素の開始時にルートのテキストが確定する
+                    _write_start_tag(out, root)
+                    out.write("\n  " if _is_blank(root.text) else root.text or "")
+                else:
+                    _write_child(out, pending, max_length, stats, last=False)
+                    del root[0]
+                pending = elem
+            continue
+
+        depth -= 1
+        if depth > 0:
+            continue
+
+        # ルート要素の終了
+        if pending is not None:
+            _write_child(out, pending, max_length, stats, last=True)
+            out.write(f"</{root.tag}>")
+            out.write("\n" if _is_blank(root.tail) else root.tail or "")
+        else:
+            # 子要素を持たないルート、またはルート自体がセクションの場合は木全体を処理する
+            for section in root.iter(SECTION_TAG):
+                _split_section(section, max_length, stats)
+            _indent_xml(root)
+            ET.ElementTree(root).write(out, encoding="unicode")
+
+
+def _is_blank(text: str | None) -> bool:
+    """空または空白のみのテキストか（_indent_xml() が上書きする対象）."""
+    return not text or not text.strip()
+
+
+def _write_start_tag(out: TextIO, elem: ET.Element) -> None:
+    """要素の開始タグ（属性付き）を書き出す."""
+    shell = ET.Element(elem.tag, elem.attrib)
+    out.write(ET.tostring(shell, encoding="unicode", short_empty_elements=False)[: -len(f"</{elem.tag}>")])
+
+
+def _write_child(out: TextIO, child: ET.Element, max_length: int, stats: dict[str, int], last: bool) -> None:
+    """ルート直下の要素1つを分割・インデントし、末尾の空白とともに書き出す."""
+    for section in child.iter(SECTION_TAG):
+        _split_section(section, max_length, stats)
+
+    tail = child.tail
+    _indent_xml(child, 1)
+    child.tail = None
+    ET.ElementTree(child).write(out, encoding="unicode")
+    if _is_blank(tail):
+        out.write("\n" if last else "\n  ")
+    else:
+        out.write(tail or "")
+
+
+def _new_utterance(speaker: str, text: str) -> ET.Element:
+    """分割したテキストの発話要素を作る."""
+    utterance = ET.Element("utterance")
+    utterance.set("speaker", speaker)
+    utterance.text = text
+    return utterance
+
+
+def _split_section(section: ET.Element, max_length: int, stats: dict[str, int]) -> None:
+    """セクション内の長文を分割し、dialogue の子要素を1回で組み直す.
+
+    - introduction の2チャンク目以降: dialogue 先頭（既存の発話の前）に narrator 発話として追加
+    - 長い utterance: 同じ speaker の発話として直後に追加
+    - conclusion の最後以外のチャンク: dialogue 末尾に narrator 発話として追加
+    """
+    stats["sections"] += 1
+    section_num = section.get("number", "")
+    section_title = section.get("title", "")[:30]
+
+    # introduction を処理
+    intro_utterances: list[ET.Element] = []
+    intro = section.find("introduction")
+    if intro is not None and intro.text:
+        original_text = intro.text.strip()
+        if len(original_text) > max_length:
+            chunks = split_text(original_text, max_length)
+            logger.info(
+                "Section %s: introduction を %d チャンクに分割 (元: %d文字)",
+                section_num or section_title,
+                len(chunks),
+                len(original_text),
+            )
+            # 最初のチャンクをintroductionに残す
+            intro.text = chunks[0]
+            stats["split_count"] += len(chunks) - 1
+            stats["original_count"] += 1
+            intro_utterances = [_new_utterance("narrator", chunk) for chunk in chunks[1:]]
+
+    # dialogue/utterance を処理（introduction の残りは既存の発話の前に置く）
+    dialogue = section.find("dialogue")
+    children = list(dialogue) if dialogue is not None else []
+    if intro_utterances:
+        children = (
+            [child for child in children if child.tag != "utterance"]
+            + intro_utterances
+            + [child for child in children if child.tag == "utterance"]
+        )
+
+    new_children: list[ET.Element] = []
+    for child in children:
+        new_children.append(child)
+        if child.tag != "utterance" or not child.text or len(child.text.strip()) <= max_length:
+            continue
+        original_text = child.text.strip()
+        speaker = child.get("speaker", "A")
+        chunks = split_text(original_text, max_length)
+        logger.info(
+            "Section %s: utterance(%s) を %d チャンクに分割 (元: %d文字)",
+            section_num or section_title,
+            speaker,
+            len(chunks),
+            len(original_text),
+        )
+        # 最初のチャンクを元のutteranceに設定し、残りを同じspeakerの発話として続ける
+        child.text = chunks[0]
+        stats["split_count"] += len(chunks) - 1
+        stats["original_count"] += 1
+        new_children.extend(_new_utterance(speaker, chunk) for chunk in chunks[1:])
+
+    # conclusion を処理
+    conclusion = section.find("conclusion")
+    if conclusion is not None and conclusion.text:
+        original_text = conclusion.text.strip()
+        if len(original_text) > max_length:
+            chunks = split_text(original_text, max_length)
+            logger.info(
+                "Section %s: conclusion を %d チャンクに分割 (元: %d文字)",
+                section_num or section_title,
+                len(chunks),
+                len(original_text),
+            )
+            # 最後のチャンクをconclusionに残し、残りをdialogue末尾にnarrator発話として追加
+            conclusion.text = chunks[-1]
+            stats["split_count"] += len(chunks) - 1
+            stats["original_count"] += 1
+            new_children.extend(_new_utterance("narrator", chunk) for chunk in chunks[:-1])
+
+    if dialogue is None:
+        if not new_children:
+            return
+        dialogue = ET.SubElement(section, "dialogue")
+    dialogue[:] = new_children
+
+
 def _indent_xml(elem: ET.Element, level: int = 0) -> None:
     """XMLにインデントを追加する."""
     indent = "\n" + "  " * level
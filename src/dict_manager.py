@@ -4,6 +4,9 @@ import hashlib
 import json
 import logging
 from pathlib import Path
+from typing import Iterable
+
+from src.file_cache import FileSignature, get_file_signature, get_sidecar_path, is_racy, read_sidecar, write_sidecar
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +16,9 @@ DATA_BASE_DIR = Path(__file__).parent.parent / "data"
 # Legacy path for backward compatibility
 DICT_BASE_DIR = DATA_BASE_DIR / "readings"
 
+# In-process memo: resolved XML path -> (stat signature, content hash)
+_XML_HASH_MEMO: dict[str, tuple[FileSignature, str]] = {}
+
 
 def get_content_hash(content: str, length: int = 12) -> str:
     """Generate a short hash from content.
@@ -28,12 +34,66 @@ def get_content_hash(content: str, length: int = 12) -> str:
     return full_hash[:length]
 
 
+def get_streaming_content_hash(texts: Iterable[str], length: int = 12, separator: str = " ") -> str:
+    """Generate a short hash from a stream of texts without joining them.
+
+    Produces the same hash as get_content_hash(separator.join(texts)),
+    feeding the texts to the hasher one at a time so no combined copy
+    of the content is ever built. Accepts any iterable, including a
+    generator over parser output.
+
+    Args:
+        texts: Text fragments in order
+        length: Length of the returned hash (default: 12 chars)
+        separator: Separator placed between fragments (default: single space)
+
+    Returns:
+        Short hex hash string
+    """
+    hasher = StreamingContentHasher(separator)
+    for text in texts:
+        hasher.update(text)
+    return hasher.hexdigest(length)
+
+
+class StreamingContentHasher:
+    """Incremental form of get_streaming_content_hash() for push-style producers.
+
+    Example:
+        >>> hasher = StreamingContentHasher()
+        >>> for text in ("a", "b"):
+        ...     hasher.update(text)
+        >>> hasher.hexdigest() == get_content_hash("a b")
+        True
+    """
+
+    def __init__(self, separator: str = " ") -> None:
+        self._hasher = hashlib.sha256()
+        self._sep = separator.encode("utf-8")
+        self._first = True
+
+    def update(self, text: str) -> None:
+        """Feed the next text fragment."""
+        if not self._first:
+            self._hasher.update(self._sep)
+        self._hasher.update(text.encode("utf-8"))
+        self._first = False
+
+    def hexdigest(self, length: int = 12) -> str:
+        """Get the short hex hash of the fragments fed so far."""
+        return self._hasher.hexdigest()[:length]
+
+
 def get_xml_content_hash(xml_path: Path) -> str:
     """Get content hash for XML file using parsed text.
 
     This ensures gen-dict and xml-tts use the same hash by parsing
     the XML and combining the text content before hashing.
 
+    The result is memoized in process and persisted to a sidecar file
+    next to the XML, both keyed on (path, size, mtime_ns, inode), so
+    repeated lookups cost a single stat() instead of a full parse.
+
     Args:
         xml_path: Path to the XML file
 
@@ -41,14 +101,99 @@ def get_xml_content_hash(xml_path: Path) -> str:
         Short hex hash string (12 chars)
 
     Raises:
+        FileNotFoundError: If the XML file does not exist
         xml.etree.ElementTree.ParseError: If the XML is malformed
     """
-    from src.xml_parser import parse_book2_xml
+    content_hash = get_cached_xml_content_hash(xml_path)
+    if content_hash is not None:
+        return content_hash
+
+    signature = get_file_signature(Path(xml_path).resolve())
+    content_hash = _compute_xml_content_hash(Path(xml_path))
+    record_xml_content_hash(xml_path, content_hash, signature)
+    return content_hash
+
+
+def get_cached_xml_content_hash(xml_path: Path) -> str | None:
+    """Get the memoized content hash of an XML file without parsing it.
+
+    Args:
+        xml_path: Path to the XML file
+
+    Returns:
+        Hash from the in-process memo or the sidecar, or None if neither
+        matches the file's current stat signature
+
+    Raises:
+        FileNotFoundError: If the XML file does not exist
+    """
+    xml_path = Path(xml_path)
+    resolved = str(xml_path.resolve())
+    signature = get_file_signature(resolved)
+
+    memo = _XML_HASH_MEMO.get(resolved)
+    if memo is not None and memo[0] == signature:
+        return memo[1]
+
+    sidecar = read_sidecar(get_hash_sidecar_path(xml_path), resolved, signature)
+    content_hash = sidecar.get("hash") if sidecar else None
+    if not isinstance(content_hash, str):
+        return None
+
+    _XML_HASH_MEMO[resolved] = (signature, content_hash)
+    return content_hash
+
+
+def record_xml_content_hash(xml_path: Path, content_hash: str, signature: FileSignature | None = None) -> None:
+    """Memoize an already computed content hash of an XML file.
+
+    Lets callers that parse the whole book anyway (e.g. the parsed-book
+    cache) save the next get_xml_content_hash() call a second parse.
+
+    Args:
+        xml_path: Path to the XML file
+        content_hash: Hash computed from the file's parsed text
+        signature: Stat signature taken before parsing (default: current).
+            Nothing is recorded if the file changed since.
+    """
+    xml_path = Path(xml_path)
+    resolved = str(xml_path.resolve())
+    try:
+        current = get_file_signature(resolved)
+    except OSError:
+        return
+    if signature is not None and signature != current:
+        return
+    if is_racy(current):
+        # Too fresh to trust the stat signature; recompute next time
+        return
+
+    write_sidecar(get_hash_sidecar_path(xml_path), resolved, current, {"hash": content_hash})
+    _XML_HASH_MEMO[resolved] = (current, content_hash)
+
+
+def _compute_xml_content_hash(xml_path: Path) -> str:
+    """Compute the content hash of an XML file by streaming its parsed items.
+
+    Goes through the parsed-book cache, so the parse also stores the items
+    for the stage that asked for the hash.
+    """
+    from src.book_cache import iter_book_items
 
     # Let ParseError propagate - caller should handle it
-    items = parse_book2_xml(xml_path)
-    combined_text = " ".join(item.text for item in items)
-    return get_content_hash(combined_text)
+    return get_streaming_content_hash(item.text for item in iter_book_items(xml_path))
+
+
+def get_hash_sidecar_path(xml_path: Path) -> Path:
+    """Get the sidecar path caching the content hash of an XML file.
+
+    Args:
+        xml_path: Path to the XML file
+
+    Returns:
+        Path to the hidden sidecar file next to the XML (e.g. .book.xml.hash.json)
+    """
+    return get_sidecar_path(xml_path, "hash")
 
 
 def get_dict_path(input_path: Path) -> Path:
@@ -62,14 +207,26 @@ def get_dict_path(input_path: Path) -> Path:
     Returns:
         Path to the corresponding dictionary JSON file
     """
-    # Use XML-specific hash for .xml files
+    content_hash = get_input_content_hash(input_path)
     if input_path.suffix == ".xml":
-        content_hash = get_xml_content_hash(input_path)
         return DATA_BASE_DIR / content_hash / "readings.json"
-    else:
-        content = input_path.read_text(encoding="utf-8")
-        content_hash = get_content_hash(content)
-        return DICT_BASE_DIR / f"{content_hash}.json"
+    return DICT_BASE_DIR / f"{content_hash}.json"
+
+
+def get_input_content_hash(input_path: Path) -> str:
+    """Get the content hash identifying a book input file.
+
+    Args:
+        input_path: Path to the input markdown or XML file
+
+    Returns:
+        get_xml_content_hash() for .xml files, otherwise the hash of the
+        file's text
+    """
+    # Use XML-specific hash for .xml files
+    if input_path.suffix == ".xml":
+        return get_xml_content_hash(input_path)
+    return get_content_hash(input_path.read_text(encoding="utf-8"))
 
 
 def get_output_dir(content: str) -> Path:
@@ -94,7 +251,18 @@ def get_dict_path_from_content(content: str) -> Path:
     Returns:
         Path to the corresponding dictionary JSON file
     """
-    content_hash = get_content_hash(content)
+    return get_dict_path_from_hash(get_content_hash(content))
+
+
+def get_dict_path_from_hash(content_hash: str) -> Path:
+    """Get the dictionary path from a precomputed content hash.
+
+    Args:
+        content_hash: Short content hash (see get_content_hash)
+
+    Returns:
+        Path to the corresponding dictionary JSON file
+    """
     # New path: data/{hash}/readings.json
     new_path = DATA_BASE_DIR / content_hash / "readings.json"
     # Legacy path: data/readings/{hash}.json
@@ -143,7 +311,19 @@ def load_dict_from_content(content: str) -> dict[str, str]:
     Returns:
         Dictionary mapping terms to readings, or empty dict if not found
     """
-    dict_path = get_dict_path_from_content(content)
+    return load_dict_from_hash(get_content_hash(content))
+
+
+def load_dict_from_hash(content_hash: str) -> dict[str, str]:
+    """Load the reading dictionary from a precomputed content hash.
+
+    Args:
+        content_hash: Short content hash (see get_content_hash)
+
+    Returns:
+        Dictionary mapping terms to readings, or empty dict if not found
+    """
+    dict_path = get_dict_path_from_hash(content_hash)
     if dict_path.exists():
         with open(dict_path, encoding="utf-8") as f:
             data = json.load(f)
@@ -163,12 +343,7 @@ def save_dict(readings: dict[str, str], input_path: Path) -> Path:
     Returns:
         Path where the dictionary was saved
     """
-    # Use XML-specific hash for .xml files
-    if input_path.suffix == ".xml":
-        content_hash = get_xml_content_hash(input_path)
-    else:
-        content = input_path.read_text(encoding="utf-8")
-        content_hash = get_content_hash(content)
+    content_hash = get_input_content_hash(input_path)
 
     # Save to new path: data/{hash}/readings.json
     dict_path = DATA_BASE_DIR / content_hash / "readings.json"
@@ -0,0 +1,110 @@
+"""Stat-keyed sidecar files for data derived from a source file.
+
+A sidecar is a hidden JSON file stored next to its source file
+(e.g. ``.book.xml.hash.json``). It records the source's resolved path and
+stat signature (size, mtime_ns, inode), so a cached value can be validated
+with a single stat() instead of re-reading the source.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# (st_size, st_mtime_ns, st_ino)
+FileSignature = tuple[int, int, int]
+
+# Files modified this recently are not cached: their mtime may not change
+# on a same-size rewrite within the filesystem timestamp granularity
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def get_file_signature(path: Path | str) -> FileSignature:
+    """Get the stat signature used to validate cached data.
+
+    Args:
+        path: Source file path
+
+    Returns:
+        (size, mtime_ns, inode) tuple
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def is_racy(signature: FileSignature) -> bool:
+    """Check whether a file is too recently modified to trust its signature.
+
+    Args:
+        signature: Stat signature from get_file_signature()
+
+    Returns:
+        True if the file was modified within RACY_WINDOW_NS
+    """
+    return time.time_ns() - signature[1] < RACY_WINDOW_NS
+
+
+def get_sidecar_path(source_path: Path, kind: str, suffix: str = ".json") -> Path:
+    """Get the sidecar path for a source file.
+
+    Args:
+        source_path: Source file path
+        kind: Kind of cached data (e.g. "hash", "index")
+        suffix: File suffix (default: ".json")
+
+    Returns:
+        Hidden sidecar path next to the source (e.g. .book.xml.hash.json)
+    """
+    return source_path.with_name(f".{source_path.name}.{kind}{suffix}")
+
+
+def read_sidecar(sidecar_path: Path, resolved: str, signature: FileSignature) -> dict[str, Any] | None:
+    """Read a JSON sidecar, returning None if missing, corrupt or stale.
+
+    Args:
+        sidecar_path: Sidecar file path
+        resolved: Resolved path of the source file
+        signature: Current stat signature of the source file
+
+    Returns:
+        Sidecar contents, or None if it does not match the source
+    """
+    try:
+        with open(sidecar_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    if data.get("path") != resolved or tuple(data.get("signature", ())) != signature:
+        return None
+    return data
+
+
+def write_sidecar(sidecar_path: Path, resolved: str, signature: FileSignature, payload: dict[str, Any]) -> None:
+    """Write a JSON sidecar atomically (best effort).
+
+    Failures are logged and ignored: the cache is an optimization only.
+
+    Args:
+        sidecar_path: Sidecar file path
+        resolved: Resolved path of the source file
+        signature: Stat signature of the source file
+        payload: Cached data (merged into the sidecar's top-level object)
+    """
+    data = {"path": resolved, "signature": list(signature), **payload}
+    try:
+        tmp_path = sidecar_path.with_name(sidecar_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, sidecar_path)
+    except OSError as e:
+        logger.debug("Could not write sidecar %s: %s", sidecar_path, e)
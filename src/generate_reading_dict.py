@@ -17,11 +17,12 @@ from pathlib import Path
 
 import requests
 
-from src.dict_manager import get_dict_path, load_dict, save_dict
+from src.book_cache import load_book_items
+from src.dict_manager import get_dict_path, get_input_content_hash, load_dict, save_dict
 from src.llm_reading_generator import extract_technical_terms
 from src.logging_config import setup_logging
-from src.text_cleaner import split_into_pages
-from src.xml_parser import parse_book2_xml
+from src.reading_store import add_shared_readings, lookup_shared_readings
+from src.text_cleaner import iter_raw_pages, strip_markdown
 
 logger = logging.getLogger(__name__)
 
@@ -306,6 +307,12 @@ def main() -> None:
     parser.add_argument(
         "--dry-run", action="store_true", default=False, dest="dry_run", help="Show target info without LLM calls"
     )
+    parser.add_argument(
+        "--no-shared-store",
+        action="store_false",
+        dest="shared_store",
+        help="Do not reuse or record readings in the cross-book store (data/readings.sqlite3)",
+    )
     args = parser.parse_args()
 
     input_path = Path(args.input)
@@ -338,9 +345,9 @@ def main() -> None:
     all_terms = set()
 
     if input_path.suffix == ".xml":
-        # XML flow: parse → group by chapter → extract terms
+        # XML flow: parse (cached per book version) → group by chapter → extract terms
         try:
-            items = parse_book2_xml(input_path)
+            items = load_book_items(input_path)
         except ET.ParseError as e:
             logger.error("Failed to parse XML file: %s", e)
             sys.exit(1)
@@ -362,15 +369,15 @@ def main() -> None:
         logger.info("Extracted terms from %d chapter groups", len(set(item.chapter_number for item in items)))
 
     elif input_path.suffix == ".md":
-        # MD flow: existing logic (unchanged)
+        # MD flow: scan pages lazily and extract terms from markup-stripped text
+        # (like the XML flow, terms come from the source text, not TTS-normalized output)
         markdown = input_path.read_text(encoding="utf-8")
-        pages = split_into_pages(markdown)
-        logger.info("Found %d pages", len(pages))
-
-        # Extract all technical terms
-        for page in pages:
-            terms = extract_technical_terms(page.text)
+        page_count = 0
+        for page in iter_raw_pages(markdown):
+            page_count += 1
+            terms = extract_technical_terms(strip_markdown(page.text))
             all_terms.update(terms)
+        logger.info("Found %d pages", page_count)
 
     else:
         # Unsupported file extension
@@ -381,20 +388,33 @@ def main() -> None:
 
     # Filter out terms already in dictionary
     new_terms = [t for t in sorted(all_terms) if t not in existing]
+
+    # Reuse readings generated for other books (the book's own dictionary still wins)
+    shared: dict[str, str] = {}
+    if args.shared_store and new_terms:
+        shared = lookup_shared_readings(new_terms)
+        new_terms = [t for t in new_terms if t not in shared]
+        logger.info("Found %d terms in shared reading store", len(shared))
     logger.info("New terms to process: %d", len(new_terms))
 
     # dry-run: show summary and exit
     if args.dry_run:
         logger.info("DRY-RUN: Input: %s", input_path)
         logger.info("DRY-RUN: Output: %s", output_path)
-        logger.info("DRY-RUN: Total terms: %d, Existing: %d, New: %d", len(all_terms), len(existing), len(new_terms))
+        logger.info(
+            "DRY-RUN: Total terms: %d, Existing: %d, Shared: %d, New: %d",
+            len(all_terms),
+            len(existing),
+            len(shared),
+            len(new_terms),
+        )
         return
 
     if not new_terms:
         logger.info("No new terms to process")
-        if existing:
-            # Save existing to new path if needed
-            save_dict(existing, input_path)
+        if existing or shared:
+            # Save existing (plus shared hits) to new path if needed
+            save_dict({**existing, **shared}, input_path)
         return
 
     # Generate readings
@@ -403,10 +423,13 @@ def main() -> None:
     logger.info("Generated %d readings", len(new_readings))
 
     # Merge and save
-    final_dict = {**existing, **new_readings}
+    final_dict = {**existing, **shared, **new_readings}
     save_dict(final_dict, input_path)
     logger.info("Total dictionary entries: %d", len(final_dict))
 
+    if args.shared_store:
+        add_shared_readings(new_readings, model=args.model, source_hash=get_input_content_hash(input_path))
+
     # Unload ollama model to free GPU memory for subsequent voicevox processing
     if not args.keep_model:
         from src.gpu_memory_manager import unload_ollama_model  # noqa: PLC0415
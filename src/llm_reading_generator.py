@@ -6,6 +6,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+from src.reading_matcher import get_reading_matcher
+
 logger = logging.getLogger(__name__)
 
 # Default dictionary file path
@@ -174,14 +176,9 @@ def save_dictionary(readings: dict[str, str], path: Path = DEFAULT_DICT_PATH) ->
 
 
 def apply_llm_readings(text: str, readings: dict[str, str]) -> str:
-    """Apply LLM-generated readings to text."""
-    # Sort by length (longest first) to avoid partial replacements
-    sorted_terms = sorted(readings.keys(), key=len, reverse=True)
-
-    for term in sorted_terms:
-        reading = readings[term]
-        # Use word boundary-like pattern for ASCII terms
-        pattern = rf"(?<![A-Za-z]){re.escape(term)}(?![A-Za-z])"
-        text = re.sub(pattern, reading, text)
+    """Apply LLM-generated readings to text.
 
-    return text
+    Terms are replaced longest first, as whole ASCII words. The prepared
+    matcher is cached per dictionary (see src.reading_matcher).
+    """
+    return get_reading_matcher(readings).apply(text)
@@ -1,75 +1,89 @@
-"""MeCab-based kanji to kana conversion using fugashi."""
+"""MeCab-based kanji to kana conversion (shared analysis from morph_analyzer)."""
 
-import logging
+import functools
+import re
+from typing import Iterable
 
-import fugashi
+from src.morph_analyzer import analyze, feature_field
 
-logger = logging.getLogger(__name__)
+# CJK Unified Ideographs and Extension A
+_KANJI_PATTERN = re.compile("[\u3400-\u4dbf\u4e00-\u9fff]")
 
-# Lazy initialization of tagger
-_tagger: fugashi.Tagger | None = None
+# Distinct lines whose readings are kept in process
+_LINE_CACHE_SIZE = 4096
 
 
-def _get_tagger() -> fugashi.Tagger:
-    """Get or create the MeCab tagger (lazy initialization)."""
-    global _tagger
-    if _tagger is None:
-        _tagger = fugashi.Tagger()
-        logger.info("MeCab tagger initialized")
-    return _tagger
+def _contains_kanji(text: str) -> bool:
+    """Check if text contains any kanji."""
+    return _KANJI_PATTERN.search(text) is not None
 
 
-def _is_kanji(char: str) -> bool:
-    """Check if a character is kanji."""
-    return "\u4e00" <= char <= "\u9fff" or "\u3400" <= char <= "\u4dbf"
+def _convert_words(text: str) -> str:
+    """Replace kanji-containing words with their katakana reading."""
+    lattice = analyze(text)
+    result = []
+    for surface, feature_raw in zip(lattice.surfaces, lattice.features_raw):
+        # Check the surface first: most tokens need no feature lookup
+        kana = feature_field(feature_raw, "kana") if _contains_kanji(surface) else None
+        # Keep original (hiragana, katakana, ASCII, punctuation, etc.) without a reading
+        result.append(kana or surface)
+    return "".join(result)
 
 
-def _contains_kanji(text: str) -> bool:
-    """Check if text contains any kanji."""
-    return any(_is_kanji(c) for c in text)
+@functools.lru_cache(maxsize=_LINE_CACHE_SIZE)
+def _convert_line(line: str) -> str:
+    """Convert one line containing kanji (cached: headings and boilerplate repeat)."""
+    return _convert_words(line)
 
 
-def convert_to_kana(text: str) -> str:
-    """Convert text with kanji to katakana readings.
+def convert_lines_to_kana(lines: Iterable[str]) -> list[str]:
+    """Convert many lines with kanji to katakana readings in one call.
 
-    Only kanji portions are converted; hiragana, katakana, and ASCII remain unchanged.
-    Newlines are preserved by processing line by line.
+    Lines without kanji are returned unchanged without tagging. Each
+    distinct line is tagged at most once per call and the readings are
+    cached across calls.
 
     Args:
-        text: Input text possibly containing kanji
+        lines: Lines of text (without newlines)
 
     Returns:
-        Text with kanji replaced by katakana readings
+        Converted lines, in the same order
     """
-    if not text:
-        return text
+    return [_convert_line(line) if line and _contains_kanji(line) else line for line in lines]
 
-    # Process line by line to preserve newlines
-    lines = text.split("\n")
-    converted_lines = []
 
-    for line in lines:
-        if not line or not _contains_kanji(line):
-            converted_lines.append(line)
-            continue
+def convert_texts_to_kana(texts: Iterable[str]) -> list[str]:
+    """Convert a list of documents or paragraphs to katakana readings.
 
-        tagger = _get_tagger()
-        result = []
+    Same result as calling convert_to_kana() on each text, with all lines
+    converted in a single batch.
 
-        for word in tagger(line):
-            surface = word.surface
-            kana = getattr(word.feature, "kana", None)
+    Args:
+        texts: Texts possibly containing kanji and newlines
 
-            if kana and _contains_kanji(surface):
-                # Replace kanji with katakana reading
-                result.append(kana)
-            else:
-                # Keep original (hiragana, katakana, ASCII, punctuation, etc.)
-                result.append(surface)
+    Returns:
+        Converted texts, in the same order
+    """
+    split_texts = [text.split("\n") for text in texts]
+    converted = iter(convert_lines_to_kana(line for lines in split_texts for line in lines))
+    return ["\n".join([next(converted) for _ in lines]) for lines in split_texts]
 
-        converted_lines.append("".join(result))
 
-    return "\n".join(converted_lines)
+def convert_to_kana(text: str) -> str:
+    """Convert text with kanji to katakana readings.
+
+    Only kanji portions are converted; hiragana, katakana, and ASCII remain unchanged.
+    Newlines are preserved by tagging each line separately.
+
+    Args:
+        text: Input text possibly containing kanji
+
+    Returns:
+        Text with kanji replaced by katakana readings
+    """
+    if not text or not _contains_kanji(text):
+        return text
+    return "\n".join(convert_lines_to_kana(text.split("\n")))
 
 
 def convert_kanji_only(text: str) -> str:
@@ -84,17 +98,4 @@ def convert_kanji_only(text: str) -> str:
     if not text or not _contains_kanji(text):
         return text
 
-    tagger = _get_tagger()
-    result = []
-
-    for word in tagger(text):
-        surface = word.surface
-        kana = getattr(word.feature, "kana", None)
-
-        # Only convert if the surface contains kanji
-        if kana and _contains_kanji(surface):
-            result.append(kana)
-        else:
-            result.append(surface)
-
-    return "".join(result)
+    return _convert_words(text)
@@ -0,0 +1,115 @@
+"""Shared MeCab morphological analysis.
+
+punctuation_normalizer and mecab_reader share one fugashi.Tagger per
+process and read token lattices through analyze(), which caches them by
+text. A stage that sees a line another stage already analyzed (and left
+unchanged) reuses its tokens instead of tagging it again.
+
+fugashi nodes point into the tagger's lattice and are only valid until
+the next call, so analyze() copies each node's surface and raw feature
+string. Features are parsed only when a stage asks for them, which keeps
+tagging cheap for stages that only need a few fields of a few tokens.
+"""
+
+import csv
+import functools
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import fugashi
+
+logger = logging.getLogger(__name__)
+
+# Distinct texts whose lattices are kept in process
+_ANALYSIS_CACHE_SIZE = 4096
+
+# Lazy initialization of the shared tagger and its feature tuple type
+_tagger: fugashi.Tagger | None = None
+_feature_type: Any = None
+
+
+def get_tagger() -> fugashi.Tagger:
+    """Get or create the process-wide MeCab tagger (lazy initialization)."""
+    global _tagger, _feature_type
+    if _tagger is None:
+        _tagger = fugashi.Tagger()
+        # Feature tuple type of the installed dictionary (UniDic 17/26/29 fields)
+        _feature_type = type(_tagger("一")[0].feature)
+        logger.info("MeCab tagger initialized")
+    return _tagger
+
+
+@dataclass(frozen=True)
+class Lattice:
+    """Tokens of an analyzed text, stored column-wise.
+
+    Attributes:
+        surfaces: Surface form of each token
+        features_raw: Comma-separated dictionary features of each token
+    """
+
+    surfaces: tuple[str, ...]
+    features_raw: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def feature(self, index: int) -> Any:
+        """Dictionary features of a token (same named tuple as fugashi's node.feature)."""
+        return parse_feature(self.features_raw[index])
+
+
+def parse_feature(feature_raw: str) -> Any:
+    """Parse a raw feature string into the dictionary's feature tuple.
+
+    Unknown words carry fewer fields; the missing ones are None, as in
+    fugashi.
+
+    Args:
+        feature_raw: Comma-separated features (quoted if a field has a comma)
+
+    Returns:
+        Feature named tuple (pos1, pos2, ..., kana, ...)
+    """
+    get_tagger()
+    if '"' in feature_raw:
+        fields = next(csv.reader([feature_raw]))
+    else:
+        fields = feature_raw.split(",")
+    return _feature_type(*fields, *[None] * (len(_feature_type._fields) - len(fields)))
+
+
+def feature_field(feature_raw: str, name: str) -> str | None:
+    """Get one field of a raw feature string without building the whole tuple.
+
+    Args:
+        feature_raw: Comma-separated features
+        name: Field name (e.g. "kana", "pos1")
+
+    Returns:
+        Field value, or None if the dictionary has no such field or the
+        token does not carry it (unknown words)
+    """
+    get_tagger()
+    if name not in _feature_type._fields:
+        return None
+    if '"' in feature_raw:
+        return getattr(parse_feature(feature_raw), name)
+    fields = feature_raw.split(",")
+    index = _feature_type._fields.index(name)
+    return fields[index] if index < len(fields) else None
+
+
+@functools.lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def analyze(text: str) -> Lattice:
+    """Tag text, reusing the lattice if the same text was analyzed before.
+
+    Args:
+        text: Text to analyze (typically one line)
+
+    Returns:
+        Lattice of the text's tokens
+    """
+    nodes = get_tagger()(text)
+    return Lattice(tuple([node.surface for node in nodes]), tuple([node.feature_raw for node in nodes]))
@@ -4,6 +4,7 @@
 例: "123" → "ひゃくにじゅうさん"
 """
 
+import functools
 import re
 from typing import Callable
 
@@ -203,8 +204,8 @@ def _digit_at_place(n: int, place: int) -> int:
     return (n // place) % 10
 
 
-def _read_small_number(n: int) -> str:
-    """1-9999の数字を読む."""
+def _build_small_number(n: int) -> str:
+    """1-9999の数字の読みを1桁ずつ組み立てる（読みテーブルの構築用）."""
     if n == 0:
         return ""
 
@@ -226,9 +227,26 @@ def _read_small_number(n: int) -> str:
     return "".join(parts)
 
 
+# 0-9999の読み（インデックス = 数値、0は空文字）
+SMALL_NUMBER_READINGS: tuple[str, ...] = tuple(_build_small_number(n) for n in range(10000))
+
+# 万・億・兆の組み立て順（大きい単位から）
+_LARGE_UNIT_STEPS = sorted(LARGE_UNITS.items(), reverse=True)
+
+# 助数詞付き読みのキャッシュ上限
+_COUNTER_CACHE_SIZE = 4096
+
+
+def _read_small_number(n: int) -> str:
+    """1-9999の数字を読む（下4桁を読みテーブルから引く）."""
+    return SMALL_NUMBER_READINGS[n % 10000]
+
+
 def number_to_japanese(n: int) -> str:
     """整数を日本語読みに変換.
 
+    4桁ごとの読みを読みテーブルから引き、万・億・兆を付けて連結する。
+
     Args:
         n: 変換する整数
 
@@ -249,29 +267,18 @@ def number_to_japanese(n: int) -> str:
     if n < 0:
         return "マイナス" + number_to_japanese(-n)
 
-    parts = []
-
-    # 兆の位
-    cho = n // 1000000000000
-    if cho > 0:
-        parts.append(_read_small_number(cho) + "ちょう")
-        n %= 1000000000000
-
-    # 億の位
-    oku = n // 100000000
-    if oku > 0:
-        parts.append(_read_small_number(oku) + "おく")
-        n %= 100000000
+    if n < 10000:
+        return SMALL_NUMBER_READINGS[n]
 
-    # 万の位
-    man = n // 10000
-    if man > 0:
-        parts.append(_read_small_number(man) + "まん")
-        n %= 10000
+    parts = []
+    for unit, unit_reading in _LARGE_UNIT_STEPS:
+        count, n = divmod(n, unit)
+        if count > 0:
+            parts.append(_read_small_number(count) + unit_reading)
 
     # 千以下
     if n > 0:
-        parts.append(_read_small_number(n))
+        parts.append(SMALL_NUMBER_READINGS[n])
 
     return "".join(parts)
 
@@ -290,20 +297,17 @@ def decimal_to_japanese(s: str) -> str:
 
     integer_part, decimal_part = s.split(".", 1)
 
-    # 整数部
-    result = number_to_japanese(int(integer_part)) if integer_part else "ゼロ"
-    result += "てん"
-
-    # 小数部（1桁ずつ読む）
-    for digit in decimal_part:
-        result += DIGITS.get(digit, digit)
-
-    return result
+    # 整数部 + 「てん」 + 小数部（1桁ずつ読む）
+    integer_reading = number_to_japanese(int(integer_part)) if integer_part else "ゼロ"
+    return "".join([integer_reading, "てん", *(DIGITS.get(digit, digit) for digit in decimal_part)])
 
 
+@functools.lru_cache(maxsize=_COUNTER_CACHE_SIZE)
 def read_with_counter(n: int, counter: str) -> str:
     """助数詞付きの数字を読む.
 
+    ページ番号や図番号など同じ組み合わせが繰り返し現れるため、結果をキャッシュする。
+
     Args:
         n: 数字
         counter: 助数詞
@@ -329,12 +333,8 @@ def read_with_counter(n: int, counter: str) -> str:
     return base_reading + counter_reading
 
 
-def _normalize_date(match: re.Match) -> str:
-    """日付パターンを読みに変換."""
-    year = match.group("year")
-    month = match.group("month")
-    day = match.group("day")
-
+def _read_date(year: str | None, month: str | None, day: str | None) -> str:
+    """年・月・日（いずれも省略可）を読みに変換."""
     result = ""
 
     if year:
@@ -363,16 +363,15 @@ def _normalize_date(match: re.Match) -> str:
     return result
 
 
-def _normalize_time(match: re.Match) -> str:
-    """時刻パターンを読みに変換."""
-    hour = int(match.group("hour"))
-    minute = match.group("minute")
+def _read_time(hour: str, minute: str | None) -> str:
+    """時・分（分は省略可）を読みに変換."""
+    h = int(hour)
 
     # 時
-    if hour in COUNTERS["時"]:
-        result = COUNTERS["時"][hour]
+    if h in COUNTERS["時"]:
+        result = COUNTERS["時"][h]
     else:
-        result = number_to_japanese(hour) + "じ"
+        result = number_to_japanese(h) + "じ"
 
     # 分
     if minute:
@@ -387,117 +386,73 @@ def _normalize_time(match: re.Match) -> str:
     return result
 
 
-def _normalize_counter(match: re.Match) -> str:
-    """助数詞付き数字を読みに変換."""
-    number = int(match.group("number"))
-    counter = match.group("counter")
-
-    return read_with_counter(number, counter)
-
-
-def _normalize_percent(match: re.Match) -> str:
-    """パーセントを読みに変換."""
-    number = match.group("number")
-
-    if "." in number:
-        return decimal_to_japanese(number) + "パーセント"
-    return number_to_japanese(int(number)) + "パーセント"
-
-
-def _normalize_plain_number(match: re.Match) -> str:
-    """単独の数字を読みに変換."""
-    number = match.group(0)
-
-    # 小数
+def _read_number(number: str) -> str:
+    """整数または小数の文字列を読みに変換."""
     if "." in number:
         return decimal_to_japanese(number)
-
-    # 整数
     return number_to_japanese(int(number))
 
 
-# 変換パターン（順序重要）
-PATTERNS: list[tuple[re.Pattern, Callable[[re.Match], str]]] = [
+# 先読み用の書式（名前付きグループなし）
+_DATE_FORM = r"\d{4}[年/\-]\d{1,2}[月/\-]\d{1,2}"
+_YEAR_MONTH_FORM = r"\d{4}年\d{1,2}月(?![\d日])"
+_MONTH_DAY_FORM = r"\d{1,2}月\d{1,2}日"
+_YEAR_FORM = r"\d{4}年"
+_TIME_FORM = r"\d{1,2}[:時]\d{2}"
+
+# 数字トークン（1回の走査で文脈を判定する）
+# 代替は優先順（日付 → 年月 → 月日 → 年 → 時刻 → 時 → パーセント → 助数詞 → 単独の数字）。
+# どのグループが一致したかは外側の名前付きグループ（match.lastgroup）で判定する。
+# 「直後に数字がない」という条件は、直後の数字が優先度の高い書式（日付・時刻など）で
+# 先に読みに変わる場合は満たされるものとして扱う（例: 4時6:13 → よじ + ろくじじゅうさんふん）。
+NUMBER_TOKEN_PATTERN = re.compile(
+    # 先頭の (?=\d) で数字以外の位置を高速に読み飛ばす
+    r"(?=\d)(?:"
     # 日付: 2024年1月1日, 2024/1/1, 2024-1-1
-    (
-        re.compile(r"(?P<year>\d{4})[年/\-](?P<month>\d{1,2})[月/\-](?P<day>\d{1,2})日?"),
-        _normalize_date,
-    ),
+    r"(?P<date>(?P<d_year>\d{4})[年/\-](?P<d_month>\d{1,2})[月/\-](?P<d_day>\d{1,2})日?)"
     # 年月: 2024年1月
-    (
-        re.compile(r"(?P<year>\d{4})年(?P<month>\d{1,2})月(?![\d日])"),
-        lambda m: _normalize_date(
-            type(
-                "Match",
-                (),
-                {"group": lambda self, x: m.group(x) if x in ("year", "month") else None},
-            )()
-        ),
-    ),
+    rf"|(?P<year_month>(?P<ym_year>\d{{4}})年(?P<ym_month>\d{{1,2}})月(?!(?!{_DATE_FORM})\d|日))"
     # 月日: 1月1日
-    (
-        re.compile(r"(?P<month>\d{1,2})月(?P<day>\d{1,2})日"),
-        lambda m: _normalize_date(
-            type(
-                "Match",
-                (),
-                {"group": lambda self, x: None if x == "year" else m.group(x)},
-            )()
-        ),
-    ),
+    r"|(?P<month_day>(?P<md_month>\d{1,2})月(?P<md_day>\d{1,2})日)"
     # 年のみ: 2024年
-    (
-        re.compile(r"(?P<year>\d{4})年"),
-        lambda m: _normalize_date(
-            type(
-                "Match",
-                (),
-                {"group": lambda self, x: m.group("year") if x == "year" else None},
-            )()
-        ),
-    ),
-    # 時刻: 10:30, 10時30分
-    (
-        re.compile(r"(?P<hour>\d{1,2})[:時](?P<minute>\d{2})分?"),
-        _normalize_time,
-    ),
+    r"|(?P<year>(?P<y_year>\d{4})年)"
+    # 時刻: 10:30, 10時30分（分の位置から日付・年などが始まる場合は時刻にしない: 12時2024年）
+    r"|(?P<time>(?P<t_hour>\d{1,2})[:時]"
+    rf"(?!{_DATE_FORM}|{_YEAR_MONTH_FORM}|{_MONTH_DAY_FORM}|{_YEAR_FORM})(?P<t_minute>\d{{2}})分?)"
     # 時のみ: 10時
-    (
-        re.compile(r"(?P<hour>\d{1,2})時(?!\d)"),
-        lambda m: _normalize_time(
-            type(
-                "Match",
-                (),
-                {"group": lambda self, x: m.group("hour") if x == "hour" else None},
-            )()
-        ),
-    ),
+    rf"|(?P<hour>(?P<h_hour>\d{{1,2}})時"
+    rf"(?!(?!{_DATE_FORM}|{_YEAR_MONTH_FORM}|{_MONTH_DAY_FORM}|{_YEAR_FORM}|{_TIME_FORM})\d))"
     # パーセント: 50%, 3.14%
-    (
-        re.compile(r"(?P<number>\d+(?:\.\d+)?)%"),
-        _normalize_percent,
-    ),
+    r"|(?P<percent>(?P<p_number>\d+(?:\.\d+)?)%)"
     # 助数詞付き数字
-    (
-        re.compile(r"(?P<number>\d+)(?P<counter>[個回件分秒本匹杯階冊人日月歳円])"),
-        _normalize_counter,
-    ),
-    # 第N章/節/回など
-    (
-        re.compile(r"第(?P<number>\d+)(?P<suffix>[章節回部編条項])"),
-        lambda m: "だい" + number_to_japanese(int(m.group("number"))) + m.group("suffix"),
-    ),
-    # 単独の数字（最後に適用）
-    (
-        re.compile(r"\d+(?:\.\d+)?"),
-        _normalize_plain_number,
-    ),
-]
+    r"|(?P<counter>(?P<c_number>\d+)(?P<c_counter>[個回件分秒本匹杯階冊人日月歳円]))"
+    # 単独の数字（直前の「第」と直後の章/節/回などは第N章として読む）
+    r"|(?P<number>\d+(?:\.\d+)?)"
+    r")"
+)
+
+# 第N章/節/回など（単独の数字の直後に来る接尾辞）
+ORDINAL_SUFFIXES = frozenset("章節回部編条項")
+
+_TOKEN_READERS: dict[str, Callable[[re.Match], str]] = {
+    "date": lambda m: _read_date(m["d_year"], m["d_month"], m["d_day"]),
+    "year_month": lambda m: _read_date(m["ym_year"], m["ym_month"], None),
+    "month_day": lambda m: _read_date(None, m["md_month"], m["md_day"]),
+    "year": lambda m: _read_date(m["y_year"], None, None),
+    "time": lambda m: _read_time(m["t_hour"], m["t_minute"]),
+    "hour": lambda m: _read_time(m["h_hour"], None),
+    "percent": lambda m: _read_number(m["p_number"]) + "パーセント",
+    "counter": lambda m: read_with_counter(int(m["c_number"]), m["c_counter"]),
+    "number": lambda m: _read_number(m["number"]),
+}
 
 
 def normalize_numbers(text: str) -> str:
     """テキスト中の数字を日本語読みに変換.
 
+    数字の並びを1回の走査で見つけ、前後の文字から日付・時刻・
+    パーセント・助数詞・第N章などの文脈を判定して読みに置き換える。
+
     Args:
         text: 入力テキスト
 
@@ -510,6 +465,28 @@ def normalize_numbers(text: str) -> str:
         >>> normalize_numbers("価格は1000円です")
         '価格はせんえんです'
     """
-    for pattern, replacer in PATTERNS:
-        text = pattern.sub(replacer, text)
-    return text
+    pieces = []
+    position = 0
+    for match in NUMBER_TOKEN_PATTERN.finditer(text):
+        start, end = match.span()
+        kind = match.lastgroup
+        assert kind is not None
+        if (
+            kind == "number"
+            and start > position
+            and text[start - 1] == "第"
+            and end < len(text)
+            and text[end] in ORDINAL_SUFFIXES
+            and "." not in match["number"]
+        ):
+            # 第N章 → だいN章
+            pieces.append(text[position : start - 1])
+            pieces.append("だい")
+        else:
+            pieces.append(text[position:start])
+        pieces.append(_TOKEN_READERS[kind](match))
+        position = end
+    if not pieces:
+        return text
+    pieces.append(text[position:])
+    return "".join(pieces)
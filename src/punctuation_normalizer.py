@@ -6,7 +6,7 @@ Uses MeCab morphological analysis to insert commas at appropriate positions.
 import re
 from dataclasses import dataclass
 
-import fugashi
+from src.morph_analyzer import analyze, feature_field
 
 
 @dataclass
@@ -82,19 +82,140 @@ COLON_HALF_PATTERN = re.compile(r":")
 # Bracket patterns for conversion (US8)
 OPEN_BRACKET_PATTERN = re.compile(r"[「『]")
 CLOSE_BRACKET_PATTERN = re.compile(r"[」』]")
+BRACKET_HINT_PATTERN = re.compile(r"[「『」』]")
 
 # Additional patterns for _normalize_colons (compiled for performance)
 COLON_SPACE_CLEANUP_PATTERN = re.compile(r"は、\s+")
 
-# Lazy initialization
-_tagger: fugashi.Tagger | None = None
 
+# Punctuation that ends the phrase counted by the prefix-length checks
+_PHRASE_BREAK = "、。！？"
 
-def _get_tagger() -> fugashi.Tagger:
-    global _tagger
-    if _tagger is None:
-        _tagger = fugashi.Tagger()
-    return _tagger
+
+class PunctuationNormalizer:
+    """Comma insertion rules compiled once for repeated use.
+
+    Each rule is a (literal, compiled pattern, replacement) triple. A rule
+    is only applied to lines containing its literal, and rules run in the
+    same order as the pattern lists, so the output equals applying the
+    rules one by one.
+
+    Example:
+        >>> normalizer = PunctuationNormalizer(min_prefix_len=6)
+        >>> normalizer.normalize("システム全体に関する議論")
+        'システム全体に関する、議論'
+    """
+
+    def __init__(
+        self,
+        min_prefix_len: int = 8,
+        rentai_patterns: list[str] | None = None,
+        adverb_patterns: list[str] | None = None,
+        conjunction_patterns: list[str] | None = None,
+        exclusion_suffixes: list[str] | None = None,
+    ) -> None:
+        """Compile the rules.
+
+        Args:
+            min_prefix_len: Minimum characters before a pattern (since the
+                last punctuation) to trigger comma insertion
+            rentai_patterns: Rule 1 patterns (default: RENTAI_PATTERNS)
+            adverb_patterns: Rule 2 patterns (default: ADVERB_PATTERNS)
+            conjunction_patterns: Rule 3 patterns (default: CONJUNCTION_PATTERNS)
+            exclusion_suffixes: Rule 4 exclusions after は (default: EXCLUSION_SUFFIXES)
+        """
+        self.min_prefix_len = min_prefix_len
+        prefix = rf"([^{_PHRASE_BREAK}]{{{min_prefix_len},}})"
+        following = rf"([^{_PHRASE_BREAK}\s])"
+        rules: list[tuple[str, re.Pattern[str], str]] = []
+
+        # Rule 1: Insert comma after 連体修飾句 patterns
+        # Only if preceded by long enough phrase (since last punctuation)
+        for pattern in RENTAI_PATTERNS if rentai_patterns is None else rentai_patterns:
+            rules.append((pattern, re.compile(rf"{prefix}({re.escape(pattern)}){following}"), r"\1\2、\3"))
+
+        # Rule 2: Insert comma after adverb patterns (always apply)
+        for pattern in ADVERB_PATTERNS if adverb_patterns is None else adverb_patterns:
+            rules.append((pattern, re.compile(rf"({re.escape(pattern)}){following}"), r"\1、\2"))
+
+        # Rule 3: Insert comma after conjunction patterns (with prefix check)
+        for pattern in CONJUNCTION_PATTERNS if conjunction_patterns is None else conjunction_patterns:
+            rules.append((pattern, re.compile(rf"{prefix}({re.escape(pattern)}){following}"), r"\1\2、\3"))
+
+        # Rule 4: Insert comma after は when preceded by long phrase
+        # Exclude patterns like ではありません, にはならない, etc.
+        # Use shorter threshold (6) because kanji is more compact than kana
+        ha_prefix_len = min(min_prefix_len, 6)
+        exclusions = EXCLUSION_SUFFIXES if exclusion_suffixes is None else exclusion_suffixes
+        exclusion_pattern = "|".join(re.escape(suffix) for suffix in exclusions)
+        rules.append(
+            (
+                "は",
+                re.compile(rf"([^{_PHRASE_BREAK}]{{{ha_prefix_len},}})(は)(?!({exclusion_pattern})){following}"),
+                r"\1\2、\4",
+            )
+        )
+        self._rules = rules
+
+    def normalize(self, text: str) -> str:
+        """Add punctuation for natural TTS reading.
+
+        Args:
+            text: Input text (with kanji)
+
+        Returns:
+            Text with additional punctuation for TTS
+        """
+        # Process line by line to preserve structure
+        lines = text.split("\n")
+        result_lines = []
+
+        for line in lines:
+            if not line.strip():
+                result_lines.append(line)
+                continue
+            # Apply colon normalization before line normalization
+            line = _normalize_colons(line)
+            # Apply bracket normalization before line normalization
+            line = _normalize_brackets(line)
+            result_lines.append(self.normalize_line(line))
+
+        return "\n".join(result_lines)
+
+    def normalize_line(self, line: str) -> str:
+        """Apply the comma insertion rules to a single line.
+
+        Args:
+            line: Input line
+
+        Returns:
+            Line with commas inserted
+        """
+        for literal, pattern, replacement in self._rules:
+            # Substring check first: most lines contain none of the patterns
+            if literal in line:
+                line = pattern.sub(replacement, line)
+        return line
+
+
+# Normalizers by min_prefix_len (the default one serves normalize_punctuation)
+_NORMALIZERS: dict[int, PunctuationNormalizer] = {}
+
+
+def get_punctuation_normalizer(min_prefix_len: int = 8) -> PunctuationNormalizer:
+    """Get the shared normalizer with the default rules (compiled once).
+
+    Args:
+        min_prefix_len: Minimum characters before a pattern to trigger comma insertion
+
+    Returns:
+        PunctuationNormalizer for min_prefix_len
+    """
+    normalizer = _NORMALIZERS.get(min_prefix_len)
+    if normalizer is None:
+        normalizer = PunctuationNormalizer(min_prefix_len)
+        _NORMALIZERS[min_prefix_len] = normalizer
+    return normalizer
 
 
 def normalize_punctuation(text: str) -> str:
@@ -106,21 +227,7 @@ def normalize_punctuation(text: str) -> str:
     Returns:
         Text with additional punctuation for TTS
     """
-    # Process line by line to preserve structure
-    lines = text.split("\n")
-    result_lines = []
-
-    for line in lines:
-        if not line.strip():
-            result_lines.append(line)
-            continue
-        # Apply colon normalization before line normalization
-        line = _normalize_colons(line)
-        # Apply bracket normalization before line normalization
-        line = _normalize_brackets(line)
-        result_lines.append(_normalize_line(line))
-
-    return "\n".join(result_lines)
+    return get_punctuation_normalizer().normalize(text)
 
 
 def _normalize_colons(text: str) -> str:
@@ -140,6 +247,10 @@ def _normalize_colons(text: str) -> str:
     Returns:
         Text with colons converted to は、
     """
+    # Nothing to convert or clean up (step 3 also applies to existing は、)
+    if "：" not in text and ":" not in text and "は、" not in text:
+        return text
+
     # Step 1: Protect time/ratio patterns (digit:digit) with placeholders
     time_ratio_matches = []
 
@@ -178,6 +289,9 @@ def _normalize_brackets(text: str) -> str:
     Returns:
         Text with quotation marks converted to commas
     """
+    if not BRACKET_HINT_PATTERN.search(text):
+        return text
+
     # Convert opening brackets
     text = OPEN_BRACKET_PATTERN.sub("、", text)
     # Convert closing brackets
@@ -193,30 +307,7 @@ def _normalize_line(line: str, min_prefix_len: int = 8) -> str:
         line: Input line
         min_prefix_len: Minimum characters before pattern to trigger comma insertion
     """
-    # Rule 1: Insert comma after 連体修飾句 patterns
-    # Only if preceded by long enough phrase (since last punctuation)
-    for pattern in RENTAI_PATTERNS:
-        # Match: (long prefix)(pattern)(non-punctuation char)
-        # Prefix must be at least min_prefix_len chars without punctuation
-        line = re.sub(rf"([^、。！？]{{{min_prefix_len},}})({re.escape(pattern)})([^、。！？\s])", r"\1\2、\3", line)
-
-    # Rule 2: Insert comma after adverb patterns (always apply)
-    for pattern in ADVERB_PATTERNS:
-        line = re.sub(rf"({re.escape(pattern)})([^、。！？\s])", r"\1、\2", line)
-
-    # Rule 3: Insert comma after conjunction patterns (with prefix check)
-    for pattern in CONJUNCTION_PATTERNS:
-        line = re.sub(rf"([^、。！？]{{{min_prefix_len},}})({re.escape(pattern)})([^、。！？\s])", r"\1\2、\3", line)
-
-    # Rule 4: Insert comma after は when preceded by long phrase
-    # Exclude patterns like ではありません, にはならない, etc.
-    # 〜カタは、〜ことは、etc.
-    # Use shorter threshold (6) because kanji is more compact than kana
-    ha_prefix_len = min(min_prefix_len, 6)
-    exclusion_pattern = "|".join(re.escape(s) for s in EXCLUSION_SUFFIXES)
-    line = re.sub(rf"([^、。！？]{{{ha_prefix_len},}})(は)(?!({exclusion_pattern}))([^、。！？\s])", r"\1\2、\4", line)
-
-    return line
+    return get_punctuation_normalizer(min_prefix_len).normalize_line(line)
 
 
 def _insert_after_long_phrases(line: str) -> str:
@@ -225,18 +316,16 @@ def _insert_after_long_phrases(line: str) -> str:
     Analyzes morphology to find long sequences of nouns/modifiers
     and inserts commas at phrase boundaries.
     """
-    tagger = _get_tagger()
-    words = list(tagger(line))
+    lattice = analyze(line)
 
-    if len(words) < 5:
+    if len(lattice) < 5:
         return line
 
     result = []
     noun_phrase_len = 0
 
-    for i, word in enumerate(words):
-        surface = word.surface
-        pos = word.feature.pos1 if hasattr(word.feature, "pos1") else ""
+    for i, surface in enumerate(lattice.surfaces):
+        pos = feature_field(lattice.features_raw[i], "pos1") or ""
 
         # Count consecutive noun-like elements
         if pos in ("名詞", "接頭辞", "形容詞", "連体詞"):
@@ -246,8 +335,8 @@ def _insert_after_long_phrases(line: str) -> str:
             if noun_phrase_len > 15 and pos == "助詞":
                 # Long noun phrase followed by particle - consider adding comma
                 # But only if next element starts a new clause
-                if i + 1 < len(words):
-                    next_pos = words[i + 1].feature.pos1 if hasattr(words[i + 1].feature, "pos1") else ""
+                if i + 1 < len(lattice):
+                    next_pos = feature_field(lattice.features_raw[i + 1], "pos1") or ""
                     if next_pos in ("名詞", "動詞", "形容詞"):
                         # Check if comma already exists
                         if not surface.endswith("、"):
@@ -261,11 +350,11 @@ def _insert_after_long_phrases(line: str) -> str:
 
 def show_analysis(text: str) -> None:
     """Debug: Show morphological analysis of text."""
-    tagger = _get_tagger()
-    for word in tagger(text):
-        pos1 = word.feature.pos1 if hasattr(word.feature, "pos1") else "?"
-        pos2 = word.feature.pos2 if hasattr(word.feature, "pos2") else "?"
-        print(f"{word.surface}\t{pos1}/{pos2}")
+    lattice = analyze(text)
+    for i, surface in enumerate(lattice.surfaces):
+        pos1 = feature_field(lattice.features_raw[i], "pos1") or "?"
+        pos2 = feature_field(lattice.features_raw[i], "pos2") or "?"
+        print(f"{surface}\t{pos1}/{pos2}")
 
 
 if __name__ == "__main__":
@@ -5,16 +5,36 @@ Entries are processed in order, so more specific patterns should come first.
 
 Note: We use (?<![A-Za-z]) and (?![A-Za-z]) instead of \b for word boundaries,
 because \b doesn't work well with Japanese text (no spaces between words).
+
+The rules are compiled into a short program of passes (see _compile_rules):
+runs of literal rules become one alternation regex dispatched by group
+index, runs of single-character rules become one character table, and
+other regexes run on their own. Rules are only merged into a pass when no
+match of one can overlap, touch the word boundary of, or be created by
+another, so the output is identical to applying the rules one by one.
 """
 
+import functools
 import re
+import string
+from typing import Callable
+
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+# _term() pattern → word, so the compiler knows which rules are whole words
+_TERM_WORDS: dict[str, str] = {}
+
+# Regex metacharacters (an unescaped one makes a pattern non-literal)
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]()|\\")
 
 
 def _term(word: str) -> str:
     """Create a pattern that matches the word not surrounded by other letters."""
     # Negative lookbehind: not preceded by a letter
     # Negative lookahead: not followed by a letter
-    return rf"(?<![A-Za-z]){re.escape(word)}(?![A-Za-z])"
+    pattern = rf"(?<![A-Za-z]){re.escape(word)}(?![A-Za-z])"
+    _TERM_WORDS[pattern] = word
+    return pattern
 
 
 # Format: (pattern, replacement)
@@ -180,9 +200,187 @@ _COMPILED_RULES: list[tuple[re.Pattern, str]] = [
     (re.compile(pattern), replacement) for pattern, replacement in READING_RULES
 ]
 
+# (word, word_boundary, reading) of a literal rule
+_Literal = tuple[str, bool, str]
+
+
+def _unescape_literal(pattern: str) -> str | None:
+    """Get the string a pattern matches literally, or None if it is not a literal."""
+    chars = []
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            if ch.isalnum():
+                return None  # \d, \b, ...
+            chars.append(ch)
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch in _REGEX_SPECIAL:
+            return None
+        else:
+            chars.append(ch)
+    return None if escaped or not chars else "".join(chars)
+
+
+def _char_class(pattern: str) -> frozenset[str] | None:
+    """Get the characters a one-character pattern matches, or None.
+
+    Accepts a single literal character or a [...] class of plain characters
+    (no ranges, negation or escaped classes).
+    """
+    if not (pattern.startswith("[") and pattern.endswith("]")):
+        literal = _unescape_literal(pattern)
+        return frozenset(literal) if literal is not None and len(literal) == 1 else None
+
+    body = pattern[1:-1]
+    if not body or body.startswith("^"):
+        return None
+    chars = set()
+    escaped = False
+    for ch in body:
+        if escaped:
+            if ch.isalnum():
+                return None
+            chars.add(ch)
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch in "-[]":
+            return None
+        else:
+            chars.add(ch)
+    return None if escaped else frozenset(chars)
+
+
+def _is_letter(ch: str) -> bool:
+    return ch in _ASCII_LETTERS
+
+
+def _literals_conflict(earlier: _Literal, later: _Literal) -> bool:
+    """Check whether two literal rules may interact when applied in one pass.
+
+    Applying `earlier` then `later` sequentially equals one alternation pass
+    (earlier tried first) unless:
+    - valid occurrences of the two words can overlap,
+    - earlier's replacement can create a later occurrence (shared characters,
+      or an empty reading joining its neighbours), or
+    - earlier's replacement changes the letter/non-letter neighbour that
+      later's word-boundary check sees.
+    """
+    u, u_boundary, u_reading = earlier
+    v, v_boundary, v_reading = later
+
+    if not u_reading or not set(u_reading).isdisjoint(v):
+        return True
+
+    # Overlap: v placed at offset d from the start of u
+    for d in range(1 - len(v), len(u)):
+        if any(u[i] != v[i - d] for i in range(max(0, d), min(len(u), d + len(v)))):
+            continue
+        if u_boundary and any(0 <= i - d < len(v) and _is_letter(v[i - d]) for i in (-1, len(u))):
+            continue
+        if v_boundary and any(0 <= i + d < len(u) and _is_letter(u[i + d]) for i in (-1, len(v))):
+            continue
+        return True
+
+    if v_boundary:
+        # v right after u: v's lookbehind sees u's reading instead of u
+        if (not u_boundary or not _is_letter(v[0])) and _is_letter(u[-1]) != _is_letter(u_reading[-1]):
+            return True
+        # v right before u: v's lookahead sees u's reading instead of u
+        if (not u_boundary or not _is_letter(v[-1])) and _is_letter(u[0]) != _is_letter(u_reading[0]):
+            return True
+    return False
+
+
+def _literal_pass(literals: list[_Literal]) -> Callable[[str], str]:
+    """Compile literal rules into one alternation pass with group-index dispatch.
+
+    All literals share the same word-boundary setting. The leading lookahead
+    on the possible first characters lets the regex engine skip positions
+    quickly, which an alternation alone does not.
+    """
+    first_chars = "".join(sorted({re.escape(word[0]) for word, _, _ in literals}))
+    alternatives = "|".join(f"({re.escape(word)})" for word, _, _ in literals)
+    if literals[0][1]:
+        pattern = re.compile(f"(?=[{first_chars}])(?<![A-Za-z])(?:{alternatives})(?![A-Za-z])")
+    else:
+        pattern = re.compile(f"(?=[{first_chars}])(?:{alternatives})")
+    readings = [reading for _, _, reading in literals]
+    return functools.partial(pattern.sub, lambda match: readings[match.lastindex - 1])
+
+
+def _char_pass(table: dict[str, str]) -> Callable[[str], str]:
+    """Compile single-character rules into one character-class pass.
+
+    Same result as str.translate(table); on mostly Japanese text the regex
+    character-class scan is several times faster than translate's
+    per-character lookups.
+    """
+    pattern = re.compile("[" + "".join(re.escape(ch) for ch in table) + "]")
+    return functools.partial(pattern.sub, lambda match: table[match.group()])
+
+
+def _compile_rules(rules: list[tuple[str, str]]) -> list[Callable[[str], str]]:
+    """Compile ordered (pattern, replacement) rules into passes.
+
+    Consecutive literal rules of the same kind (whole words from _term(),
+    or plain strings) share an alternation pass, and consecutive
+    single-character rules a character table, until the next rule would
+    conflict with one already in the pass; then a new pass starts. Rules with other regex features
+    or backslashes in the replacement keep a pass of their own.
+
+    Args:
+        rules: (pattern, replacement) pairs in application order
+
+    Returns:
+        Passes to apply in order
+    """
+    passes: list[Callable[[str], str]] = []
+    literals: list[_Literal] = []
+    table: dict[str, str] = {}
+    table_output: set[str] = set()
+
+    def flush() -> None:
+        nonlocal literals, table, table_output
+        if literals:
+            passes.append(_literal_pass(literals))
+        if table:
+            passes.append(_char_pass(table))
+        literals, table, table_output = [], {}, set()
+
+    for pattern, replacement in rules:
+        plain = "\\" not in replacement
+        chars = _char_class(pattern) if plain else None
+        word = _TERM_WORDS.get(pattern) or _unescape_literal(pattern)
+        if chars is not None:
+            if literals or not table_output.isdisjoint(chars):
+                flush()
+            for ch in chars:
+                table.setdefault(ch, replacement)
+            table_output.update(replacement)
+        elif plain and word is not None:
+            literal = (word, pattern in _TERM_WORDS, replacement)
+            if (
+                table
+                or (literals and literals[0][1] != literal[1])
+                or any(_literals_conflict(earlier, literal) for earlier in literals)
+            ):
+                flush()
+            literals.append(literal)
+        else:
+            flush()
+            passes.append(functools.partial(re.compile(pattern).sub, replacement))
+    flush()
+    return passes
+
+
+_RULE_PASSES = _compile_rules(READING_RULES)
+
 
 def apply_reading_rules(text: str) -> str:
     """Apply all reading rules to convert technical terms to readings."""
-    for pattern, replacement in _COMPILED_RULES:
-        text = pattern.sub(replacement, text)
+    for rule_pass in _RULE_PASSES:
+        text = rule_pass(text)
     return text
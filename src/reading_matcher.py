@@ -0,0 +1,345 @@
+"""Compiled reading-dictionary matcher.
+
+A per-book dictionary (readings.json) is applied to every paragraph of
+the book. The reference semantics are one re.sub per term, longest term
+first, each matching only as a whole ASCII word (not preceded or
+followed by [A-Za-z]).
+
+ReadingMatcher compiles the terms into a trie and finds every term
+occurrence in a single scan of the text, walking the trie only from
+characters that can start a term. Occurrences are then accepted in term
+priority order exactly as the sequential substitutions would accept
+them: a term cannot match inside text replaced by an earlier term, and
+its word boundary is checked against the neighbouring reading when the
+neighbour was replaced. This is exact as long as later terms cannot match
+inside inserted readings, so dictionaries whose readings share characters
+with later terms (or contain regex escapes, or empty terms/readings)
+keep the sequential per-term substitution.
+
+Matchers are cached in process by the dictionary file's content hash and
+persisted next to the dictionary (.readings.json.matcher.bin), so the
+clean-text and dialogue-tts stages load a ready-to-use matcher instead
+of rebuilding it per paragraph.
+"""
+
+import hashlib
+import json
+import logging
+import marshal
+import os
+import re
+import string
+from pathlib import Path
+from typing import Any
+
+from src.file_cache import get_sidecar_path
+
+logger = logging.getLogger(__name__)
+
+# Bump when the persisted payload layout changes
+MATCHER_VERSION = 2
+
+# Trie node key holding the priority (index into entries) of a term ending there
+_TERMINAL = ""
+
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+# Matchers keyed by dictionary file hash (one per dictionary version)
+_MATCHER_MEMO: dict[str, "ReadingMatcher"] = {}
+
+# Matchers for in-memory dictionaries passed to apply_llm_readings()
+_DICT_MATCHER_CACHE: dict[tuple[tuple[str, str], ...], "ReadingMatcher"] = {}
+_DICT_MATCHER_CACHE_SIZE = 8
+
+
+class ReadingMatcher:
+    """Reading dictionary prepared for repeated application.
+
+    Produces the same output as applying the terms one by one, longest
+    first, each as a whole ASCII word (not preceded or followed by
+    [A-Za-z]).
+
+    Example:
+        >>> matcher = ReadingMatcher({"API": "エーピーアイ"})
+        >>> matcher.apply("APIを使う")
+        'エーピーアイを使う'
+    """
+
+    def __init__(self, readings: dict[str, str]) -> None:
+        """Prepare a dictionary.
+
+        Args:
+            readings: Term → reading mapping (ties in length keep this order)
+        """
+        self.entries: list[tuple[str, str]] = [
+            (term, readings[term]) for term in sorted(readings, key=len, reverse=True)
+        ]
+        self._patterns: dict[str, re.Pattern[str]] = {}
+        self._set_trie(_build_trie(self.entries))
+
+    def _set_trie(self, trie: dict | None) -> None:
+        self._trie = trie
+        self._start_pattern = None
+        if trie:
+            self._start_pattern = re.compile("[" + "".join(re.escape(ch) for ch in trie) + "]")
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "ReadingMatcher":
+        """Restore a matcher persisted with to_payload().
+
+        Args:
+            payload: Payload from to_payload()
+
+        Returns:
+            Matcher equivalent to the one that was persisted
+
+        Raises:
+            ValueError: If the payload has another version or layout
+        """
+        if payload.get("version") != MATCHER_VERSION or not isinstance(payload.get("entries"), list):
+            raise ValueError("Unsupported matcher payload")
+        matcher = cls.__new__(cls)
+        matcher.entries = [(term, reading) for term, reading in payload["entries"]]
+        matcher._patterns = {}
+        matcher._set_trie(payload.get("trie"))
+        return matcher
+
+    def to_payload(self) -> dict[str, Any]:
+        """Get a marshal-serializable form of the matcher."""
+        return {"version": MATCHER_VERSION, "entries": self.entries, "trie": self._trie}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def apply(self, text: str) -> str:
+        """Replace dictionary terms in text with their readings.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Text with readings applied
+        """
+        if self._trie is None:
+            return self._apply_sequentially(text)
+        if self._start_pattern is None:
+            return text
+
+        occurrences = self._find_occurrences(text)
+        if not occurrences:
+            return text
+
+        # Replaced regions (original offsets), by start and by end
+        claimed = bytearray(len(text))
+        starts_at: dict[int, tuple[int, str]] = {}
+        ends_at: dict[int, tuple[int, str]] = {}
+
+        for priority in sorted(occurrences):
+            term, reading = self.entries[priority]
+            length = len(term)
+            accepted = []
+            last_end = 0
+            for start in occurrences[priority]:
+                end = start + length
+                if start < last_end or claimed.find(1, start, end) != -1:
+                    continue
+                # Boundaries see the text as left by earlier (longer) terms
+                before = ends_at[start][1][-1] if start in ends_at else text[start - 1 : start]
+                after = starts_at[end][1][0] if end in starts_at else text[end : end + 1]
+                if before in _ASCII_LETTERS or after in _ASCII_LETTERS:
+                    continue
+                accepted.append(start)
+                last_end = end
+            for start in accepted:
+                end = start + length
+                claimed[start:end] = b"\x01" * length
+                starts_at[start] = (end, reading)
+                ends_at[end] = (start, reading)
+
+        pieces = []
+        position = 0
+        for start in sorted(starts_at):
+            end, reading = starts_at[start]
+            pieces.append(text[position:start])
+            pieces.append(reading)
+            position = end
+        pieces.append(text[position:])
+        return "".join(pieces)
+
+    def entries_in(self, text: str) -> list[tuple[str, str]]:
+        """Get the entries that can change text when the matcher is applied.
+
+        These are the entries whose term occurs in text. When readings may
+        contain later terms (sequential substitution), terms occurring in
+        the readings of those entries are included as well.
+
+        Args:
+            text: Input text
+
+        Returns:
+            (term, reading) pairs in priority order
+        """
+        if self._trie is not None:
+            if self._start_pattern is None:
+                return []
+            return [self.entries[priority] for priority in sorted(self._find_occurrences(text))]
+
+        found: set[int] = set()
+        pending = [text]
+        while pending:
+            chunk = pending.pop()
+            for priority, (term, reading) in enumerate(self.entries):
+                if priority not in found and term in chunk:
+                    found.add(priority)
+                    pending.append(reading)
+        return [self.entries[priority] for priority in sorted(found)]
+
+    def _find_occurrences(self, text: str) -> dict[int, list[int]]:
+        """Find all term occurrences in one scan.
+
+        Returns:
+            Term priority → ascending start offsets of its occurrences
+        """
+        root = self._trie
+        assert root is not None and self._start_pattern is not None
+        occurrences: dict[int, list[int]] = {}
+        size = len(text)
+        for match in self._start_pattern.finditer(text):
+            start = match.start()
+            node = root
+            index = start
+            while index < size:
+                child = node.get(text[index])
+                if child is None:
+                    break
+                node = child
+                index += 1
+                priority = node.get(_TERMINAL)
+                if priority is not None:
+                    occurrences.setdefault(priority, []).append(start)
+        return occurrences
+
+    def _apply_sequentially(self, text: str) -> str:
+        """Apply one substitution per term (reference semantics)."""
+        for term, reading in self.entries:
+            # Substring check first: most terms do not occur in a paragraph
+            if term not in text:
+                continue
+            pattern = self._patterns.get(term)
+            if pattern is None:
+                pattern = re.compile(rf"(?<![A-Za-z]){re.escape(term)}(?![A-Za-z])")
+                self._patterns[term] = pattern
+            text = pattern.sub(reading, text)
+        return text
+
+
+def _build_trie(entries: list[tuple[str, str]]) -> dict | None:
+    """Build the term trie, or None if single-pass matching would not be exact.
+
+    Args:
+        entries: (term, reading) pairs in priority order
+
+    Returns:
+        Nested dict trie (character → child, _TERMINAL → priority), or None
+    """
+    root: dict = {}
+    reading_chars: set[str] = set()
+    for priority, (term, reading) in enumerate(entries):
+        if not term or not reading or "\\" in reading or not reading_chars.isdisjoint(term):
+            return None
+        reading_chars.update(reading)
+        node = root
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[_TERMINAL] = priority
+    return root
+
+
+def get_reading_matcher(readings: dict[str, str]) -> ReadingMatcher:
+    """Get a matcher for an in-memory dictionary (cached in process).
+
+    Args:
+        readings: Term → reading mapping
+
+    Returns:
+        ReadingMatcher for the dictionary
+    """
+    key = tuple(readings.items())
+    matcher = _DICT_MATCHER_CACHE.get(key)
+    if matcher is None:
+        if len(_DICT_MATCHER_CACHE) >= _DICT_MATCHER_CACHE_SIZE:
+            _DICT_MATCHER_CACHE.pop(next(iter(_DICT_MATCHER_CACHE)))
+        matcher = ReadingMatcher(readings)
+        _DICT_MATCHER_CACHE[key] = matcher
+    return matcher
+
+
+def get_matcher_cache_path(dict_path: Path) -> Path:
+    """Get the persisted matcher path for a dictionary file.
+
+    Args:
+        dict_path: Path to readings.json
+
+    Returns:
+        Hidden file next to the dictionary (.readings.json.matcher.bin)
+    """
+    return get_sidecar_path(dict_path, "matcher", ".bin")
+
+
+def load_reading_matcher(dict_path: Path) -> ReadingMatcher | None:
+    """Load the compiled matcher for a dictionary file.
+
+    Looks in the in-process cache, then the persisted matcher next to the
+    dictionary, and builds (and persists) it otherwise. All three are
+    keyed by the hash of the dictionary file's bytes, so editing
+    readings.json invalidates them.
+
+    Args:
+        dict_path: Path to readings.json
+
+    Returns:
+        ReadingMatcher, or None if the dictionary does not exist
+    """
+    try:
+        data = dict_path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    dict_hash = hashlib.sha256(data).hexdigest()
+    matcher = _MATCHER_MEMO.get(dict_hash)
+    if matcher is not None:
+        return matcher
+
+    cache_path = get_matcher_cache_path(dict_path)
+    matcher = _read_matcher_cache(cache_path, dict_hash)
+    if matcher is None:
+        matcher = ReadingMatcher(json.loads(data))
+        _write_matcher_cache(cache_path, dict_hash, matcher)
+
+    _MATCHER_MEMO[dict_hash] = matcher
+    return matcher
+
+
+def _read_matcher_cache(cache_path: Path, dict_hash: str) -> ReadingMatcher | None:
+    """Read a persisted matcher, or None if missing, corrupt or stale."""
+    try:
+        payload = marshal.loads(cache_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("dict_hash") != dict_hash:
+        return None
+    try:
+        return ReadingMatcher.from_payload(payload)
+    except (ValueError, TypeError):
+        return None
+
+
+def _write_matcher_cache(cache_path: Path, dict_hash: str, matcher: ReadingMatcher) -> None:
+    """Persist a matcher atomically (best effort)."""
+    payload = {"dict_hash": dict_hash, **matcher.to_payload()}
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(marshal.dumps(payload))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not write matcher cache %s: %s", cache_path, e)
@@ -0,0 +1,214 @@
+"""Cross-book reading store backed by SQLite.
+
+Per-book dictionaries (data/<hash>/readings.json) only help the book they
+were generated for. The shared store keeps every LLM-generated reading in
+one indexed table (data/readings.sqlite3) so gen-dict can look terms up in
+bulk and send only unseen terms to the LLM.
+
+Each row records where the reading came from: the model that produced
+it and the content hash of the book it was last generated for (a
+re-generated reading replaces both along with the reading).
+
+Per-book dictionaries remain the overlay: entries in a book's
+readings.json always win over the shared store, and the TTS stages keep
+reading only readings.json.
+"""
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Iterable
+
+from src import dict_manager
+
+logger = logging.getLogger(__name__)
+
+READING_STORE_FILENAME = "readings.sqlite3"
+
+# Seconds to wait for another gen-dict process holding the write lock
+_BUSY_TIMEOUT = 30.0
+
+# Terms per bulk lookup query (below SQLite's host parameter limit)
+_LOOKUP_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    term TEXT PRIMARY KEY,
+    reading TEXT NOT NULL,
+    model TEXT,
+    source_hash TEXT,
+    updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+) WITHOUT ROWID
+"""
+
+
+def get_reading_store_path() -> Path:
+    """Get the path of the shared reading store.
+
+    Returns:
+        Path to data/readings.sqlite3
+    """
+    return dict_manager.DATA_BASE_DIR / READING_STORE_FILENAME
+
+
+class ReadingStore:
+    """Shared term → reading table.
+
+    Example:
+        >>> with ReadingStore.open() as store:
+        ...     known = store.lookup(["API", "Kubernetes"])
+        ...     store.add({"SRE": "エスアールイー"}, model="gpt-oss:20b", source_hash="abc123")
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._conn = connection
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def open(cls, path: Path | None = None) -> "ReadingStore":
+        """Open (and create if needed) a reading store.
+
+        Args:
+            path: Database path (default: get_reading_store_path())
+
+        Returns:
+            Open ReadingStore
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or created
+        """
+        path = path or get_reading_store_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return cls(sqlite3.connect(path, timeout=_BUSY_TIMEOUT))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "ReadingStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM readings").fetchone()[0]
+
+    def lookup(self, terms: Iterable[str]) -> dict[str, str]:
+        """Look up readings for many terms at once.
+
+        Args:
+            terms: Terms to look up (exact match)
+
+        Returns:
+            Readings of the terms found in the store
+        """
+        unique_terms = list(dict.fromkeys(terms))
+        found: dict[str, str] = {}
+        for i in range(0, len(unique_terms), _LOOKUP_BATCH_SIZE):
+            batch = unique_terms[i : i + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT term, reading FROM readings WHERE term IN ({placeholders})",
+                batch,
+            )
+            found.update(rows)
+        return found
+
+    def add(self, readings: dict[str, str], model: str | None = None, source_hash: str | None = None) -> None:
+        """Insert or replace readings with their provenance.
+
+        Args:
+            readings: Term → reading mapping
+            model: Model that generated the readings
+            source_hash: Content hash of the book they were generated for
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO readings (term, reading, model, source_hash) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(term) DO UPDATE SET reading = excluded.reading, model = excluded.model, "
+                "source_hash = excluded.source_hash, updated_at = datetime('now')",
+                [(term, reading, model, source_hash) for term, reading in readings.items()],
+            )
+
+    def provenance(self, term: str) -> tuple[str | None, str | None] | None:
+        """Get the (model, source_hash) recorded for a term.
+
+        Args:
+            term: Term to look up
+
+        Returns:
+            (model, source_hash), or None if the term is not stored
+        """
+        row = self._conn.execute("SELECT model, source_hash FROM readings WHERE term = ?", (term,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+
+def open_reading_store(path: Path | None = None) -> ReadingStore | None:
+    """Open the shared reading store, or None if it is unavailable.
+
+    The store is an optimization: an unwritable data directory or a
+    locked/corrupt database only means more terms reach the LLM.
+
+    Args:
+        path: Database path (default: get_reading_store_path())
+
+    Returns:
+        Open ReadingStore, or None on error
+    """
+    try:
+        return ReadingStore.open(path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Shared reading store unavailable: %s", e)
+        return None
+
+
+def lookup_shared_readings(terms: Iterable[str], path: Path | None = None) -> dict[str, str]:
+    """Look up terms in the shared store (best effort).
+
+    Args:
+        terms: Terms to look up
+        path: Database path (default: get_reading_store_path())
+
+    Returns:
+        Readings found, or an empty dict if the store is unavailable
+    """
+    store = open_reading_store(path)
+    if store is None:
+        return {}
+    try:
+        return store.lookup(terms)
+    except sqlite3.Error as e:
+        logger.warning("Shared reading store lookup failed: %s", e)
+        return {}
+    finally:
+        store.close()
+
+
+def add_shared_readings(
+    readings: dict[str, str],
+    model: str | None = None,
+    source_hash: str | None = None,
+    path: Path | None = None,
+) -> None:
+    """Record newly generated readings in the shared store (best effort).
+
+    Args:
+        readings: Term → reading mapping
+        model: Model that generated the readings
+        source_hash: Content hash of the book they were generated for
+        path: Database path (default: get_reading_store_path())
+    """
+    if not readings:
+        return
+    store = open_reading_store(path)
+    if store is None:
+        return
+    try:
+        store.add(readings, model=model, source_hash=source_hash)
+        logger.info("Added %d readings to shared reading store", len(readings))
+    except sqlite3.Error as e:
+        logger.warning("Could not update shared reading store: %s", e)
+    finally:
+        store.close()
@@ -0,0 +1,126 @@
+"""Linear-time segmentation of text into TTS-sized spans.
+
+Both the book pipeline (split_text_into_chunks) and the dialogue splitter
+cut long texts into chunks of at most max_length characters, preferring
+to end a chunk at a strong delimiter (sentence ending) over a weak one
+(comma), and never ending it too early in the window.
+
+SpanSegmenter walks the text once, chunk by chunk. Each cut is found by
+searching backwards (str.rfind) for each delimiter within the current
+window only. For a positive min_split_ratio every cut lands more than
+that share of a window past the chunk start, so each character is
+searched a bounded number of times and segmentation stays linear in the
+text length. Chunks are returned as (start, end) offsets into the
+original string, so no substring is copied until a caller slices the
+chunks it needs.
+"""
+
+import math
+from fractions import Fraction
+from typing import Sequence
+
+
+class SpanSegmenter:
+    """Delimiter priorities and chunk size, prepared for repeated use.
+
+    Each chunk ends just after the last occurrence (within max_length
+    characters of the chunk start) of a delimiter of the highest-priority
+    group that has one starting more than min_split_ratio * max_length
+    characters into the chunk. Without such an occurrence the chunk is
+    cut at max_length. Chunks are whitespace-stripped.
+
+    Example:
+        >>> segmenter = SpanSegmenter([["。"], ["、"]], max_length=8)
+        >>> text = "今日は晴れ。明日は雨、のち曇り。"
+        >>> [text[start:end] for start, end in segmenter.spans(text)]
+        ['今日は晴れ。', '明日は雨、', 'のち曇り。']
+    """
+
+    def __init__(
+        self,
+        delimiters: Sequence[Sequence[str]],
+        max_length: int,
+        min_split_ratio: Fraction | float = Fraction(1, 3),
+    ) -> None:
+        """Prepare a segmenter.
+
+        Args:
+            delimiters: Delimiter groups, highest priority first; within a
+                group the occurrence ending last wins
+            max_length: Maximum characters per chunk
+            min_split_ratio: Fraction of max_length a chunk must exceed
+                before a delimiter may end it (pass a Fraction for exact
+                thirds)
+
+        Raises:
+            ValueError: If max_length is not positive or a delimiter is empty
+        """
+        if max_length < 1:
+            raise ValueError(f"max_length must be positive: {max_length}")
+        self.delimiters = tuple(tuple(group) for group in delimiters)
+        self.max_length = max_length
+        self.min_split = math.floor(max_length * Fraction(min_split_ratio))
+
+        for group in self.delimiters:
+            if not all(group):
+                raise ValueError("Delimiters must not be empty")
+
+    def spans(self, text: str, start: int = 0, end: int | None = None) -> list[tuple[int, int]]:
+        """Split text[start:end] into chunk spans.
+
+        Args:
+            text: Buffer containing the text to split
+            start: Start offset of the text in the buffer
+            end: End offset (exclusive) of the text in the buffer (default: len(text))
+
+        Returns:
+            (start, end) offsets into text of each chunk, whitespace-stripped
+            except for a text that fits in a single chunk as-is
+        """
+        if end is None:
+            end = len(text)
+        if end - start <= self.max_length:
+            return [(start, end)] if strip_span(text, start, end)[0] < end else []
+
+        spans = []
+        while start < end:
+            if end - start <= self.max_length:
+                chunk_start, chunk_end = strip_span(text, start, end)
+                if chunk_start < chunk_end:
+                    spans.append((chunk_start, chunk_end))
+                break
+
+            split_pos = self._find_split_position(text, start)
+            chunk_start, chunk_end = strip_span(text, start, split_pos)
+            if chunk_start < chunk_end:
+                spans.append((chunk_start, chunk_end))
+            start, end = strip_span(text, split_pos, end)
+
+        return spans
+
+    def _find_split_position(self, text: str, start: int) -> int:
+        """Find where the chunk starting at start ends.
+
+        Returns:
+            Offset just past the chosen delimiter, or start + max_length
+        """
+        limit = start + self.max_length
+        earliest = start + self.min_split
+        for group in self.delimiters:
+            split_pos = -1
+            for delimiter in group:
+                position = text.rfind(delimiter, start, limit)
+                if position > earliest:  # Don't split too early
+                    split_pos = max(split_pos, position + len(delimiter))
+            if split_pos != -1:
+                return split_pos
+        return limit
+
+
+def strip_span(text: str, start: int, end: int) -> tuple[int, int]:
+    """Narrow a span as str.strip() would, returning (start, end)."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
@@ -0,0 +1,212 @@
+"""Bounded-queue stages for running pipeline steps concurrently.
+
+A StagedPipeline runs each stage function in its own thread (or in the
+caller's thread) and connects the stages with bounded StageQueues: a
+stage that gets ahead blocks on put() until the next stage catches up,
+which caps the memory held between stages. If any stage fails, the
+others are aborted at their next queue operation and the first error is
+re-raised from the pipeline's with block.
+
+Every stage records the time it spends working (as opposed to waiting
+on its queues), and the pipeline logs each stage's utilization when it
+finishes, which shows the bottleneck: the stage that is busy nearly all
+the time limits throughput, the others mostly wait.
+"""
+
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Any, Callable, Generic, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds between abort checks while a stage waits on a full or empty queue
+_POLL_SECONDS = 0.1
+
+
+class StageAborted(Exception):
+    """Raised in a stage waiting on a queue after another stage failed."""
+
+
+class StageStats:
+    """Time one stage spent working."""
+
+    def __init__(self, name: str) -> None:
+        """Start with no busy time.
+
+        Args:
+            name: Stage name used in the utilization log
+        """
+        self.name = name
+        self.busy_seconds = 0.0
+
+    @contextmanager
+    def busy(self) -> Iterator[None]:
+        """Count the time spent in the with block as work."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.busy_seconds += time.perf_counter() - start
+
+
+class _Closed:
+    """End-of-stream marker put by StageQueue.close()."""
+
+
+_CLOSED = _Closed()
+
+
+class StageQueue(Generic[T]):
+    """Bounded queue from one stage to the next.
+
+    The consumer iterates over the queue until the producer closes it.
+    """
+
+    def __init__(self, maxsize: int, abort: threading.Event) -> None:
+        """Create an empty queue.
+
+        Args:
+            maxsize: Items the producer may get ahead of the consumer
+            abort: Event set when the pipeline fails
+        """
+        self._queue: queue.Queue[T | _Closed] = queue.Queue(maxsize)
+        self._abort = abort
+
+    def put(self, item: T) -> None:
+        """Put an item, waiting while the queue is full.
+
+        Raises:
+            StageAborted: If the pipeline fails while waiting
+        """
+        self._put(item)
+
+    def close(self) -> None:
+        """Tell the consumer no more items follow."""
+        self._put(_CLOSED)
+
+    def _put(self, item: T | _Closed) -> None:
+        while True:
+            if self._abort.is_set():
+                raise StageAborted
+            try:
+                self._queue.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self) -> Iterator[T]:
+        """Get items until the queue is closed.
+
+        Raises:
+            StageAborted: If the pipeline fails while waiting
+        """
+        while True:
+            if self._abort.is_set():
+                raise StageAborted
+            try:
+                item = self._queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if isinstance(item, _Closed):
+                return
+            yield item
+
+
+class StagedPipeline:
+    """Stages connected by bounded queues, run as a context manager.
+
+    Example:
+        >>> with StagedPipeline() as pipeline:
+        ...     numbers: StageQueue[int] = pipeline.queue(2)
+        ...     def produce(stats: StageStats) -> None:
+        ...         for n in range(5):
+        ...             with stats.busy():
+        ...                 value = n * n
+        ...             numbers.put(value)
+        ...         numbers.close()
+        ...     pipeline.start_thread("produce", produce)
+        ...     total = sum(numbers)
+        >>> total
+        30
+    """
+
+    def __init__(self) -> None:
+        """Prepare a pipeline with no stages."""
+        self.abort = threading.Event()
+        self.stats: list[StageStats] = []
+        self._threads: list[threading.Thread] = []
+        self._errors: list[BaseException] = []
+        self._start = time.perf_counter()
+
+    def queue(self, maxsize: int) -> StageQueue[Any]:
+        """Create a queue between two of the pipeline's stages."""
+        return StageQueue(maxsize, self.abort)
+
+    def stage(self, name: str) -> StageStats:
+        """Register a stage run by the caller's thread."""
+        stats = StageStats(name)
+        self.stats.append(stats)
+        return stats
+
+    def start_thread(self, name: str, target: Callable[[StageStats], None]) -> None:
+        """Run a stage in a new thread.
+
+        Args:
+            name: Stage name
+            target: Stage function, called with the stage's StageStats
+        """
+        stats = self.stage(name)
+
+        def run() -> None:
+            try:
+                target(stats)
+            except StageAborted:
+                pass
+            except BaseException as e:
+                self._errors.append(e)
+                self.abort.set()
+
+        thread = threading.Thread(target=run, name=f"stage-{name}", daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def __enter__(self) -> "StagedPipeline":
+        """Start timing the pipeline."""
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Wait for the stage threads and re-raise the first stage error."""
+        if exc_type is not None:
+            self.abort.set()
+        for thread in self._threads:
+            thread.join()
+
+        if self._errors and (exc_type is None or issubclass(exc_type, StageAborted)):
+            raise self._errors[0]
+        if exc_type is None:
+            self.log_utilization()
+
+    def log_utilization(self) -> None:
+        """Log the share of the pipeline's run time each stage spent working."""
+        elapsed = time.perf_counter() - self._start
+        if not self.stats or elapsed <= 0:
+            return
+        bottleneck = max(self.stats, key=lambda stats: stats.busy_seconds)
+        logger.info(
+            "Stage utilization over %.1fs: %s (bottleneck: %s)",
+            elapsed,
+            ", ".join(f"{stats.name} {stats.busy_seconds / elapsed:.0%}" for stats in self.stats),
+            bottleneck.name,
+        )
@@ -0,0 +1,138 @@
+"""Process pool for parallel VOICEVOX chunk synthesis.
+
+One VoicevoxSynthesizer synthesizes one chunk at a time, and in CPU mode
+a single inference does not keep every core busy. SynthesisPool runs N
+worker processes, each with its own synthesizer holding only the VVM of
+the requested style, and synthesizes a batch of chunks (a chapter) in
+parallel.
+
+Chunks are dispatched longest-first so that the long chunks do not end
+up last on a single worker while the others sit idle, and the results
+are returned in the original chunk order. Workers are forked from the
+pipeline process before any model is loaded there (ONNX Runtime state
+is not fork-safe), so they share the parent's imported modules but
+each initialize VOICEVOX themselves.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from types import TracebackType
+
+import numpy as np
+
+from src.voicevox_client import VoicevoxConfig, VoicevoxSynthesizer, generate_audio, normalize_audio
+
+logger = logging.getLogger(__name__)
+
+# Synthesizer owned by this worker process (set by _init_worker)
+_worker_synthesizer: VoicevoxSynthesizer | None = None
+
+
+def _init_worker(config: VoicevoxConfig) -> None:
+    """Initialize VOICEVOX and load the style's VVM once per worker."""
+    global _worker_synthesizer
+    _worker_synthesizer = VoicevoxSynthesizer(config)
+    _worker_synthesizer.initialize()
+    _worker_synthesizer.load_model_for_style_id(config.style_id)
+
+
+def _ready() -> int:
+    """Worker entry point used to wait for the pool to start."""
+    return os.getpid()
+
+
+def _synthesize_task(task: tuple[str, int, float]) -> tuple[np.ndarray, int]:
+    """Worker entry point: synthesize and normalize one (text, style_id, speed) chunk."""
+    text, style_id, speed = task
+    if _worker_synthesizer is None:
+        raise RuntimeError("Synthesis worker is not initialized")
+    waveform, sample_rate = generate_audio(_worker_synthesizer, text=text, style_id=style_id, speed_scale=speed)
+    return normalize_audio(waveform, target_peak=0.9), sample_rate
+
+
+def get_worker_cpu_threads(workers: int) -> int:
+    """Split the machine's cores evenly between the synthesis workers.
+
+    Args:
+        workers: Number of worker processes
+
+    Returns:
+        ONNX Runtime CPU threads per worker (at least 1)
+    """
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+class SynthesisPool:
+    """Worker processes that synthesize chunks in parallel.
+
+    Use as a context manager; the workers are started on entry and shut
+    down on exit.
+    """
+
+    def __init__(self, config: VoicevoxConfig, workers: int) -> None:
+        """Prepare a pool.
+
+        Args:
+            config: VOICEVOX settings for every worker (style_id selects the
+                VVM to load); cpu_num_threads is split between the workers
+                unless set
+            workers: Number of worker processes
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be positive: {workers}")
+        if config.cpu_num_threads == 0:
+            config = replace(config, cpu_num_threads=get_worker_cpu_threads(workers))
+        self.config = config
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "SynthesisPool":
+        """Start the workers and wait until one is ready."""
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self.config,),
+        )
+        # Forked workers are all launched on the first submit; this also
+        # surfaces initialization errors (BrokenProcessPool) right away
+        self._executor.submit(_ready).result()
+        logger.info("Synthesizing with %d worker processes", self.workers)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Shut down the workers (cancelling queued chunks on error)."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=exc_type is not None)
+            self._executor = None
+
+    def synthesize(self, texts: list[str], style_id: int, speed: float) -> list[tuple[np.ndarray, int]]:
+        """Synthesize chunks in parallel, longest first.
+
+        Args:
+            texts: Chunk texts
+            style_id: VOICEVOX style ID
+            speed: VOICEVOX speed_scale
+
+        Returns:
+            (normalized waveform, sample rate) of each chunk, in texts order
+
+        Raises:
+            RuntimeError: If the pool is not running
+        """
+        if self._executor is None:
+            raise RuntimeError("SynthesisPool is not running")
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        futures = {i: self._executor.submit(_synthesize_task, (texts[i], style_id, speed)) for i in order}
+        return [futures[i].result() for i in range(len(texts))]
@@ -1,15 +1,18 @@
 """Clean markdown text for TTS reading."""
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
+from typing import Callable, Iterator
 
-from src.dict_manager import load_dict_from_content
-from src.llm_reading_generator import apply_llm_readings
+from src.dict_manager import get_content_hash, get_dict_path_from_hash
 from src.mecab_reader import convert_to_kana
 from src.number_normalizer import normalize_numbers
 from src.punctuation_normalizer import normalize_punctuation
 from src.reading_dict import apply_reading_rules
+from src.reading_matcher import ReadingMatcher, load_reading_matcher
+from src.span_segmenter import SpanSegmenter
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +20,8 @@ logger = logging.getLogger(__name__)
 # Using a unique string that won't appear in normal text
 _HEADING_PLACEHOLDER = "__HEADING_MARKER_PLACEHOLDER__"
 
-# LLM-generated dictionary (set per-book via init_for_content)
-_LLM_READINGS: dict[str, str] = {}
+# LLM-generated dictionary matcher (set per-book via init_for_content)
+_LLM_MATCHER: ReadingMatcher | None = None
 
 # Enable/disable kanji → kana conversion via MeCab
 ENABLE_KANJI_CONVERSION = True
@@ -31,15 +34,10 @@ BARE_URL_PATTERN = re.compile(r"https?://[^\s\u3000-\u9fff\uff00-\uffef）」』
 WWW_URL_PATTERN = re.compile(r"www\.[^\s\u3000-\u9fff\uff00-\uffef）」』】\]]+")
 URL_TEXT_PATTERN = re.compile(r"^(?:https?://|www\.)")
 
-# Reference patterns for TTS normalization (US2/US3)
-REFERENCE_PATTERNS = [
-    (re.compile(r"図(\d+)[.．](\d+)"), r"ず\1の\2"),  # 図X.Y
-    (re.compile(r"図(\d+)"), r"ず\1"),  # 図X
-    (re.compile(r"表(\d+)[.．](\d+)"), r"ひょう\1の\2"),  # 表X.Y
-    (re.compile(r"表(\d+)"), r"ひょう\1"),  # 表X
-    (re.compile(r"注(\d+)[.．](\d+)"), r"ちゅう\1の\2"),  # 注X.Y
-    (re.compile(r"注(\d+)"), r"ちゅう\1"),  # 注X
-]
+# Reference patterns for TTS normalization (US2/US3): 図X.Y → ずXのY, 図X → ずX (also 表/注)
+# X.Y is tried before X at each position
+REFERENCE_PATTERN = re.compile(r"([図表注])(\d+)(?:[.．](\d+))?")
+REFERENCE_READINGS = {"図": "ず", "表": "ひょう", "注": "ちゅう"}
 
 # Number prefix pattern (US2)
 # No.X pattern (case insensitive)
@@ -49,6 +47,9 @@ NUMBER_PREFIX_PATTERN = re.compile(r"No\.(\d+)", re.IGNORECASE)
 # Chapter X pattern (case insensitive)
 CHAPTER_PATTERN = re.compile(r"Chapter\s+(\d+)", re.IGNORECASE)
 
+# NUMBER_PREFIX_PATTERN and CHAPTER_PATTERN in one pass (their matches never overlap)
+NUMBER_PREFIX_OR_CHAPTER_PATTERN = re.compile(r"No\.(\d+)|Chapter\s+(\d+)", re.IGNORECASE)
+
 # ISBN patterns (US4)
 # ISBN-13: 978/979 + 10 digits with optional hyphens
 # ISBN-10: 10 digits/chars with optional hyphens (last char can be X)
@@ -91,6 +92,10 @@ ISBN_WITH_CONTEXT_PATTERN = re.compile(
     r")"
 )
 
+# Necessary condition for either ISBN pattern: a label, or a bracket followed by a digit
+ISBN_HINT_PATTERN = re.compile(r"[Ii][Ss][Bb][Nn]|[（(]\d")
+MULTIPLE_SPACES_PATTERN = re.compile(r" {3,}")
+
 # Parenthetical patterns for English term removal (US5)
 # Matches brackets containing only ASCII letters, numbers, spaces, hyphens, periods, commas
 # But preserves brackets containing Japanese characters or empty content
@@ -121,10 +126,22 @@ def init_for_content(markdown_content: str) -> None:
     Args:
         markdown_content: The full markdown content of the book
     """
-    global _LLM_READINGS
-    _LLM_READINGS = load_dict_from_content(markdown_content)
-    if _LLM_READINGS:
-        logger.info("Loaded LLM dictionary: %d entries", len(_LLM_READINGS))
+    init_for_hash(get_content_hash(markdown_content))
+
+
+def init_for_hash(content_hash: str) -> None:
+    """Initialize the text cleaner from a precomputed content hash.
+
+    Same as init_for_content() for callers that already hashed the book
+    (e.g. with get_streaming_content_hash) and never hold its full text.
+
+    Args:
+        content_hash: Short content hash of the book
+    """
+    global _LLM_MATCHER
+    _LLM_MATCHER = load_reading_matcher(get_dict_path_from_hash(content_hash))
+    if _LLM_MATCHER:
+        logger.info("Loaded LLM dictionary: %d entries", len(_LLM_MATCHER))
     else:
         logger.info("No LLM dictionary found for this content")
 
@@ -137,24 +154,88 @@ class Page:
     text: str
 
 
+# Page marker lines in book.md ("--- Page 12 (page_0012.png) ---")
+PAGE_MARKER_PATTERN = re.compile(r"^--- Page (\d+) \(page_\d+\.png\) ---$", flags=re.MULTILINE)
+
+
+def iter_page_spans(markdown: str) -> Iterator[tuple[int, int, int]]:
+    """Lazily locate pages in book.md without copying their text.
+
+    Text before the first page marker is skipped.
+
+    Args:
+        markdown: Full book.md content
+
+    Yields:
+        (page_number, start, end) with markdown[start:end] the raw page text
+    """
+    markers = PAGE_MARKER_PATTERN.finditer(markdown)
+    current = next(markers, None)
+    while current is not None:
+        following = next(markers, None)
+        end = following.start() if following is not None else len(markdown)
+        yield int(current.group(1)), current.end(), end
+        current = following
+
+
+def iter_raw_pages(markdown: str) -> Iterator[Page]:
+    """Lazily yield uncleaned pages of book.md.
+
+    Callers decide how much cleaning each page needs: clean_page_text()
+    for TTS, strip_markdown() when only the words matter.
+
+    Args:
+        markdown: Full book.md content
+
+    Yields:
+        Page objects holding the raw text between page markers
+    """
+    for number, start, end in iter_page_spans(markdown):
+        yield Page(number=number, text=markdown[start:end])
+
+
 def split_into_pages(markdown: str) -> list[Page]:
-    """Split book.md into pages based on page markers."""
-    pattern = r"^--- Page (\d+) \(page_\d+\.png\) ---$"
-    parts = re.split(pattern, markdown, flags=re.MULTILINE)
+    """Split book.md into pages based on page markers.
 
+    Pages are cleaned for TTS with clean_page_text(); pages left empty
+    after cleaning are dropped.
+    """
     pages = []
-    # parts[0] is text before first marker (usually empty)
-    # parts[1], parts[2] = page_number, page_content
-    # parts[3], parts[4] = page_number, page_content ...
-    for i in range(1, len(parts), 2):
-        page_num = int(parts[i])
-        raw_text = parts[i + 1] if i + 1 < len(parts) else ""
-        cleaned = clean_page_text(raw_text)
+    for page in iter_raw_pages(markdown):
+        cleaned = clean_page_text(page.text)
         if cleaned.strip():
-            pages.append(Page(number=page_num, text=cleaned))
+            pages.append(Page(number=page.number, text=cleaned))
     return pages
 
 
+def strip_markdown(text: str) -> str:
+    """Remove markdown markup, URLs and code without TTS normalization.
+
+    The markup-only part of clean_page_text(): no punctuation, number,
+    reading-dictionary or MeCab passes, so ASCII terms stay intact for
+    term extraction.
+
+    Args:
+        text: Raw markdown text (e.g. one page)
+
+    Returns:
+        Plain text
+    """
+    text = _clean_urls(text)
+    text = HTML_COMMENT_PATTERN.sub("", text)
+    text = FIGURE_DESC_PATTERN.sub("", text)
+    text = PAGE_NUMBER_PATTERN.sub("", text)
+    text = HEADING_PATTERN.sub("", text)
+    text = BOLD_ITALIC_PATTERN.sub(r"\1", text)
+    text = HORIZONTAL_RULE_PATTERN.sub("", text)
+    # Code blocks before inline code, so fenced code is dropped rather than unwrapped
+    text = CODE_BLOCK_PATTERN.sub("", text)
+    text = INLINE_CODE_PATTERN.sub(r"\1", text)
+    text = TRAILING_WHITESPACE_PATTERN.sub("", text)
+    text = MULTIPLE_NEWLINES_PATTERN.sub("\n\n", text)
+    return text.strip()
+
+
 def _clean_urls(text: str) -> str:
     """Replace URLs with 'ウェブサイト' for TTS.
 
@@ -172,13 +253,16 @@ def _clean_urls(text: str) -> str:
             return "ウェブサイト"
         return link_text
 
-    text = MARKDOWN_LINK_PATTERN.sub(replace_markdown_link, text)
+    if "](" in text:
+        text = MARKDOWN_LINK_PATTERN.sub(replace_markdown_link, text)
 
     # Step 2: Replace bare http(s):// URLs with 'ウェブサイト'
-    text = BARE_URL_PATTERN.sub("ウェブサイト", text)
+    if "http" in text:
+        text = BARE_URL_PATTERN.sub("ウェブサイト", text)
 
     # Step 3: Replace www. URLs with 'ウェブサイト'
-    text = WWW_URL_PATTERN.sub("ウェブサイト", text)
+    if "www." in text:
+        text = WWW_URL_PATTERN.sub("ウェブサイト", text)
 
     return text
 
@@ -191,9 +275,16 @@ def _normalize_references(text: str) -> str:
     - 表X.Y → ひょうXのY
     - 注X.Y → ちゅうXのY
     """
-    for pattern, replacement in REFERENCE_PATTERNS:
-        text = pattern.sub(replacement, text)
-    return text
+    if "図" not in text and "表" not in text and "注" not in text:
+        return text
+    return REFERENCE_PATTERN.sub(_replace_reference, text)
+
+
+def _replace_reference(match: re.Match[str]) -> str:
+    kind, major, minor = match.groups()
+    if minor is None:
+        return f"{REFERENCE_READINGS[kind]}{major}"
+    return f"{REFERENCE_READINGS[kind]}{major}の{minor}"
 
 
 def _clean_number_prefix(text: str) -> str:
@@ -220,6 +311,16 @@ def _clean_chapter(text: str) -> str:
     return CHAPTER_PATTERN.sub(r"第\1章", text)
 
 
+def _clean_number_prefix_and_chapter(text: str) -> str:
+    """Apply _clean_number_prefix() and _clean_chapter() in one pass."""
+    return NUMBER_PREFIX_OR_CHAPTER_PATTERN.sub(_replace_number_prefix_or_chapter, text)
+
+
+def _replace_number_prefix_or_chapter(match: re.Match[str]) -> str:
+    number, chapter = match.groups()
+    return f"ナンバー{number}" if number is not None else f"第{chapter}章"
+
+
 def _clean_isbn(text: str) -> str:
     """Remove ISBN numbers from text for TTS.
 
@@ -240,20 +341,22 @@ def _clean_isbn(text: str) -> str:
     if not text.strip():
         return text
 
-    # Step 1: Remove ISBNs with context (brackets, labels)
-    text = ISBN_WITH_CONTEXT_PATTERN.sub("", text)
+    if ISBN_HINT_PATTERN.search(text):
+        # Step 1: Remove ISBNs with context (brackets, labels)
+        text = ISBN_WITH_CONTEXT_PATTERN.sub("", text)
 
-    # Step 2: Remove any remaining bare ISBNs
-    text = ISBN_PATTERN.sub("", text)
+        # Step 2: Remove any remaining bare ISBNs
+        text = ISBN_PATTERN.sub("", text)
 
     # Step 3: Normalize spaces
     # First, remove all full-width spaces
     text = text.replace("\u3000", "")
     # Then, handle half-width spaces:
-    # - 3+ consecutive spaces → single space
-    text = re.sub(r" {3,}", " ", text)
-    # - Exactly 2 consecutive spaces → no space
-    text = text.replace("  ", "")
+    if "  " in text:
+        # - 3+ consecutive spaces → single space
+        text = MULTIPLE_SPACES_PATTERN.sub(" ", text)
+        # - Exactly 2 consecutive spaces → no space
+        text = text.replace("  ", "")
 
     return text
 
@@ -276,8 +379,52 @@ def _clean_parenthetical_english(text: str) -> str:
     Returns:
         Text with English-only parenthetical terms removed
     """
-    text = PAREN_ENGLISH_FULL.sub("", text)
-    text = PAREN_ENGLISH_HALF.sub("", text)
+    if "（" in text:
+        text = PAREN_ENGLISH_FULL.sub("", text)
+    if "(" in text:
+        text = PAREN_ENGLISH_HALF.sub("", text)
+    return text
+
+
+def _convert_list_block(match: re.Match[str]) -> str:
+    """Convert consecutive list items into a single line with periods."""
+    lines = match.group(0).strip().split("\n")
+    items = []
+    for line in lines:
+        content = LIST_MARKER_PATTERN.sub("", line)
+        if content and content[-1] not in "。！？、":
+            content += "。"
+        items.append(content)
+    return "".join(items)
+
+
+# Markdown cleanup passes of clean_page_text(), applied in this order.
+# Each pass is skipped unless one of its guard substrings is present
+# (a match is impossible without one), so plain paragraphs skip most passes.
+# (guards, pattern, replacement)
+_MARKDOWN_RULES: tuple[tuple[tuple[str, ...], re.Pattern[str], str | Callable[[re.Match[str]], str]], ...] = (
+    (("<!--",), HTML_COMMENT_PATTERN, ""),  # HTML comments (figure markers)
+    (("図は、",), FIGURE_DESC_PATTERN, ""),  # Figure description paragraphs
+    (("/",), PAGE_NUMBER_PATTERN, ""),  # Page number markers like "1 / 1"
+    (("#",), HEADING_PATTERN, ""),  # Heading markers (text is kept)
+    (("*",), BOLD_ITALIC_PATTERN, r"\1"),  # Bold/italic markers
+    (("---",), HORIZONTAL_RULE_PATTERN, ""),  # Horizontal rules
+    (("-", "*"), LIST_BLOCK_PATTERN, _convert_list_block),  # List blocks → one line
+    (("`",), INLINE_CODE_PATTERN, r"\1"),  # Inline code backticks
+    (("```",), CODE_BLOCK_PATTERN, ""),  # Code blocks
+    ((" ", "\t"), TRAILING_WHITESPACE_PATTERN, ""),  # Trailing whitespace
+    (("  ",), DOUBLE_SPACE_PATTERN, ""),  # Markdown line breaks (trailing double space)
+    (("\n\n\n",), MULTIPLE_NEWLINES_PATTERN, "\n\n"),  # Multiple blank lines
+)
+
+
+def _apply_markdown_rules(text: str) -> str:
+    """Apply the markdown cleanup passes of clean_page_text() in order."""
+    for guards, pattern, replacement in _MARKDOWN_RULES:
+        for guard in guards:
+            if guard in text:
+                text = pattern.sub(replacement, text)
+                break
     return text
 
 
@@ -296,56 +443,12 @@ def clean_page_text(text: str, heading_marker: str | None = None) -> str:
     # Process in specific order to avoid interference
     text = _clean_urls(text)  # US1: Remove URLs
     text = _clean_isbn(text)  # US4: Remove ISBN
-    text = _clean_number_prefix(text)  # US2: No.X → ナンバーX
-    text = _clean_chapter(text)  # US2: Chapter X → 第X章
+    text = _clean_number_prefix_and_chapter(text)  # US2: No.X → ナンバーX, Chapter X → 第X章
     text = _clean_parenthetical_english(text)  # US5: Remove (English)
     text = _normalize_references(text)  # US2/3: 図X.Y → ずXのY
 
-    # Remove HTML comments (figure markers)
-    text = HTML_COMMENT_PATTERN.sub("", text)
-
-    # Remove figure description paragraphs (lines starting with 図は、)
-    text = FIGURE_DESC_PATTERN.sub("", text)
-
-    # Remove page number markers like "1 / 1", "はじめに 1 / 3"
-    text = PAGE_NUMBER_PATTERN.sub("", text)
-
-    # Remove markdown heading markers but keep text
-    text = HEADING_PATTERN.sub("", text)
-
-    # Remove bold/italic markers
-    text = BOLD_ITALIC_PATTERN.sub(r"\1", text)
-
-    # Remove horizontal rules
-    text = HORIZONTAL_RULE_PATTERN.sub("", text)
-
-    # Convert consecutive list items into single line with periods
-    def convert_list_block(match: re.Match) -> str:
-        lines = match.group(0).strip().split("\n")
-        items = []
-        for line in lines:
-            content = LIST_MARKER_PATTERN.sub("", line)
-            if content and content[-1] not in "。！？、":
-                content += "。"
-            items.append(content)
-        return "".join(items)
-
-    text = LIST_BLOCK_PATTERN.sub(convert_list_block, text)
-
-    # Remove inline code backticks
-    text = INLINE_CODE_PATTERN.sub(r"\1", text)
-
-    # Remove code blocks
-    text = CODE_BLOCK_PATTERN.sub("", text)
-
-    # Remove trailing whitespace from lines
-    text = TRAILING_WHITESPACE_PATTERN.sub("", text)
-
-    # Remove markdown line breaks (trailing double space)
-    text = DOUBLE_SPACE_PATTERN.sub("", text)
-
-    # Collapse multiple blank lines into one
-    text = MULTIPLE_NEWLINES_PATTERN.sub("\n\n", text)
+    # Markdown cleanup (comments, headings, emphasis, lists, code, whitespace)
+    text = _apply_markdown_rules(text)
 
     # Apply TTS normalization and reading rules
     # 0. Punctuation normalization (add commas for natural reading)
@@ -355,8 +458,8 @@ def clean_page_text(text: str, heading_marker: str | None = None) -> str:
     # 2. Static dictionary (critical terms like SRE, API, AWS)
     text = apply_reading_rules(text)
     # 3. LLM-generated dictionary (additional terms)
-    if _LLM_READINGS:
-        text = apply_llm_readings(text, _LLM_READINGS)
+    if _LLM_MATCHER:
+        text = _LLM_MATCHER.apply(text)
     # 4. MeCab: Convert remaining kanji to kana
     if ENABLE_KANJI_CONVERSION:
         text = convert_to_kana(text)
@@ -373,37 +476,37 @@ def split_text_into_chunks(text: str, max_chars: int = 500) -> list[str]:
 
     Splits on sentence boundaries (。！？) to maintain natural reading flow.
     """
-    if len(text) <= max_chars:
-        return [text] if text.strip() else []
+    return [text[start:end] for start, end in split_span_into_chunks(text, 0, len(text), max_chars)]
 
-    chunks = []
-    remaining = text
 
-    while remaining:
-        if len(remaining) <= max_chars:
-            if remaining.strip():
-                chunks.append(remaining.strip())
-            break
+# Split delimiters in order of preference
+_SPLIT_DELIMITERS = ("。", "！", "？", "!", "?", "\n\n", "\n", "、", ",")
 
-        # Find the best split point within max_chars
-        split_pos = _find_split_position(remaining, max_chars)
-        chunk = remaining[:split_pos].strip()
-        if chunk:
-            chunks.append(chunk)
-        remaining = remaining[split_pos:].strip()
+# Distinct chunk sizes whose segmenters are kept
+_SEGMENTER_CACHE_SIZE = 16
 
-    return chunks
 
+@functools.lru_cache(maxsize=_SEGMENTER_CACHE_SIZE)
+def _get_chunk_segmenter(max_chars: int) -> SpanSegmenter:
+    """Get the TTS chunk segmenter for a chunk size (each delimiter is its own priority)."""
+    return SpanSegmenter([(delimiter,) for delimiter in _SPLIT_DELIMITERS], max_chars)
 
-def _find_split_position(text: str, max_chars: int) -> int:
-    """Find the best position to split text, preferring sentence boundaries."""
-    search_region = text[:max_chars]
 
-    # Try Japanese sentence endings: 。！？
-    for delimiter in ["。", "！", "？", "!", "?", "\n\n", "\n", "、", ","]:
-        pos = search_region.rfind(delimiter)
-        if pos > max_chars // 3:  # Don't split too early
-            return pos + len(delimiter)
+def split_span_into_chunks(text: str, start: int, end: int, max_chars: int = 500) -> list[tuple[int, int]]:
+    """Split text[start:end] into chunk spans without copying substrings.
 
-    # Fallback: split at max_chars
-    return max_chars
+    Same chunking as split_text_into_chunks(), which is a thin wrapper that
+    slices the returned spans. Lets callers holding a larger buffer (e.g.
+    ChunkPlanner) chunk part of it in place.
+
+    Args:
+        text: Buffer containing the text to split
+        start: Start offset of the text in the buffer
+        end: End offset (exclusive) of the text in the buffer
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        (start, end) offsets into text of each chunk, whitespace-stripped
+        except for a text that fits in a single chunk as-is
+    """
+    return _get_chunk_segmenter(max_chars).spans(text, start, end)
@@ -1,26 +1,42 @@
 """Text cleaner CLI - Extract cleaned text from XML without TTS processing.
 
 This module provides a command-line interface to generate cleaned_text.txt
-from XML files without running the full TTS pipeline.
+(and cleaned_items.jsonl, which xml-tts synthesizes from) from XML files
+without running the full TTS pipeline.
 
 Usage:
     python -m src.text_cleaner_cli -i input.xml -o ./output
+    python -m src.text_cleaner_cli -i input.xml -o ./output --jobs 8
 
 Extracted from xml_pipeline.py main() L133-175 logic.
 """
 
 import argparse
+import itertools
 import logging
+import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
 
-from src.dict_manager import get_content_hash
+from src.book_cache import iter_book_items
+from src.clean_cache import CleanCache, open_clean_cache
+from src.cleaned_items import CleanedItemsWriter, get_cleaned_items_path
+from src.dict_manager import get_xml_content_hash
 from src.logging_config import setup_logging
-from src.text_cleaner import clean_page_text, init_for_content
-from src.xml_parser import CHAPTER_MARKER, SECTION_MARKER, parse_book2_xml
+from src.morph_analyzer import get_tagger
+from src.text_cleaner import clean_page_text, init_for_hash
+from src.xml_parser import CHAPTER_MARKER, SECTION_MARKER, ContentItem
 
 logger = logging.getLogger(__name__)
 
+# Items sent to a worker per task (amortizes inter-process overhead)
+_JOB_CHUNKSIZE = 64
+
+# Items looked up in the cache and dispatched to the workers together
+_CLEAN_BATCH_SIZE = 4096
+
 
 def parse_args(args: list[str] | None = None) -> argparse.Namespace:
     """Parse command line arguments.
@@ -55,6 +71,21 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
         help="Output directory (default: ./output)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for cleaning (default: 1, no pool)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        dest="no_cache",
+        help="Clean every item again instead of reusing cached results",
+    )
+
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -63,7 +94,167 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
         help="Show target info without writing files",
     )
 
-    return parser.parse_args(args)
+    parsed = parser.parse_args(args)
+    if parsed.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return parsed
+
+
+def clean_item_text(item_type: str, text: str) -> str:
+    """Clean the text of one content item for cleaned_text.txt.
+
+    Args:
+        item_type: Content item type ("paragraph", "heading", ...)
+        text: Item text (may start with a chapter/section marker)
+
+    Returns:
+        Cleaned text (headings end with a single 。), or "" if nothing is left
+    """
+    # Remove markers before cleaning
+    if text.startswith(CHAPTER_MARKER):
+        text = text[len(CHAPTER_MARKER) :]
+    elif text.startswith(SECTION_MARKER):
+        text = text[len(SECTION_MARKER) :]
+
+    # Apply clean_page_text to remove URLs, parenthetical English, convert numbers, etc.
+    cleaned = clean_page_text(text)
+
+    # For headings, ensure they end with single period (。)
+    # Remove any trailing punctuation and add one period
+    if item_type == "heading" and cleaned.strip():
+        cleaned = cleaned.rstrip()
+        # Remove all trailing punctuation (、。！？)
+        while cleaned and cleaned[-1] in "、。！？":
+            cleaned = cleaned[:-1]
+        # Add single period at the end
+        cleaned = cleaned + "。"
+
+    return cleaned
+
+
+def _init_worker(content_hash: str) -> None:
+    """Load the book's reading dictionary and the MeCab tagger once per worker."""
+    init_for_hash(content_hash)
+    get_tagger()
+
+
+def _clean_item_task(task: tuple[str, str]) -> str:
+    """Worker entry point: clean_item_text() on an (item_type, text) pair."""
+    return clean_item_text(*task)
+
+
+def _clean_tasks(tasks: list[tuple[str, str]], executor: ProcessPoolExecutor | None) -> Iterator[str]:
+    """Clean (item_type, text) tasks in order, in the pool if there is one."""
+    if executor is None:
+        return map(_clean_item_task, tasks)
+    return executor.map(_clean_item_task, tasks, chunksize=_JOB_CHUNKSIZE)
+
+
+def _clean_batch(batch: list[ContentItem], executor: ProcessPoolExecutor | None, cache: CleanCache | None) -> list[str]:
+    """Clean a batch of items, taking unchanged items from the cache."""
+    if cache is None:
+        return list(_clean_tasks([(item.item_type, item.text) for item in batch], executor))
+
+    keys = [cache.key(item.item_type, item.text) for item in batch]
+    try:
+        found = cache.lookup(keys)
+    except sqlite3.Error as e:
+        logger.warning("Clean-text cache lookup failed: %s", e)
+        found = {}
+
+    missing = {key: (item.item_type, item.text) for key, item in zip(keys, batch) if key not in found}
+    cleaned = dict(zip(missing, _clean_tasks(list(missing.values()), executor)))
+    try:
+        cache.add(cleaned)
+    except sqlite3.Error as e:
+        logger.warning("Could not update clean-text cache: %s", e)
+
+    found.update(cleaned)
+    return [found[key] for key in keys]
+
+
+def iter_cleaned_items(
+    items: Iterable[ContentItem], content_hash: str, jobs: int = 1, cache: CleanCache | None = None
+) -> Iterator[tuple[ContentItem, str]]:
+    """Clean content items in order, optionally spread over a process pool.
+
+    Items are processed in batches: each batch is looked up in the cache
+    (if any) and only the items whose text, cleaning rules or reading
+    dictionary changed are cleaned.
+
+    Args:
+        items: Content items in document order
+        content_hash: Book content hash (each worker loads its dictionary once)
+        jobs: Worker processes (1 cleans in this process, which must have
+            called init_for_hash() already)
+        cache: Cleaned-text cache for the book's dictionary, or None
+
+    Yields:
+        (item, cleaned text) pairs, in item order
+    """
+    executor = None
+    if jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(content_hash,))
+        logger.info("Cleaning with %d worker processes", jobs)
+
+    try:
+        iterator = iter(items)
+        while batch := list(itertools.islice(iterator, _CLEAN_BATCH_SIZE)):
+            yield from zip(batch, _clean_batch(batch, executor, cache))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def write_cleaned_text(
+    pairs: Iterable[tuple[ContentItem, str]],
+    cleaned_text_path: Path,
+    content_hash: str,
+    chapter: int | None = None,
+) -> int:
+    """Write cleaned_text.txt and cleaned_items.jsonl in one pass.
+
+    cleaned_text.txt separates chapters with "=== Chapter N: Title ==="
+    lines and omits empty items; cleaned_items.jsonl (see cleaned_items)
+    keeps every item with its type, heading and marker for xml-tts.
+
+    Args:
+        pairs: (item, cleaned text) pairs in document order
+        cleaned_text_path: Path to cleaned_text.txt (the artifact goes next to it)
+        content_hash: Content hash of the book
+        chapter: Chapter number if the pairs cover only that chapter
+
+    Returns:
+        Number of items written
+    """
+    item_count = 0
+    with (
+        open(cleaned_text_path, "w", encoding="utf-8") as f,
+        CleanedItemsWriter(get_cleaned_items_path(cleaned_text_path), content_hash, chapter) as writer,
+    ):
+        current_chapter = None
+
+        for item, cleaned in pairs:
+            item_count += 1
+            writer.write(item, cleaned)
+
+            # Insert chapter separator when chapter changes
+            if item.chapter_number is not None and item.chapter_number != current_chapter:
+                current_chapter = item.chapter_number
+
+                # Find chapter title from heading info
+                chapter_title = "Untitled"
+                if item.item_type == "heading" and item.heading_info and item.heading_info.level == 1:
+                    chapter_title = item.heading_info.title
+
+                f.write(f"=== Chapter {current_chapter}: {chapter_title} ===\n\n")
+
+            # Skip empty content
+            if cleaned.strip():
+                f.write(cleaned)
+                f.write("\n\n")
+
+    return item_count
 
 
 def main(args: list[str] | None = None) -> None:
@@ -90,76 +281,47 @@ def main(args: list[str] | None = None) -> None:
 
     logger.info("Processing XML: %s", input_path)
 
-    # Parse XML (will raise ParseError for invalid XML)
-    content_items = parse_book2_xml(input_path)
-    logger.info("Found %d content items in XML", len(content_items))
+    # Content hash (memoized per file; will raise ParseError for invalid XML)
+    content_hash = get_xml_content_hash(input_path)
 
-    if not content_items:
+    # Stream items (from the parsed-book cache when valid) so cleaning starts immediately
+    content_items = iter_book_items(input_path)
+    first_item = next(content_items, None)
+    if first_item is None:
         logger.warning("No content items found")
         return
 
-    # Combine all content text for hash/dict loading
-    combined_text = " ".join(item.text for item in content_items)
-    init_for_content(combined_text)
+    init_for_hash(content_hash)
 
     # Generate hash-based output directory
-    content_hash = get_content_hash(combined_text)
     output_base = Path(parsed.output)
     output_dir = output_base / content_hash
 
     # dry-run: show summary and exit
     if parsed.dry_run:
+        item_count = 1 + sum(1 for _ in content_items)
         logger.info("DRY-RUN: Input: %s", input_path)
         logger.info("DRY-RUN: Output: %s", output_dir / "cleaned_text.txt")
-        logger.info("DRY-RUN: Content items: %d", len(content_items))
+        logger.info("DRY-RUN: Content items: %d", item_count)
         return
 
     output_dir.mkdir(parents=True, exist_ok=True)
     logger.info("Output directory: %s", output_dir)
 
-    # Save cleaned text
+    # Save cleaned text (and the structured artifact for xml-tts)
     cleaned_text_path = output_dir / "cleaned_text.txt"
-    with open(cleaned_text_path, "w", encoding="utf-8") as f:
-        current_chapter = None
-
-        for item in content_items:
-            # Insert chapter separator when chapter changes
-            if item.chapter_number is not None and item.chapter_number != current_chapter:
-                current_chapter = item.chapter_number
-
-                # Find chapter title from heading info
-                chapter_title = "Untitled"
-                if item.item_type == "heading" and item.heading_info and item.heading_info.level == 1:
-                    chapter_title = item.heading_info.title
-
-                f.write(f"=== Chapter {current_chapter}: {chapter_title} ===\n\n")
-
-            # Remove markers before cleaning
-            text = item.text
-            if text.startswith(CHAPTER_MARKER):
-                text = text[len(CHAPTER_MARKER) :]
-            elif text.startswith(SECTION_MARKER):
-                text = text[len(SECTION_MARKER) :]
-
-            # Apply clean_page_text to remove URLs, parenthetical English, convert numbers, etc.
-            cleaned = clean_page_text(text)
-
-            # For headings, ensure they end with single period (。)
-            # Remove any trailing punctuation and add one period
-            if item.item_type == "heading" and cleaned.strip():
-                cleaned = cleaned.rstrip()
-                # Remove all trailing punctuation (、。！？)
-                while cleaned and cleaned[-1] in "、。！？":
-                    cleaned = cleaned[:-1]
-                # Add single period at the end
-                cleaned = cleaned + "。"
-
-            # Skip empty content
-            if cleaned.strip():
-                f.write(cleaned)
-                f.write("\n\n")
+    items = itertools.chain([first_item], content_items)
+    cache = None if parsed.no_cache else open_clean_cache(content_hash)
+    item_count = write_cleaned_text(
+        iter_cleaned_items(items, content_hash, parsed.jobs, cache), cleaned_text_path, content_hash
+    )
 
+    logger.info("Processed %d content items", item_count)
+    if cache is not None:
+        logger.info("Clean-text cache: %d hits, %d misses", cache.hits, cache.misses)
+        cache.close()
     logger.info("Saved cleaned text: %s", cleaned_text_path)
+    logger.info("Saved cleaned items: %s", get_cleaned_items_path(cleaned_text_path))
 
 
 if __name__ == "__main__":
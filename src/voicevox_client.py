@@ -88,6 +88,7 @@ class VoicevoxConfig:
     pitch_scale: float = 0.0
     volume_scale: float = 1.0
     acceleration_mode: str = "AUTO"
+    cpu_num_threads: int = 0  # 0 = VOICEVOX の既定値
 
 
 class VoicevoxSynthesizer:
@@ -137,7 +138,12 @@ class VoicevoxSynthesizer:
 
         # Synthesizer を作成（acceleration_mode を指定）
         logger.info("Using acceleration mode: %s", self.config.acceleration_mode)
-        self._synthesizer = Synthesizer(ort, ojt, acceleration_mode=self.config.acceleration_mode)
+        self._synthesizer = Synthesizer(
+            ort,
+            ojt,
+            acceleration_mode=self.config.acceleration_mode,
+            cpu_num_threads=self.config.cpu_num_threads,
+        )
         logger.info("VOICEVOX Core initialized successfully")
 
     def load_model(self, vvm_path: Path | None = None) -> None:
@@ -0,0 +1,311 @@
+"""Byte-offset index of chapters and sections in book2.xml.
+
+Maps each processed <chapter>/<section> element to its byte range in the
+source XML, so that a run limited to one chapter parses only that range
+(plus the TOC for heading numbers) instead of the whole book.
+
+The index is persisted as a stat-keyed sidecar next to the XML
+(.book.xml.index.json) and rebuilt automatically when the file changes.
+"""
+
+import dataclasses
+import io
+import logging
+import mmap
+import re
+import xml.etree.ElementTree as ET
+import xml.parsers.expat
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Union
+
+from src.file_cache import get_file_signature, get_sidecar_path, is_racy, read_sidecar, write_sidecar
+from src.xml_parser import ContentItem, iter_book2_xml
+
+logger = logging.getLogger(__name__)
+
+# Bump when the index layout changes to invalidate persisted sidecars
+INDEX_VERSION = 1
+
+# End of a tag starting at a given offset (skips quoted attribute values)
+_TAG_END_PATTERN = re.compile(rb"<[^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*>")
+
+
+@dataclass
+class ElementSpan:
+    """Byte range of a <chapter> or <section> element in the source XML.
+
+    Attributes:
+        tag: Element tag ("chapter" or "section")
+        number: Value of the number attribute ("" if missing)
+        title: Value of the title attribute ("" if missing)
+        chapter_number: Chapter number in effect for the element's content
+        start: Byte offset of the start tag
+        end: Byte offset just past the end tag
+    """
+
+    tag: str
+    number: str
+    title: str
+    chapter_number: int | None
+    start: int
+    end: int
+
+
+@dataclass
+class BookIndex:
+    """Byte-offset index of a book2.xml file.
+
+    Attributes:
+        root_tag: Tag of the root element
+        prolog_end: Byte offset of the root start tag (XML declaration precedes it)
+        toc: Byte range of the top-level <toc> element, or None
+        spans: Chapter and section spans in document order
+    """
+
+    root_tag: str
+    prolog_end: int
+    toc: tuple[int, int] | None = None
+    spans: list[ElementSpan] = field(default_factory=list)
+
+    def chapter_spans(self, chapter_number: int) -> list[ElementSpan]:
+        """Get the <chapter> spans with the given chapter number."""
+        return [s for s in self.spans if s.tag == "chapter" and s.chapter_number == chapter_number]
+
+    def section_spans(self, chapter_number: int | None = None) -> list[ElementSpan]:
+        """Get <section> spans, optionally limited to one chapter."""
+        return [
+            s
+            for s in self.spans
+            if s.tag == "section" and (chapter_number is None or s.chapter_number == chapter_number)
+        ]
+
+
+def build_book_index(xml_path: Union[str, Path]) -> BookIndex:
+    """Scan an XML file once and record chapter/section byte ranges.
+
+    Only elements the parser would process are indexed: chapters and
+    sections under the root or nested in other chapters/sections.
+
+    Args:
+        xml_path: Path to the XML file
+
+    Returns:
+        BookIndex for the file
+
+    Raises:
+        FileNotFoundError: If the XML file does not exist
+        xml.etree.ElementTree.ParseError: If the XML is malformed
+    """
+    parser = xml.parsers.expat.ParserCreate()
+
+    root_tag = ""
+    prolog_end = 0
+    toc_start: int | None = None
+    toc: tuple[int, int] | None = None
+    spans: list[ElementSpan] = []
+    # Pending end offsets: (span, or None for the TOC, end tag byte index, self-closing candidate)
+    pending_ends: list[tuple[ElementSpan | None, int, bool]] = []
+
+    # Parallel stacks, as in iter_book2_xml: tag, whether children are processed, open span
+    tag_stack: list[str] = []
+    descend_stack: list[bool] = []
+    span_stack: list[ElementSpan | None] = []
+    current_chapter_number: int | None = None
+    toc_closed = False
+    # True until any event occurs after the most recent start tag
+    just_started = False
+
+    def on_start(tag: str, attrs: dict[str, str]) -> None:
+        nonlocal root_tag, prolog_end, toc_start, current_chapter_number, just_started
+        pos = parser.CurrentByteIndex
+        span: ElementSpan | None = None
+
+        if not tag_stack:
+            root_tag = tag
+            prolog_end = pos
+            descend = True
+        else:
+            is_processed = descend_stack[-1]
+            descend = is_processed and tag in ("chapter", "section")
+            if len(tag_stack) == 1 and tag == "toc" and toc_start is None:
+                toc_start = pos
+            if descend:
+                number = attrs.get("number", "")
+                if tag == "chapter" and number:
+                    try:
+                        current_chapter_number = int(number)
+                    except ValueError:
+                        current_chapter_number = None
+                span = ElementSpan(
+                    tag=tag,
+                    number=number,
+                    title=attrs.get("title", ""),
+                    chapter_number=current_chapter_number,
+                    start=pos,
+                    end=pos,
+                )
+                spans.append(span)
+
+        tag_stack.append(tag)
+        descend_stack.append(descend)
+        span_stack.append(span)
+        just_started = True
+
+    def on_end(tag: str) -> None:
+        nonlocal toc_closed, just_started
+        pos = parser.CurrentByteIndex
+        tag_stack.pop()
+        descend_stack.pop()
+        span = span_stack.pop()
+
+        if span is not None:
+            pending_ends.append((span, pos, just_started))
+        elif toc_start is not None and not toc_closed and len(tag_stack) == 1 and tag == "toc":
+            pending_ends.append((None, pos, just_started))
+            toc_closed = True
+        just_started = False
+
+    def on_data(_data: str) -> None:
+        nonlocal just_started
+        just_started = False
+
+    parser.StartElementHandler = on_start
+    parser.EndElementHandler = on_end
+    parser.CharacterDataHandler = on_data
+
+    with open(xml_path, "rb") as f:
+        try:
+            parser.ParseFile(f)
+        except xml.parsers.expat.ExpatError as e:
+            error = ET.ParseError(str(e))
+            error.code = e.code
+            error.position = (e.lineno, e.offset)
+            raise error from e
+
+        # Resolve end offsets against the raw bytes
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for span, pos, maybe_self_closing in pending_ends:
+                if maybe_self_closing and data[pos - 2 : pos] == b"/>":
+                    # Self-closing element: expat reports the offset just past it
+                    end = pos
+                else:
+                    match = _TAG_END_PATTERN.match(data, pos)
+                    end = match.end() if match else pos
+                if span is not None:
+                    span.end = end
+                elif toc_start is not None:
+                    toc = (toc_start, end)
+
+    return BookIndex(root_tag=root_tag, prolog_end=prolog_end, toc=toc, spans=spans)
+
+
+def get_index_sidecar_path(xml_path: Path) -> Path:
+    """Get the sidecar path of the persisted index for an XML file."""
+    return get_sidecar_path(xml_path, "index")
+
+
+def load_book_index(xml_path: Union[str, Path]) -> BookIndex:
+    """Load the persisted index for an XML file, building it if needed.
+
+    Args:
+        xml_path: Path to the XML file
+
+    Returns:
+        BookIndex valid for the file's current contents
+
+    Raises:
+        FileNotFoundError: If the XML file does not exist
+        xml.etree.ElementTree.ParseError: If the XML is malformed
+    """
+    xml_path = Path(xml_path)
+    resolved = str(xml_path.resolve())
+    signature = get_file_signature(resolved)
+    sidecar_path = get_index_sidecar_path(xml_path)
+
+    sidecar = read_sidecar(sidecar_path, resolved, signature)
+    if sidecar is not None and sidecar.get("version") == INDEX_VERSION:
+        try:
+            return _index_from_dict(sidecar["index"])
+        except (KeyError, TypeError, ValueError):
+            logger.debug("Ignoring malformed index sidecar: %s", sidecar_path)
+
+    index = build_book_index(xml_path)
+    logger.info("Indexed %d chapters/sections in %s", len(index.spans), xml_path.name)
+    if not is_racy(signature):
+        write_sidecar(sidecar_path, resolved, signature, {"version": INDEX_VERSION, "index": dataclasses.asdict(index)})
+    return index
+
+
+def _index_from_dict(data: dict) -> BookIndex:
+    """Rebuild a BookIndex from its persisted form."""
+    toc = data.get("toc")
+    return BookIndex(
+        root_tag=data["root_tag"],
+        prolog_end=int(data["prolog_end"]),
+        toc=(int(toc[0]), int(toc[1])) if toc else None,
+        spans=[ElementSpan(**span) for span in data["spans"]],
+    )
+
+
+def iter_book2_xml_span(xml_path: Union[str, Path], index: BookIndex, span: ElementSpan) -> Iterator[ContentItem]:
+    """Parse only one indexed element (plus the TOC) and yield its content items.
+
+    Args:
+        xml_path: Path to the XML file
+        index: Index of the file (from load_book_index)
+        span: Span of the element to parse
+
+    Yields:
+        ContentItem objects in document order, as iter_book2_xml would yield them
+    """
+    root = index.root_tag.encode("utf-8")
+    with open(xml_path, "rb") as f:
+        parts = [f.read(index.prolog_end), b"<" + root + b">"]
+        if index.toc is not None:
+            f.seek(index.toc[0])
+            parts.append(f.read(index.toc[1] - index.toc[0]))
+        f.seek(span.start)
+        parts.append(f.read(span.end - span.start))
+        parts.append(b"</" + root + b">")
+
+    for item in iter_book2_xml(io.BytesIO(b"".join(parts))):
+        # Sections (and unnumbered chapters) inherit the enclosing chapter number
+        if item.chapter_number is None and span.chapter_number is not None:
+            item = dataclasses.replace(item, chapter_number=span.chapter_number)
+        yield item
+
+
+def iter_book2_xml_chapter(xml_path: Union[str, Path], chapter_number: int) -> Iterator[ContentItem]:
+    """Yield the content items of one chapter, parsing only its byte range.
+
+    Yields the same items as filtering iter_book2_xml() by chapter_number for
+    everything inside the <chapter> element. Falls back to that full scan
+    when the book has no indexed <chapter> with the number (e.g. books
+    structured with <heading> elements only).
+
+    Args:
+        xml_path: Path to the XML file
+        chapter_number: Chapter number to extract
+
+    Yields:
+        ContentItem objects of the chapter in document order
+
+    Raises:
+        FileNotFoundError: If the XML file does not exist
+        xml.etree.ElementTree.ParseError: If the XML is malformed
+    """
+    index = load_book_index(xml_path)
+    spans = index.chapter_spans(chapter_number)
+    if not spans:
+        logger.debug("Chapter %d not indexed, scanning whole book", chapter_number)
+        yield from (item for item in iter_book2_xml(xml_path) if item.chapter_number == chapter_number)
+        return
+
+    covered_until = -1
+    for span in spans:
+        # Skip chapters nested in an already parsed chapter
+        if span.start < covered_until:
+            continue
+        covered_until = span.end
+        yield from iter_book2_xml_span(xml_path, index, span)
@@ -8,7 +8,7 @@ Skips <toc>, <front-matter>, and <metadata> sections.
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Iterator, Union
 
 # Marker constants for chapter and section sound effects
 # Using Unicode private use area characters to avoid text cleaner interference
@@ -105,133 +105,182 @@ def parse_book2_xml(xml_path: Union[str, Path]) -> list[ContentItem]:
         FileNotFoundError: If the XML file does not exist
         xml.etree.ElementTree.ParseError: If the XML is malformed
     """
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+    return list(iter_book2_xml(xml_path))
 
-    # Build heading number mapping from TOC
+
+def iter_book2_xml(xml_path: Union[str, Path, BinaryIO]) -> Iterator[ContentItem]:
+    """Stream content items from book2.xml in document order.
+
+    Streaming variant of parse_book2_xml() built on ET.iterparse. Processed
+    elements are detached from the tree as soon as they have been consumed,
+    so memory stays flat regardless of book size and callers can start
+    working on the first items before the whole file has been read.
+
+    The TOC is used for heading number lookup, so it must appear before the
+    body content (as it does in book2.xml).
+
+    Args:
+        xml_path: Path to the XML file (string or pathlib.Path), or a binary file object
+
+    Yields:
+        ContentItem objects in document order
+
+    Raises:
+        FileNotFoundError: If the XML file does not exist
+        xml.etree.ElementTree.ParseError: If the XML is malformed
+    """
     heading_number_map: dict[str, str] = {}
-    toc = root.find("toc")
-    if toc is not None:
-        for entry in toc.findall("entry"):
-            title = entry.get("title", "")
-            number = entry.get("number", "")
-            if title and number:
-                heading_number_map[title] = number
-
-    content_items: list[ContentItem] = []
     current_chapter_number: int | None = None
 
-    def process_element(elem: ET.Element) -> None:
-        """Recursively process an element and its children."""
-        nonlocal current_chapter_number
-
-        # Skip metadata, toc, and front-matter sections
-        if elem.tag in ("metadata", "toc", "front-matter"):
-            return
-
-        # Process chapter (as level 1 heading)
-        if elem.tag == "chapter":
-            title = elem.get("title", "")
-            number = elem.get("number", "")
-            # Track current chapter number
-            if number:
-                try:
-                    current_chapter_number = int(number)
-                except ValueError:
-                    current_chapter_number = None
-            if title:
-                formatted_text = format_heading_text(1, number, title) if number else title
-                marked_text = CHAPTER_MARKER + formatted_text
-                heading_info = HeadingInfo(level=1, number=number, title=title, read_aloud=True)
-                content_items.append(
-                    ContentItem(
-                        item_type="heading",
-                        text=marked_text,
-                        heading_info=heading_info,
-                        chapter_number=current_chapter_number,
-                    )
-                )
-            # Process children of chapter
-            for child in elem:
-                process_element(child)
-
-        # Process section (as level 2 heading)
-        elif elem.tag == "section":
-            title = elem.get("title", "")
-            number = elem.get("number", "")
-            if title:
-                formatted_text = format_heading_text(2, number, title) if number else title
-                marked_text = SECTION_MARKER + formatted_text
-                heading_info = HeadingInfo(level=2, number=number, title=title, read_aloud=True)
-                content_items.append(
-                    ContentItem(
-                        item_type="heading",
-                        text=marked_text,
-                        heading_info=heading_info,
-                        chapter_number=current_chapter_number,
-                    )
+    # Parallel stacks of open elements and whether their children are processed.
+    # Children are processed only under the root and under <chapter>/<section>,
+    # matching the recursive traversal of the tree-based parser.
+    elem_stack: list[ET.Element] = []
+    descend_stack: list[bool] = []
+
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            if not elem_stack:
+                # Root element: all direct children are candidates
+                elem_stack.append(elem)
+                descend_stack.append(True)
+                continue
+
+            is_processed = descend_stack[-1]
+            descend = is_processed and elem.tag in ("chapter", "section")
+
+            # Chapter/section headings come from attributes, which are
+            # available at start, and must precede their children
+            if descend and elem.tag == "chapter":
+                number = elem.get("number", "")
+                # Track current chapter number
+                if number:
+                    try:
+                        current_chapter_number = int(number)
+                    except ValueError:
+                        current_chapter_number = None
+                item = _container_heading_item(elem, 1, current_chapter_number)
+                if item is not None:
+                    yield item
+            elif descend and elem.tag == "section":
+                item = _container_heading_item(elem, 2, current_chapter_number)
+                if item is not None:
+                    yield item
+
+            elem_stack.append(elem)
+            descend_stack.append(descend)
+            continue
+
+        # "end" event
+        elem_stack.pop()
+        descend_stack.pop()
+        if not elem_stack:
+            # Root closed
+            elem.clear()
+            continue
+
+        if not descend_stack[-1]:
+            # Part of a skipped or leaf subtree; released with its ancestor
+            continue
+
+        if elem.tag == "toc" and len(elem_stack) == 1:
+            # Build heading number mapping from TOC
+            for entry in elem.findall("entry"):
+                title = entry.get("title", "")
+                number = entry.get("number", "")
+                if title and number:
+                    heading_number_map[title] = number
+        else:
+            yield from _leaf_items(elem, heading_number_map, current_chapter_number)
+
+        # Release the processed element (it is the parent's only remaining child)
+        elem.clear()
+        elem_stack[-1].remove(elem)
+
+
+def _container_heading_item(elem: ET.Element, level: int, chapter_number: int | None) -> ContentItem | None:
+    """Build the heading item for a <chapter> (level 1) or <section> (level 2) element.
+
+    Args:
+        elem: <chapter> or <section> element
+        level: Heading level (1=chapter, 2=section)
+        chapter_number: Current chapter number
+
+    Returns:
+        Heading ContentItem, or None if the element has no title
+    """
+    title = elem.get("title", "")
+    if not title:
+        return None
+    number = elem.get("number", "")
+    formatted_text = format_heading_text(level, number, title) if number else title
+    marker = CHAPTER_MARKER if level == 1 else SECTION_MARKER
+    heading_info = HeadingInfo(level=level, number=number, title=title, read_aloud=True)
+    return ContentItem(
+        item_type="heading",
+        text=marker + formatted_text,
+        heading_info=heading_info,
+        chapter_number=chapter_number,
+    )
+
+
+def _leaf_items(
+    elem: ET.Element,
+    heading_number_map: dict[str, str],
+    chapter_number: int | None,
+) -> Iterator[ContentItem]:
+    """Yield content items for a fully parsed <heading>, <paragraph> or <list> element.
+
+    Args:
+        elem: Completed XML element
+        heading_number_map: Heading title to number mapping from the TOC
+        chapter_number: Current chapter number
+
+    Yields:
+        ContentItem objects for the element (nothing for other tags)
+    """
+    # Process headings
+    if elem.tag == "heading":
+        if _should_read_aloud(elem) and elem.text:
+            text = elem.text.strip()
+            if text:
+                level = int(elem.get("level", "1"))
+                # Look up number from TOC mapping
+                number = heading_number_map.get(text, "")
+                # Format heading text
+                if number:
+                    formatted_text = format_heading_text(level, number, text)
+                else:
+                    formatted_text = text
+                marker = CHAPTER_MARKER if level == 1 else SECTION_MARKER
+                heading_info = HeadingInfo(level=level, number=number, title=text, read_aloud=True)
+                yield ContentItem(
+                    item_type="heading",
+                    text=marker + formatted_text,
+                    heading_info=heading_info,
+                    chapter_number=chapter_number,
                 )
-            # Process children of section
-            for child in elem:
-                process_element(child)
-
-        # Process headings
-        elif elem.tag == "heading":
-            if _should_read_aloud(elem) and elem.text:
-                text = elem.text.strip()
-                if text:
-                    level = int(elem.get("level", "1"))
-                    # Look up number from TOC mapping
-                    number = heading_number_map.get(text, "")
-                    # Format heading text
-                    if number:
-                        formatted_text = format_heading_text(level, number, text)
-                    else:
-                        formatted_text = text
-                    marker = CHAPTER_MARKER if level == 1 else SECTION_MARKER
-                    marked_text = marker + formatted_text
-                    heading_info = HeadingInfo(level=level, number=number, title=text, read_aloud=True)
-                    content_items.append(
-                        ContentItem(
-                            item_type="heading",
-                            text=marked_text,
-                            heading_info=heading_info,
-                            chapter_number=current_chapter_number,
-                        )
-                    )
 
-        # Process paragraphs
-        elif elem.tag == "paragraph":
-            if _should_read_aloud(elem) and elem.text:
-                text = elem.text.strip()
+    # Process paragraphs
+    elif elem.tag == "paragraph":
+        if _should_read_aloud(elem) and elem.text:
+            text = elem.text.strip()
+            if text:
+                yield ContentItem(item_type="paragraph", text=text, heading_info=None, chapter_number=chapter_number)
+
+    # Process lists
+    elif elem.tag == "list":
+        for item in elem.findall("item"):
+            if item.text:
+                text = item.text.strip()
                 if text:
-                    content_items.append(
-                        ContentItem(
-                            item_type="paragraph", text=text, heading_info=None, chapter_number=current_chapter_number
-                        )
+                    yield ContentItem(
+                        item_type="list_item",
+                        text=text,
+                        heading_info=None,
+                        chapter_number=chapter_number,
                     )
 
-        # Process lists
-        elif elem.tag == "list":
-            for item in elem.findall("item"):
-                if item.text:
-                    text = item.text.strip()
-                    if text:
-                        content_items.append(
-                            ContentItem(
-                                item_type="list_item",
-                                text=text,
-                                heading_info=None,
-                                chapter_number=current_chapter_number,
-                            )
-                        )
-
-    # Process all children of the root element
-    for elem in root:
-        process_element(elem)
-
-    return content_items
-
 
 def _should_read_aloud(elem: ET.Element) -> bool:
     """Check if element should be read aloud based on readAloud attribute.
@@ -5,16 +5,21 @@ from book2.xml files using the VOICEVOX synthesizer.
 
 Integration with existing components:
 - xml_parser: Parse book2.xml and extract content items
-- text_cleaner: Clean text for TTS consumption
+- text_cleaner_cli: Clean text once into cleaned_text.txt and cleaned_items.jsonl
+- cleaned_items: Stream the pre-cleaned items into synthesis
 - pipeline: Generate audio files
 - voicevox_client: VOICEVOX synthesis
+- synthesis_pool: Parallel synthesis with --workers N
 """
 
 import argparse
 import atexit
 import logging
+from contextlib import ExitStack
 from pathlib import Path
 
+from src.book_cache import load_book_items
+
 # Re-exports from split modules (for backward compatibility)
 from src.chapter_processor import (  # noqa: F401
     load_sound,
@@ -22,7 +27,14 @@ from src.chapter_processor import (  # noqa: F401
     process_content,
     sanitize_filename,
 )
-from src.dict_manager import get_content_hash
+from src.clean_cache import open_clean_cache
+from src.cleaned_items import (
+    get_cleaned_items_path,
+    get_cleaned_text_path,
+    has_cleaned_items,
+    iter_cleaned_items_file,
+)
+from src.dict_manager import get_streaming_content_hash, get_xml_content_hash
 from src.logging_config import setup_logging
 from src.process_manager import (  # noqa: F401
     cleanup_pid_file,
@@ -30,7 +42,9 @@ from src.process_manager import (  # noqa: F401
     kill_existing_process,
     write_pid_file,
 )
-from src.text_cleaner import clean_page_text, init_for_content, split_text_into_chunks  # noqa: F401
+from src.synthesis_pool import SynthesisPool
+from src.text_cleaner import clean_page_text, init_for_content, init_for_hash, split_text_into_chunks  # noqa: F401
+from src.text_cleaner_cli import iter_cleaned_items, write_cleaned_text
 from src.voicevox_client import (  # noqa: F401
     VoicevoxConfig,
     VoicevoxSynthesizer,
@@ -39,6 +53,7 @@ from src.voicevox_client import (  # noqa: F401
     normalize_audio,
     save_audio,
 )
+from src.xml_index import iter_book2_xml_chapter
 from src.xml_parser import CHAPTER_MARKER, SECTION_MARKER, ContentItem, parse_book2_xml  # noqa: F401
 
 logger = logging.getLogger(__name__)
@@ -76,8 +91,26 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
         "--voicevox-dir", default="./voicevox_core", help="VOICEVOX Core directory (default: ./voicevox_core)"
     )
     parser.add_argument("--max-chunk-chars", type=int, default=500, help="Max characters per TTS chunk (default: 500)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Synthesis worker processes, each with its own VOICEVOX instance (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-seconds",
+        type=float,
+        default=None,
+        help="Pack TTS chunks to at most this many seconds of estimated audio (default: split by characters only)",
+    )
     parser.add_argument("--start-page", type=int, default=1, help="Start page number (default: 1)")
     parser.add_argument("--end-page", type=int, default=None, help="End page number (default: last page)")
+    parser.add_argument(
+        "--chapter",
+        type=int,
+        default=None,
+        help="Only process this chapter number, parsing just its range of the XML (default: all chapters)",
+    )
     parser.add_argument(
         "--cleaned-text",
         default=None,
@@ -139,18 +172,25 @@ def main(args: list[str] | None = None) -> None:
     logger.info("Reading XML: %s", input_path)
 
     # Parse XML (will raise ParseError for invalid XML)
-    content_items = parse_book2_xml(input_path)
-    logger.info("Found %d content items in XML", len(content_items))
+    if parsed.chapter is not None:
+        # Parse only the chapter's byte range; hash covers the whole book
+        content_items = list(iter_book2_xml_chapter(input_path, parsed.chapter))
+        logger.info("Found %d content items in chapter %d", len(content_items), parsed.chapter)
+    else:
+        content_items = load_book_items(input_path)
+        logger.info("Found %d content items in XML", len(content_items))
 
     if not content_items:
         logger.warning("No content items found")
         return
 
-    # Combine all content text for hash/dict loading
-    combined_text = " ".join(item.text for item in content_items)
+    # Hash content text for dict loading (streamed, no combined copy)
+    if parsed.chapter is not None:
+        content_hash = get_xml_content_hash(input_path)
+    else:
+        content_hash = get_streaming_content_hash(item.text for item in content_items)
 
     # Generate hash-based output directory
-    content_hash = get_content_hash(combined_text)
     output_base = Path(parsed.output)
     output_dir = output_base / content_hash
 
@@ -165,7 +205,6 @@ def main(args: list[str] | None = None) -> None:
         logger.info("DRY-RUN: Estimated TTS chunks: ~%d", est_chunks)
         return
 
-    init_for_content(combined_text)
     output_dir.mkdir(parents=True, exist_ok=True)
     logger.info("Output directory: %s", output_dir)
 
@@ -177,49 +216,34 @@ def main(args: list[str] | None = None) -> None:
             raise FileNotFoundError(f"Cleaned text file not found: {parsed.cleaned_text}")
         logger.info("Using existing cleaned text: %s", cleaned_text_path)
     else:
-        # Save cleaned text
-        cleaned_text_path = output_dir / "cleaned_text.txt"
-        with open(cleaned_text_path, "w", encoding="utf-8") as f:
-            current_chapter = None
-
-            for item in content_items:
-                # Insert chapter separator when chapter changes
-                if item.chapter_number is not None and item.chapter_number != current_chapter:
-                    current_chapter = item.chapter_number
-
-                    # Find chapter title from heading info
-                    chapter_title = "Untitled"
-                    if item.item_type == "heading" and item.heading_info and item.heading_info.level == 1:
-                        chapter_title = item.heading_info.title
-
-                    f.write(f"=== Chapter {current_chapter}: {chapter_title} ===\n\n")
-
-                # Remove markers before cleaning
-                text = item.text
-                if text.startswith(CHAPTER_MARKER):
-                    text = text[len(CHAPTER_MARKER) :]
-                elif text.startswith(SECTION_MARKER):
-                    text = text[len(SECTION_MARKER) :]
-
-                # Apply clean_page_text to remove URLs, parenthetical English, convert numbers, etc.
-                cleaned = clean_page_text(text)
-
-                # For headings, ensure they end with single period (。)
-                # Remove any trailing punctuation and add one period
-                if item.item_type == "heading" and cleaned.strip():
-                    cleaned = cleaned.rstrip()
-                    # Remove all trailing punctuation (、。！？)
-                    while cleaned and cleaned[-1] in "、。！？":
-                        cleaned = cleaned[:-1]
-                    # Add single period at the end
-                    cleaned = cleaned + "。"
-
-                # Skip empty content
-                if cleaned.strip():
-                    f.write(cleaned)
-                    f.write("\n\n")
-
-        logger.info("Saved cleaned text: %s", cleaned_text_path)
+        # Prefer the whole book's clean-text output; chapter runs write their own files
+        cleaned_text_path = get_cleaned_text_path(output_dir)
+        if not has_cleaned_items(get_cleaned_items_path(cleaned_text_path), content_hash, parsed.chapter):
+            cleaned_text_path = get_cleaned_text_path(output_dir, parsed.chapter)
+        if has_cleaned_items(get_cleaned_items_path(cleaned_text_path), content_hash, parsed.chapter):
+            # clean-text output is current (same book, dictionary and cleaning rules)
+            logger.info("Reusing cleaned text: %s", cleaned_text_path)
+        else:
+            # Clean once: cleaned_text.txt for reading, cleaned_items.jsonl for synthesis
+            init_for_hash(content_hash)
+            cache = open_clean_cache(content_hash)
+            write_cleaned_text(
+                iter_cleaned_items(content_items, content_hash, cache=cache),
+                cleaned_text_path,
+                content_hash,
+                chapter=parsed.chapter,
+            )
+            if cache is not None:
+                logger.info("Clean-text cache: %d hits, %d misses", cache.hits, cache.misses)
+                cache.close()
+            logger.info("Saved cleaned text: %s", cleaned_text_path)
+
+    # Synthesize from the structured artifact next to cleaned_text.txt
+    cleaned_items_path = get_cleaned_items_path(cleaned_text_path)
+    use_cleaned_items = has_cleaned_items(cleaned_items_path, content_hash, parsed.chapter)
+    if not use_cleaned_items:
+        logger.warning("No cleaned items for this book at %s; cleaning text during synthesis", cleaned_items_path)
+        init_for_hash(content_hash)
 
     # Load sound effects if specified
     chapter_sound = None
@@ -269,20 +293,27 @@ def main(args: list[str] | None = None) -> None:
         volume_scale=1.0,
         acceleration_mode=acceleration_mode,
     )
-    synthesizer = VoicevoxSynthesizer(config)
-    synthesizer.initialize()
-    synthesizer.load_model_for_style_id(parsed.style_id)
-    logger.info("VOICEVOX initialized (style_id=%d, acceleration_mode=%s)", parsed.style_id, acceleration_mode)
-
-    # Process content and generate audio
-    process_chapters(
-        content_items,
-        synthesizer,
-        output_dir,
-        parsed,
-        chapter_sound=chapter_sound,
-        section_sound=section_sound,
-    )
+    with ExitStack() as stack:
+        synthesizer: VoicevoxSynthesizer | SynthesisPool
+        if parsed.workers > 1:
+            # Each worker initializes VOICEVOX itself; nothing is loaded here
+            synthesizer = stack.enter_context(SynthesisPool(config, parsed.workers))
+        else:
+            synthesizer = VoicevoxSynthesizer(config)
+            synthesizer.initialize()
+            synthesizer.load_model_for_style_id(parsed.style_id)
+        logger.info("VOICEVOX initialized (style_id=%d, acceleration_mode=%s)", parsed.style_id, acceleration_mode)
+
+        # Process content and generate audio
+        process_chapters(
+            iter_cleaned_items_file(cleaned_items_path, parsed.chapter) if use_cleaned_items else content_items,
+            synthesizer,
+            output_dir,
+            parsed,
+            chapter_sound=chapter_sound,
+            section_sound=section_sound,
+            cleaned=use_cleaned_items,
+        )
     logger.info("Audio generation complete")
 
 
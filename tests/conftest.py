@@ -0,0 +1,32 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from src import dict_manager, xml_index
+
+FIXTURES_DIR = (Path(__file__).parent / "fixtures").resolve()
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    """キャッシュ・辞書などを実データディレクトリ（data/）に書き込まないようにする"""
+    monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+
+
+@pytest.fixture(autouse=True)
+def isolated_fixture_sidecars(tmp_path_factory, monkeypatch):
+    """tests/fixtures 内の XML のサイドカーを一時ディレクトリに書き込み、ソースツリーを変更しないようにする"""
+    sidecar_dir = tmp_path_factory.mktemp("sidecars")
+
+    for module, name in ((dict_manager, "get_hash_sidecar_path"), (xml_index, "get_index_sidecar_path")):
+        original = getattr(module, name)
+
+        def redirect(xml_path, original=original):
+            sidecar_path = original(xml_path)
+            if Path(xml_path).resolve().parent == FIXTURES_DIR:
+                return sidecar_dir / sidecar_path.name
+            return sidecar_path
+
+        monkeypatch.setattr(module, name, redirect)
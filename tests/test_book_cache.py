@@ -0,0 +1,184 @@
+"""Tests for the persistent parsed-book cache.
+
+Target functions:
+- src/book_cache.py::iter_book_items()
+- src/book_cache.py::load_book_items()
+"""
+
+import os
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src import book_cache
+from src.book_cache import BOOK_CACHE_FILENAME, get_book_cache_path, iter_book_items, load_book_items
+from src.dict_manager import get_hash_sidecar_path, get_xml_content_hash
+from src.xml_parser import parse_book2_xml
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _age(path: Path) -> None:
+    """Move a file's mtime out of the racy window."""
+    old = time.time_ns() - 60 * 1_000_000_000
+    os.utime(path, ns=(old, old))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Private data dir and empty hash memo for every test."""
+    monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+    monkeypatch.setattr("src.dict_manager._XML_HASH_MEMO", {})
+
+
+@pytest.fixture
+def book_xml(tmp_path):
+    """Copy of the sample book, aged so that it may be cached."""
+    path = tmp_path / "book.xml"
+    path.write_bytes((FIXTURES_DIR / "dict_test_book.xml").read_bytes())
+    _age(path)
+    return path
+
+
+class TestLoadBookItems:
+    """load_book_items() のキャッシュ動作テスト"""
+
+    def test_miss_matches_parser(self, book_xml):
+        """初回は通常のパース結果と同一"""
+        assert load_book_items(book_xml) == parse_book2_xml(book_xml)
+
+    def test_cache_written_under_content_hash(self, book_xml, tmp_path):
+        """data/<hash>/ 配下にキャッシュが保存される"""
+        load_book_items(book_xml)
+
+        content_hash = get_xml_content_hash(book_xml)
+        assert get_book_cache_path(content_hash) == tmp_path / "data" / content_hash / BOOK_CACHE_FILENAME
+        assert get_book_cache_path(content_hash).exists()
+
+    def test_hit_skips_parser(self, book_xml):
+        """2回目以降は XML をパースせずキャッシュから復元する"""
+        expected = load_book_items(book_xml)
+
+        with patch.object(book_cache, "iter_book2_xml") as mock_iter:
+            items = load_book_items(book_xml)
+            mock_iter.assert_not_called()
+
+        assert items == expected
+        assert any(item.heading_info is not None for item in items)
+        assert any(item.chapter_number is not None for item in items)
+
+    def test_hash_memoized_by_miss(self, book_xml, monkeypatch):
+        """キャッシュ作成時にコンテンツハッシュも記録される"""
+        load_book_items(book_xml)
+        assert get_hash_sidecar_path(book_xml).exists()
+
+        monkeypatch.setattr("src.dict_manager._XML_HASH_MEMO", {})
+        with patch("src.dict_manager._compute_xml_content_hash") as mock_compute:
+            get_xml_content_hash(book_xml)
+            mock_compute.assert_not_called()
+
+    def test_hash_lookup_populates_cache(self, book_xml):
+        """ハッシュ計算のためのパースでもキャッシュが作られる"""
+        content_hash = get_xml_content_hash(book_xml)
+        assert get_book_cache_path(content_hash).exists()
+
+    def test_invalidated_on_change(self, book_xml):
+        """ソース変更後は再パースされる"""
+        load_book_items(book_xml)
+
+        book_xml.write_text(
+            book_xml.read_text(encoding="utf-8").replace("</book>", "<paragraph>追加</paragraph></book>")
+        )
+        _age(book_xml)
+
+        items = load_book_items(book_xml)
+        assert items == parse_book2_xml(book_xml)
+        assert items[-1].text == "追加"
+
+    def test_fresh_file_not_cached(self, tmp_path):
+        """更新直後のファイルはキャッシュしない"""
+        path = tmp_path / "fresh.xml"
+        path.write_bytes((FIXTURES_DIR / "dict_test_book.xml").read_bytes())
+
+        assert load_book_items(path) == parse_book2_xml(path)
+        assert not (tmp_path / "data").exists() or not list((tmp_path / "data").rglob(BOOK_CACHE_FILENAME))
+
+    def test_stale_cache_header_ignored(self, book_xml):
+        """ヘッダが一致しないキャッシュは使わない"""
+        content_hash = get_xml_content_hash(book_xml)
+        get_book_cache_path(content_hash).write_bytes(b"garbage")
+
+        assert load_book_items(book_xml) == parse_book2_xml(book_xml)
+
+    def test_unwritable_data_dir(self, book_xml, tmp_path, monkeypatch):
+        """データディレクトリに書けなくてもパース結果は返る"""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", blocker / "data")
+
+        assert load_book_items(book_xml) == parse_book2_xml(book_xml)
+
+    def test_batches_span_multiple_records(self, tmp_path, monkeypatch):
+        """バッチ境界をまたぐ場合も順序が保たれる"""
+        monkeypatch.setattr(book_cache, "_BATCH_SIZE", 2)
+        paragraphs = "".join(f"<paragraph>段落{i}</paragraph>" for i in range(7))
+        path = tmp_path / "many.xml"
+        path.write_text(f'<book><chapter number="1" title="t">{paragraphs}</chapter></book>', encoding="utf-8")
+        _age(path)
+
+        expected = load_book_items(path)
+        with patch.object(book_cache, "iter_book2_xml") as mock_iter:
+            assert load_book_items(path) == expected
+            mock_iter.assert_not_called()
+
+    @pytest.mark.parametrize("damage", ["truncate", "corrupt"])
+    def test_damaged_cache_reparsed_and_rewritten(self, tmp_path, monkeypatch, caplog, damage):
+        """途中で壊れたキャッシュは削除して再パースし、重複なく返して書き直す"""
+        monkeypatch.setattr(book_cache, "_BATCH_SIZE", 2)
+        paragraphs = "".join(f"<paragraph>段落{i}</paragraph>" for i in range(7))
+        path = tmp_path / "many.xml"
+        path.write_text(f'<book><chapter number="1" title="t">{paragraphs}</chapter></book>', encoding="utf-8")
+        _age(path)
+
+        expected = load_book_items(path)
+        cache_path = get_book_cache_path(get_xml_content_hash(path))
+        data = cache_path.read_bytes()
+        cache_path.write_bytes(data[: len(data) // 2] if damage == "truncate" else data[:-8] + b"\xff" * 8)
+
+        assert load_book_items(path) == expected
+        assert "Discarding parsed-book cache" in caplog.text
+        with patch.object(book_cache, "iter_book2_xml") as mock_iter:
+            assert load_book_items(path) == expected
+            mock_iter.assert_not_called()
+
+
+class TestIterBookItems:
+    """iter_book_items() のストリーミング動作テスト"""
+
+    def test_partial_consumption_not_cached(self, book_xml, tmp_path):
+        """途中で打ち切ったストリームはキャッシュしない"""
+        items = iter_book_items(book_xml)
+        next(items)
+        items.close()
+
+        data_dir = tmp_path / "data"
+        assert not list(data_dir.rglob(BOOK_CACHE_FILENAME))
+        assert not list(data_dir.glob("*.tmp"))
+
+    def test_parse_error_propagates(self, tmp_path):
+        """不正な XML は ParseError を送出し一時ファイルを残さない"""
+        path = tmp_path / "broken.xml"
+        path.write_text("<book><paragraph>unclosed</book>", encoding="utf-8")
+        _age(path)
+
+        with pytest.raises(ET.ParseError):
+            list(iter_book_items(path))
+        assert not list((tmp_path / "data").glob("*.tmp"))
+
+    def test_missing_file(self, tmp_path):
+        """存在しないファイルは FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            list(iter_book_items(tmp_path / "missing.xml"))
@@ -0,0 +1,150 @@
+"""Tests for duration-aware TTS chunk planning.
+
+Target functions:
+- src/chunk_planner.py::estimate_morae()
+- src/chunk_planner.py::estimate_seconds()
+- src/chunk_planner.py::ChunkPlanner
+- src/chapter_processor.py::process_chapters() (--chunk-seconds)
+"""
+
+import argparse
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.chapter_processor import get_chunk_planner, process_chapters
+from src.chunk_planner import MORAE_PER_SECOND, PAUSE_SECONDS, ChunkPlanner, estimate_morae, estimate_seconds
+from src.xml_parser import ContentItem
+
+
+def _chunks(planner: ChunkPlanner, text: str) -> list[str]:
+    return [text[start:end] for start, end in planner.spans(text)]
+
+
+class TestEstimate:
+    """モーラ数・再生時間の推定のテスト"""
+
+    def test_small_kana_merge(self):
+        """拗音の小書き仮名は直前の仮名と 1 モーラ、促音・撥音・長音は 1 モーラ"""
+        assert estimate_morae("きょう") == 2
+        assert estimate_morae("ファイル") == 3
+        assert estimate_morae("がっこう") == 4
+        assert estimate_morae("コーヒー") == 4
+        assert estimate_morae("ほん") == 2
+
+    def test_kanji_and_alphanumerics(self):
+        """未変換の漢字・英数字は 1 文字 2 モーラ、記号は数えない"""
+        assert estimate_morae("漢字") == 4
+        assert estimate_morae("AI") == 4
+        assert estimate_morae("「」（）") == 0
+
+    def test_seconds_with_pauses_and_speed(self):
+        """句読点ごとに間を加え、話速で割る"""
+        expected = 6 / MORAE_PER_SECOND + 2 * PAUSE_SECONDS
+        assert estimate_seconds("はい、そうです。") == pytest.approx(expected)
+        assert estimate_seconds("はい、そうです。", speed=2.0) == pytest.approx(expected / 2)
+
+
+class TestChunkPlanner:
+    """ChunkPlanner のテスト"""
+
+    def test_balanced_chunks(self):
+        """貪欲に詰めると端数が出る場合も、推定時間の揃ったチャンクに分ける"""
+        text = "あいうえおかきくけこ。" * 4  # 1 文約 1.6 秒
+        chunks = _chunks(ChunkPlanner(target_seconds=5.0), text)
+
+        # 貪欲法なら 3 文 + 1 文になる
+        assert chunks == ["あいうえおかきくけこ。" * 2] * 2
+
+    def test_kanji_dense_text_gets_shorter_chunks(self):
+        """漢字の多い文は同じ文字数でも推定時間が長く、チャンクが短くなる"""
+        kana = "あいうえおかきくけこ。" * 10
+        kanji = "漢字熟語多用文章例示。" * 10
+        planner = ChunkPlanner(target_seconds=8.0)
+
+        assert len(_chunks(planner, kanji)) > len(_chunks(planner, kana))
+        assert all(estimate_seconds(chunk) <= 8.0 for chunk in _chunks(planner, kanji))
+
+    def test_max_chars_is_hard_limit(self):
+        """推定時間に余裕があっても max_chars を超えない"""
+        text = "はい。" * 50
+        chunks = _chunks(ChunkPlanner(target_seconds=100.0, max_chars=20), text)
+
+        assert all(len(chunk) <= 20 for chunk in chunks)
+        assert "".join(chunks) == text
+
+    def test_overlong_sentence_is_split(self):
+        """1 文で目標時間を超える文は読点などで分割する"""
+        text = "ながいせつめいがつづきます、" * 6 + "おわり。"
+        chunks = _chunks(ChunkPlanner(target_seconds=3.0), text)
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == text
+
+    def test_overlong_sentence_parts_fit_target(self):
+        """密度で分割した部分も目標時間を超えない"""
+        text = "漢字熟語あいうえお、" * 3 + "漢字熟語多用文章例示漢字熟語多用文章例示。"
+        planner = ChunkPlanner(target_seconds=2.0)
+
+        assert all(estimate_seconds(chunk) <= 2.0 for chunk in _chunks(planner, text))
+        assert "".join(_chunks(planner, text)) == text
+
+    def test_line_separated_text(self):
+        """改行区切りのテキストは改行の間も含めて目標時間に収める"""
+        text = "\n".join(["あいうえお"] * 200)
+        chunks = _chunks(ChunkPlanner(target_seconds=30.0), text)
+
+        assert all(estimate_seconds(chunk) <= 30.0 for chunk in chunks)
+        assert "\n".join(chunks) == text
+
+    def test_spans_within_buffer(self):
+        """バッファ内の範囲を空白を除いたオフセットで返す"""
+        buffer = "XX はい。\nそうです。 YY"
+        planner = ChunkPlanner(target_seconds=30.0)
+
+        assert [buffer[start:end] for start, end in planner.spans(buffer, 2, 12)] == ["はい。\nそうです。"]
+        assert planner.spans("   ") == []
+
+    def test_invalid_arguments(self):
+        """目標時間・最大文字数・話速が正でなければエラー"""
+        with pytest.raises(ValueError):
+            ChunkPlanner(target_seconds=0)
+        with pytest.raises(ValueError):
+            ChunkPlanner(max_chars=0)
+        with pytest.raises(ValueError):
+            ChunkPlanner(speed=0)
+
+
+class TestProcessChaptersChunkSeconds:
+    """--chunk-seconds 指定時の音声生成テスト"""
+
+    def test_planner_only_when_requested(self):
+        """chunk_seconds が正の数のときだけ ChunkPlanner を使う"""
+        assert get_chunk_planner(argparse.Namespace(max_chunk_chars=500, speed=1.0)) is None
+        assert get_chunk_planner(argparse.Namespace(chunk_seconds=None, max_chunk_chars=500, speed=1.0)) is None
+        planner = get_chunk_planner(argparse.Namespace(chunk_seconds=20.0, max_chunk_chars=300, speed=1.5))
+        assert isinstance(planner, ChunkPlanner)
+        assert (planner.target_seconds, planner.max_chars, planner.speed) == (20.0, 300, 1.5)
+
+    def test_chunks_by_estimated_seconds(self, tmp_path):
+        """文字数上限に収まるテキストも推定時間で分割して合成する"""
+        text = "あいうえおかきくけこ。" * 4
+        args = argparse.Namespace(max_chunk_chars=500, style_id=13, speed=1.0, chapter=None, chunk_seconds=4.0)
+
+        with (
+            patch("src.chapter_processor.clean_page_text", side_effect=lambda t: t),
+            patch("src.chapter_processor.generate_audio") as mock_gen,
+            patch("src.chapter_processor.save_audio"),
+        ):
+            mock_gen.return_value = (np.zeros(100, dtype=np.float32), 24000)
+            process_chapters(
+                [ContentItem("paragraph", text, None, None)],
+                synthesizer=object(),
+                output_dir=tmp_path,
+                args=args,
+            )
+
+        chunks = [call.kwargs["text"] for call in mock_gen.call_args_list]
+        assert len(chunks) == 2
+        assert "".join(chunks) == text
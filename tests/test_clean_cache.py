@@ -0,0 +1,119 @@
+"""Tests for the clean-text result cache.
+
+Target functions:
+- src/clean_cache.py::CleanCache
+- src/clean_cache.py::get_clean_rules_version()
+- src/clean_cache.py::get_reading_dict_hash()
+- src/clean_cache.py::open_clean_cache()
+- src/reading_matcher.py::ReadingMatcher.entries_in()
+"""
+
+import json
+
+import pytest
+
+from src.clean_cache import (
+    CleanCache,
+    get_clean_cache_path,
+    get_clean_rules_version,
+    get_item_hash,
+    get_reading_dict_hash,
+    open_clean_cache,
+)
+from src.reading_matcher import ReadingMatcher
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """Point the default cache location at a temporary data dir."""
+    monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+    return get_clean_cache_path()
+
+
+class TestCleanCache:
+    """CleanCache のテスト"""
+
+    def test_default_path_under_data_dir(self, cache_path, tmp_path):
+        """既定の保存先は data/clean_cache.sqlite3"""
+        assert cache_path == tmp_path / "data" / "clean_cache.sqlite3"
+
+    def test_add_and_lookup_counts_hits(self, cache_path):
+        """登録した結果を一括検索でき、ヒット・ミス数を数える"""
+        with CleanCache.open(None) as cache:
+            key = cache.key("paragraph", "本文")
+            cache.add({key: "ほんぶん"})
+            assert cache.lookup([key, cache.key("paragraph", "別の段落")]) == {key: "ほんぶん"}
+            assert (cache.hits, cache.misses) == (1, 1)
+        assert cache_path.exists()
+
+    def test_keyed_by_item_type(self):
+        """同じテキストでも見出しと段落は別のキー"""
+        assert get_item_hash("heading", "はじめに") != get_item_hash("paragraph", "はじめに")
+
+    def test_keyed_by_applying_entries(self, cache_path):
+        """項目に現れる用語の読みが変わると以前の結果は使わない"""
+        with CleanCache.open(ReadingMatcher({"API": "エーピーアイ"})) as cache:
+            cache.add({cache.key("paragraph", "APIの説明"): "エーピーアイのせつめい"})
+        with CleanCache.open(ReadingMatcher({"API": "アピ"})) as cache:
+            assert cache.lookup([cache.key("paragraph", "APIの説明")]) == {}
+
+    def test_unrelated_entry_edit_keeps_hits(self, cache_path):
+        """項目に現れない用語の追加・変更では以前の結果をそのまま使う"""
+        texts = [f"APIの説明{i}。" for i in range(50)] + [f"本文{i}。" for i in range(50)]
+        with CleanCache.open(ReadingMatcher({"API": "エーピーアイ", "SRE": "エスアールイー"})) as cache:
+            cache.add({cache.key("paragraph", text): f"cleaned {text}" for text in texts})
+
+        edited = ReadingMatcher({"API": "エーピーアイ", "SRE": "エスアールイ", "Docker": "ドッカー"})
+        with CleanCache.open(edited) as cache:
+            found = cache.lookup(cache.key("paragraph", text) for text in texts)
+            assert (cache.hits, cache.misses) == (100, 0)
+            assert found[cache.key("paragraph", "本文0。")] == "cleaned 本文0。"
+
+    def test_entries_in_readings_apply(self):
+        """読みに他の用語を含む辞書（逐次置換）では、読みに現れる用語もキーに含める"""
+        matcher = ReadingMatcher({"Kubernetes": "K8s", "K8s": "ケーエイツ"})
+        assert matcher.entries_in("Kubernetesを使う") == [("Kubernetes", "K8s"), ("K8s", "ケーエイツ")]
+        assert matcher.entries_in("本文") == []
+
+    def test_other_rule_versions_are_pruned(self, cache_path):
+        """規則のバージョンが変わると以前の結果は使わず、書き込み時に削除する"""
+        with CleanCache.open(None, rules_version="old") as cache:
+            cache.add({cache.key("paragraph", "本文"): "ほんぶん"})
+        with CleanCache.open(None, rules_version="new") as cache:
+            assert cache.lookup([cache.key("paragraph", "本文")]) == {}
+            cache.add({cache.key("paragraph", "別"): "べつ"})
+            assert len(cache) == 1
+
+    def test_bulk_lookup_beyond_batch_size(self, cache_path):
+        """バッチサイズを超える件数も一括検索できる"""
+        with CleanCache.open(None) as cache:
+            cleaned = {cache.key("paragraph", f"段落{i}"): f"だんらく{i}" for i in range(1200)}
+            cache.add(cleaned)
+            assert cache.lookup(cleaned) == cleaned
+
+
+class TestFingerprints:
+    """規則・辞書のハッシュのテスト"""
+
+    def test_rules_version_is_stable(self):
+        """規則のバージョンはプロセス内で一定"""
+        assert get_clean_rules_version() == get_clean_rules_version()
+        assert len(get_clean_rules_version()) == 64
+
+    def test_reading_dict_hash(self, tmp_path, monkeypatch):
+        """辞書がなければ空文字、内容が変われば別のハッシュ"""
+        monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+        assert get_reading_dict_hash("abc123") == ""
+
+        dict_path = tmp_path / "data" / "abc123" / "readings.json"
+        dict_path.parent.mkdir(parents=True)
+        dict_path.write_text(json.dumps({"API": "エーピーアイ"}), encoding="utf-8")
+        first = get_reading_dict_hash("abc123")
+        dict_path.write_text(json.dumps({"API": "アピ"}), encoding="utf-8")
+        assert first not in ("", get_reading_dict_hash("abc123"))
+
+    def test_unavailable_cache(self, tmp_path):
+        """作成できない場所では None を返す"""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        assert open_clean_cache("abc123", path=blocker / "clean_cache.sqlite3") is None
@@ -0,0 +1,166 @@
+"""Tests for the clean stage's structured artifact.
+
+Target functions:
+- src/cleaned_items.py::CleanedItemsWriter
+- src/cleaned_items.py::get_cleaned_text_path()
+- src/cleaned_items.py::has_cleaned_items()
+- src/cleaned_items.py::iter_cleaned_items_file()
+- src/chapter_processor.py::process_chapters(cleaned=True)
+"""
+
+import argparse
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.chapter_processor import process_chapters
+from src.cleaned_items import (
+    CleanedItemsWriter,
+    get_cleaned_items_path,
+    get_cleaned_text_path,
+    has_cleaned_items,
+    iter_cleaned_items_file,
+)
+from src.xml_parser import CHAPTER_MARKER, SECTION_MARKER, ContentItem, HeadingInfo
+
+ITEMS = [
+    (
+        ContentItem("heading", CHAPTER_MARKER + "第1章、概要。", HeadingInfo(1, "1", "概要"), 1),
+        "ダイいっしょう、ガイヨウ。",
+    ),
+    (
+        ContentItem("heading", SECTION_MARKER + "1.1 背景", HeadingInfo(2, "1.1", "背景", False), 1),
+        "ハイケイ。",
+    ),
+    (ContentItem("paragraph", "本文は123字。", None, 1), "ホンブンはひゃくにじゅうさんジ。"),
+    (ContentItem("paragraph", "https://example.com", None, 1), ""),
+    (ContentItem("list_item", "付録", None, 2), "フロク"),
+]
+
+
+@pytest.fixture
+def items_path(tmp_path):
+    """Write ITEMS for book "abc123"."""
+    path = get_cleaned_items_path(tmp_path / "cleaned_text.txt")
+    with CleanedItemsWriter(path, "abc123") as writer:
+        for item, cleaned in ITEMS:
+            writer.write(item, cleaned)
+    return path
+
+
+class TestCleanedItemsFile:
+    """cleaned_items.jsonl の書き込み・読み込みのテスト"""
+
+    def test_path_next_to_cleaned_text(self, tmp_path):
+        """成果物は cleaned_text.txt と同じディレクトリに置く"""
+        assert get_cleaned_items_path(tmp_path / "cleaned_text.txt") == tmp_path / "cleaned_items.jsonl"
+
+    def test_chapter_run_paths(self, tmp_path):
+        """1 章だけの実行は章番号付きのファイル名を使い、書籍全体の成果物と衝突しない"""
+        assert get_cleaned_text_path(tmp_path) == tmp_path / "cleaned_text.txt"
+        assert get_cleaned_text_path(tmp_path, 3) == tmp_path / "cleaned_text_ch03.txt"
+        assert get_cleaned_items_path(tmp_path / "cleaned_text_ch03.txt") == tmp_path / "cleaned_items_ch03.jsonl"
+
+    def test_round_trip(self, items_path):
+        """種別・見出し・章番号・マーカーを保ったままクリーニング済みテキストを読み出せる"""
+        items = list(iter_cleaned_items_file(items_path))
+
+        assert items == [
+            ContentItem(item.item_type, item.text[:1] + cleaned, item.heading_info, item.chapter_number)
+            if item.text[:1] in (CHAPTER_MARKER, SECTION_MARKER)
+            else ContentItem(item.item_type, cleaned, item.heading_info, item.chapter_number)
+            for item, cleaned in ITEMS
+        ]
+
+    def test_filter_by_chapter(self, items_path):
+        """章番号を指定するとその章の項目だけを返す"""
+        assert [item.text for item in iter_cleaned_items_file(items_path, chapter=2)] == ["フロク"]
+
+    def test_has_cleaned_items(self, items_path, tmp_path):
+        """ヘッダーの書籍ハッシュ・章範囲が一致する場合だけ使用可能とする"""
+        assert has_cleaned_items(items_path, "abc123")
+        assert has_cleaned_items(items_path, "abc123", chapter=2)
+        assert not has_cleaned_items(items_path, "other")
+        assert not has_cleaned_items(tmp_path / "missing.jsonl", "abc123")
+
+    def test_reading_dict_change_rejected(self, tmp_path, monkeypatch):
+        """書き込み後に読み辞書が生成・変更された成果物は使わない"""
+        monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+        path = tmp_path / "cleaned_items.jsonl"
+        with CleanedItemsWriter(path, "abc123") as writer:
+            writer.write(*ITEMS[0])
+        assert has_cleaned_items(path, "abc123")
+
+        dict_path = tmp_path / "data" / "abc123" / "readings.json"
+        dict_path.parent.mkdir(parents=True)
+        dict_path.write_text('{"概要": "ガイヨウ"}', encoding="utf-8")
+
+        assert not has_cleaned_items(path, "abc123")
+
+    def test_clean_rules_change_rejected(self, items_path, monkeypatch):
+        """クリーニング規則（text_cleaner・MeCab 辞書など）が変わった成果物は使わない"""
+        monkeypatch.setattr("src.cleaned_items.get_clean_rules_version", lambda: "other-rules")
+
+        assert not has_cleaned_items(items_path, "abc123")
+
+    def test_single_chapter_artifact(self, tmp_path):
+        """1 章だけの成果物は他の章・書籍全体の合成には使わない"""
+        path = tmp_path / "cleaned_items.jsonl"
+        with CleanedItemsWriter(path, "abc123", chapter=2) as writer:
+            writer.write(*ITEMS[-1])
+
+        assert has_cleaned_items(path, "abc123", chapter=2)
+        assert not has_cleaned_items(path, "abc123", chapter=1)
+        assert not has_cleaned_items(path, "abc123")
+
+    def test_other_version_rejected(self, tmp_path):
+        """形式バージョンが異なるファイルは使わない"""
+        path = tmp_path / "cleaned_items.jsonl"
+        path.write_text('{"version": 0, "content_hash": "abc123", "chapter": null}\n', encoding="utf-8")
+
+        assert not has_cleaned_items(path, "abc123")
+
+    def test_interrupted_write_leaves_no_artifact(self, tmp_path):
+        """書き込み中に失敗した場合は途中までのファイルを残さない"""
+        path = tmp_path / "cleaned_items.jsonl"
+        with pytest.raises(RuntimeError):
+            with CleanedItemsWriter(path, "abc123") as writer:
+                writer.write(*ITEMS[0])
+                raise RuntimeError("interrupted")
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestProcessChaptersPreCleaned:
+    """クリーニング済み項目からの音声生成テスト"""
+
+    def test_cleaned_items_are_not_cleaned_again(self, items_path, tmp_path):
+        """cleaned=True では clean_page_text を呼ばず、成果物のテキストをそのまま合成する"""
+        args = argparse.Namespace(max_chunk_chars=500, style_id=13, speed=1.0, chapter=None)
+        chapter_sound = np.zeros(10, dtype=np.float32)
+
+        with (
+            patch("src.chapter_processor.clean_page_text") as mock_clean,
+            patch("src.chapter_processor.generate_audio") as mock_gen,
+            patch("src.chapter_processor.save_audio"),
+            patch("src.chapter_processor.concatenate_audio_files"),
+        ):
+            mock_gen.return_value = (np.zeros(100, dtype=np.float32), 24000)
+            wav_files = process_chapters(
+                iter_cleaned_items_file(items_path),
+                synthesizer=object(),
+                output_dir=tmp_path / "out",
+                args=args,
+                chapter_sound=chapter_sound,
+                cleaned=True,
+            )
+
+        assert not mock_clean.called
+        assert [call.kwargs["text"] for call in mock_gen.call_args_list] == [
+            "ダイいっしょう、ガイヨウ。",
+            SECTION_MARKER + "ハイケイ。",  # 効果音なしのマーカーは従来通り残る
+            "ホンブンはひゃくにじゅうさんジ。",
+            "フロク",
+        ]
+        assert [path.name for path in wav_files] == ["ch01_untitled.wav", "ch02_untitled.wav", "book.wav"]
@@ -467,11 +467,6 @@ class TestExtractSections:
         assert isinstance(result, list)
 
 
-# =============================================================================
-# T013: LLM構造分析（intro/dialogue/conclusion分類）のテスト
-# =============================================================================
-
-
 class TestAnalyzeStructure:
     """analyze_structure() のテスト - LLMで段落をintro/dialogue/conclusionに分類"""
 
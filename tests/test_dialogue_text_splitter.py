@@ -0,0 +1,119 @@
+"""Tests for dialogue_text_splitter.py - 対話XMLの長文分割.
+
+Target functions:
+- src/dialogue_text_splitter.py::process_dialogue_xml()
+"""
+
+import xml.etree.ElementTree as ET
+
+from src.dialogue_text_splitter import process_dialogue_xml
+
+LONG_INTRO = "導入の文です。" * 6
+LONG_UTTERANCE = "長い発言の文です。" * 6
+LONG_CONCLUSION = "まとめの文です。" * 6
+
+BOOK_XML = f"""<?xml version="1.0" encoding="UTF-8"?>
+<dialogue-book>
+  <dialogue-section number="1" title="最初">
+    <introduction speaker="narrator">{LONG_INTRO}</introduction>
+    <dialogue>
+      <utterance speaker="A">短い発言。</utterance>
+      <utterance speaker="B">{LONG_UTTERANCE}</utterance>
+      <utterance speaker="A">最後の発言。</utterance>
+    </dialogue>
+    <conclusion speaker="narrator">{LONG_CONCLUSION}</conclusion>
+  </dialogue-section>
+  <dialogue-section number="2" title="短い">
+    <introduction speaker="narrator">短い導入。</introduction>
+    <dialogue>
+      <utterance speaker="A">はい。</utterance>
+    </dialogue>
+    <conclusion speaker="narrator">短いまとめ。</conclusion>
+  </dialogue-section>
+</dialogue-book>
+"""
+
+
+def _utterances(section: ET.Element) -> list[tuple[str | None, str | None]]:
+    return [(utt.get("speaker"), utt.text) for utt in section.iter("utterance")]
+
+
+class TestProcessDialogueXml:
+    """process_dialogue_xml のテスト"""
+
+    def test_split_positions(self, tmp_path):
+        """導入の残りは既存発話の前、長い発言は直後、まとめの残りは末尾に入る"""
+        input_path = tmp_path / "dialogue_book.xml"
+        input_path.write_text(BOOK_XML, encoding="utf-8")
+        output_path = tmp_path / "out.xml"
+
+        stats = process_dialogue_xml(input_path, output_path, max_length=20)
+
+        assert stats == {"sections": 2, "split_count": 6, "original_count": 3}
+        first, second = ET.parse(output_path).getroot()
+        assert first.findtext("introduction") == "導入の文です。導入の文です。"
+        assert first.findtext("conclusion") == "まとめの文です。まとめの文です。"
+        assert _utterances(first) == [
+            ("narrator", "導入の文です。導入の文です。"),
+            ("narrator", "導入の文です。導入の文です。"),
+            ("A", "短い発言。"),
+            ("B", "長い発言の文です。長い発言の文です。"),
+            ("B", "長い発言の文です。長い発言の文です。"),
+            ("B", "長い発言の文です。長い発言の文です。"),
+            ("A", "最後の発言。"),
+            ("narrator", "まとめの文です。まとめの文です。"),
+            ("narrator", "まとめの文です。まとめの文です。"),
+        ]
+        assert _utterances(second) == [("A", "はい。")]
+
+    def test_output_is_indented(self, tmp_path):
+        """出力は 2 スペースでインデントされる"""
+        input_path = tmp_path / "dialogue_book.xml"
+        input_path.write_text(BOOK_XML, encoding="utf-8")
+        output_path = tmp_path / "out.xml"
+
+        process_dialogue_xml(input_path, output_path, max_length=20)
+
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "<?xml version='1.0' encoding='utf-8'?>"
+        assert lines[1] == "<dialogue-book>"
+        assert lines[2] == '  <dialogue-section number="1" title="最初">'
+        assert '      <utterance speaker="narrator">導入の文です。導入の文です。</utterance>' in lines
+        assert lines[-1] == "</dialogue-book>"
+
+    def test_creates_dialogue_when_missing(self, tmp_path):
+        """dialogue 要素が無いセクションでは作成して narrator 発話を入れる"""
+        input_path = tmp_path / "dialogue_book.xml"
+        input_path.write_text(
+            f"<dialogue-book><dialogue-section number='1'>"
+            f"<introduction>{LONG_INTRO}</introduction></dialogue-section></dialogue-book>",
+            encoding="utf-8",
+        )
+
+        process_dialogue_xml(input_path, tmp_path / "out.xml", max_length=20)
+
+        section = ET.parse(tmp_path / "out.xml").getroot()[0]
+        assert [child.tag for child in section] == ["introduction", "dialogue"]
+        assert len(_utterances(section)) == 2
+
+    def test_overwrite_input(self, tmp_path):
+        """入力ファイルへの上書き出力ができ、一時ファイルは残らない"""
+        input_path = tmp_path / "dialogue_book.xml"
+        input_path.write_text(BOOK_XML, encoding="utf-8")
+
+        process_dialogue_xml(input_path, input_path, max_length=20)
+
+        assert len(_utterances(ET.parse(input_path).getroot()[0])) == 9
+        assert [path.name for path in tmp_path.iterdir()] == ["dialogue_book.xml"]
+
+    def test_already_split_is_unchanged(self, tmp_path):
+        """分割済みの出力を再処理しても内容は変わらない"""
+        input_path = tmp_path / "dialogue_book.xml"
+        input_path.write_text(BOOK_XML, encoding="utf-8")
+        process_dialogue_xml(input_path, input_path, max_length=20)
+        first_output = input_path.read_bytes()
+
+        stats = process_dialogue_xml(input_path, input_path, max_length=20)
+
+        assert stats["split_count"] == 0
+        assert input_path.read_bytes() == first_output
@@ -1,11 +1,21 @@
 """Integration tests for dictionary loading between gen-dict and xml-tts."""
 
 import json
+import os
+import time
+from unittest.mock import patch
 
 import pytest
 
-from src.dict_manager import get_content_hash, get_xml_content_hash
-from src.xml_parser import parse_book2_xml
+from src import dict_manager
+from src.dict_manager import (
+    get_content_hash,
+    get_hash_sidecar_path,
+    get_streaming_content_hash,
+    get_xml_content_hash,
+    load_dict_from_hash,
+)
+from src.xml_parser import iter_book2_xml, parse_book2_xml
 
 
 @pytest.fixture
@@ -123,3 +133,105 @@ def test_different_xml_different_hash(tmp_path):
     hash2 = get_xml_content_hash(xml2)
 
     assert hash1 != hash2
+
+
+@pytest.fixture
+def aged_xml(sample_xml):
+    """Sample XML whose mtime is old enough for its hash to be cached."""
+    old = time.time_ns() - 60 * 1_000_000_000
+    os.utime(sample_xml, ns=(old, old))
+    return sample_xml
+
+
+@pytest.fixture
+def clear_hash_memo(tmp_path, monkeypatch):
+    """Start each caching test with an empty in-process memo and data dir."""
+    monkeypatch.setattr("src.dict_manager._XML_HASH_MEMO", {})
+    monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+
+
+def test_xml_content_hash_memoized_in_process(aged_xml, clear_hash_memo):
+    """Repeated lookups for an unchanged file do not re-parse the XML."""
+    expected = get_xml_content_hash(aged_xml)
+
+    with patch.object(dict_manager, "_compute_xml_content_hash") as mock_compute:
+        assert get_xml_content_hash(aged_xml) == expected
+        mock_compute.assert_not_called()
+
+
+def test_xml_content_hash_sidecar_reused_across_processes(aged_xml, clear_hash_memo, monkeypatch):
+    """The sidecar file answers lookups when the in-process memo is empty."""
+    expected = get_xml_content_hash(aged_xml)
+    assert get_hash_sidecar_path(aged_xml).exists()
+
+    # Simulate a new process
+    monkeypatch.setattr("src.dict_manager._XML_HASH_MEMO", {})
+    with patch.object(dict_manager, "_compute_xml_content_hash") as mock_compute:
+        assert get_xml_content_hash(aged_xml) == expected
+        mock_compute.assert_not_called()
+
+
+def test_xml_content_hash_invalidated_on_change(aged_xml, clear_hash_memo):
+    """Changing the file invalidates both the memo and the sidecar."""
+    first = get_xml_content_hash(aged_xml)
+
+    aged_xml.write_text(aged_xml.read_text(encoding="utf-8").replace("test paragraph", "changed text"))
+    old = time.time_ns() - 30 * 1_000_000_000
+    os.utime(aged_xml, ns=(old, old))
+
+    second = get_xml_content_hash(aged_xml)
+
+    assert second != first
+    items = parse_book2_xml(aged_xml)
+    assert second == get_content_hash(" ".join(item.text for item in items))
+
+
+def test_xml_content_hash_not_cached_for_fresh_file(sample_xml, clear_hash_memo):
+    """Files modified within the racy window are hashed but not cached."""
+    get_xml_content_hash(sample_xml)
+
+    assert not get_hash_sidecar_path(sample_xml).exists()
+
+
+def test_xml_content_hash_corrupt_sidecar_ignored(aged_xml, clear_hash_memo):
+    """A corrupt sidecar is ignored and rewritten."""
+    sidecar = get_hash_sidecar_path(aged_xml)
+    sidecar.write_text("not json", encoding="utf-8")
+
+    content_hash = get_xml_content_hash(aged_xml)
+
+    assert json.loads(sidecar.read_text(encoding="utf-8"))["hash"] == content_hash
+
+
+@pytest.mark.parametrize(
+    "texts",
+    [
+        [],
+        [""],
+        ["単一のテキスト"],
+        ["First", "", "第二段落", "third"],
+    ],
+)
+def test_streaming_content_hash_matches_joined_hash(texts):
+    """Streaming hash keeps the " ".join separator semantics."""
+    assert get_streaming_content_hash(iter(texts)) == get_content_hash(" ".join(texts))
+
+
+def test_streaming_content_hash_on_parser_iterator(sample_xml):
+    """The streaming hasher consumes iter_book2_xml output directly."""
+    items = parse_book2_xml(sample_xml)
+    expected = get_content_hash(" ".join(item.text for item in items))
+
+    assert get_streaming_content_hash(item.text for item in iter_book2_xml(sample_xml)) == expected
+
+
+def test_load_dict_from_hash(tmp_path, monkeypatch):
+    """Dictionaries can be loaded from a precomputed hash."""
+    test_data_dir = tmp_path / "data"
+    monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", test_data_dir)
+    dict_path = test_data_dir / "abc123def456" / "readings.json"
+    dict_path.parent.mkdir(parents=True)
+    dict_path.write_text(json.dumps({"API": "エーピーアイ"}, ensure_ascii=False), encoding="utf-8")
+
+    assert load_dict_from_hash("abc123def456") == {"API": "エーピーアイ"}
+    assert load_dict_from_hash("000000000000") == {}
@@ -8,10 +8,13 @@ These tests verify that each pipeline entry point:
 """
 
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 INTEGRATION_BOOK = FIXTURES_DIR / "integration_book.xml"
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -35,6 +38,14 @@ def run_dry_run(cmd: list[str], timeout: int = 30) -> subprocess.CompletedProces
     )
 
 
+@pytest.fixture
+def integration_book(tmp_path: Path) -> Path:
+    """Copy the integration fixture into tmp_path so sidecars stay out of tests/fixtures."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    return Path(shutil.copy(INTEGRATION_BOOK, input_dir))
+
+
 def _get_dialogue_fixture(tmp_path: Path) -> Path:
     """Create a minimal dialogue XML fixture for testing."""
     dialogue_dir = tmp_path / "hash123"
@@ -60,11 +71,11 @@ def _get_dialogue_fixture(tmp_path: Path) -> Path:
 class TestGenDictDryRun:
     """Integration tests for generate_reading_dict.py --dry-run."""
 
-    def test_exits_successfully(self) -> None:
+    def test_exits_successfully(self, integration_book: Path) -> None:
         result = run_dry_run(
             [
                 "src/generate_reading_dict.py",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "--model",
                 "dummy-model",
                 "--dry-run",
@@ -72,11 +83,11 @@ class TestGenDictDryRun:
         )
         assert result.returncode == 0, f"output: {result.stdout}"
 
-    def test_outputs_dry_run_summary(self) -> None:
+    def test_outputs_dry_run_summary(self, integration_book: Path) -> None:
         result = run_dry_run(
             [
                 "src/generate_reading_dict.py",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "--model",
                 "dummy-model",
                 "--dry-run",
@@ -87,12 +98,12 @@ class TestGenDictDryRun:
         assert "Input" in output
         assert "Total terms" in output
 
-    def test_no_llm_call_attempted(self) -> None:
+    def test_no_llm_call_attempted(self, integration_book: Path) -> None:
         """Verify dry-run doesn't try to connect to Ollama (would fail without server)."""
         result = run_dry_run(
             [
                 "src/generate_reading_dict.py",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "--model",
                 "nonexistent-model",
                 "--dry-run",
@@ -104,13 +115,13 @@ class TestGenDictDryRun:
 class TestCleanTextDryRun:
     """Integration tests for text_cleaner_cli --dry-run."""
 
-    def test_exits_successfully(self) -> None:
+    def test_exits_successfully(self, integration_book: Path) -> None:
         result = run_dry_run(
             [
                 "-m",
                 "src.text_cleaner_cli",
                 "-i",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "-o",
                 "/tmp/test_dry_run_output",
                 "--dry-run",
@@ -118,13 +129,13 @@ class TestCleanTextDryRun:
         )
         assert result.returncode == 0, f"output: {result.stdout}"
 
-    def test_outputs_dry_run_summary(self) -> None:
+    def test_outputs_dry_run_summary(self, integration_book: Path) -> None:
         result = run_dry_run(
             [
                 "-m",
                 "src.text_cleaner_cli",
                 "-i",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "-o",
                 "/tmp/test_dry_run_output",
                 "--dry-run",
@@ -134,7 +145,7 @@ class TestCleanTextDryRun:
         assert "DRY-RUN" in output
         assert "Content items" in output
 
-    def test_no_file_written(self, tmp_path: Path) -> None:
+    def test_no_file_written(self, tmp_path: Path, integration_book: Path) -> None:
         """Verify dry-run doesn't create output files."""
         output_dir = tmp_path / "dry_run_output"
         result = run_dry_run(
@@ -142,7 +153,7 @@ class TestCleanTextDryRun:
                 "-m",
                 "src.text_cleaner_cli",
                 "-i",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "-o",
                 str(output_dir),
                 "--dry-run",
@@ -155,13 +166,13 @@ class TestCleanTextDryRun:
 class TestXmlTtsDryRun:
     """Integration tests for xml_pipeline --dry-run."""
 
-    def test_exits_successfully(self) -> None:
+    def test_exits_successfully(self, integration_book: Path) -> None:
         result = run_dry_run(
             [
                 "-m",
                 "src.xml_pipeline",
                 "-i",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "-o",
                 "/tmp/test_dry_run_output",
                 "--dry-run",
@@ -169,13 +180,13 @@ class TestXmlTtsDryRun:
         )
         assert result.returncode == 0, f"output: {result.stdout}"
 
-    def test_outputs_dry_run_summary(self) -> None:
+    def test_outputs_dry_run_summary(self, integration_book: Path) -> None:
         result = run_dry_run(
             [
                 "-m",
                 "src.xml_pipeline",
                 "-i",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "-o",
                 "/tmp/test_dry_run_output",
                 "--dry-run",
@@ -187,14 +198,14 @@ class TestXmlTtsDryRun:
         assert "Total characters" in output
         assert "Estimated TTS chunks" in output
 
-    def test_no_voicevox_initialization(self) -> None:
+    def test_no_voicevox_initialization(self, integration_book: Path) -> None:
         """Verify dry-run doesn't try to initialize VOICEVOX (would fail without runtime)."""
         result = run_dry_run(
             [
                 "-m",
                 "src.xml_pipeline",
                 "-i",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "-o",
                 "/tmp/test_dry_run_output",
                 "--voicevox-dir",
@@ -204,7 +215,7 @@ class TestXmlTtsDryRun:
         )
         assert result.returncode == 0
 
-    def test_no_file_written(self, tmp_path: Path) -> None:
+    def test_no_file_written(self, tmp_path: Path, integration_book: Path) -> None:
         """Verify dry-run doesn't create output directory."""
         output_dir = tmp_path / "dry_run_output"
         result = run_dry_run(
@@ -212,7 +223,7 @@ class TestXmlTtsDryRun:
                 "-m",
                 "src.xml_pipeline",
                 "-i",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "-o",
                 str(output_dir),
                 "--dry-run",
@@ -225,7 +236,7 @@ class TestXmlTtsDryRun:
 class TestDialoguePipelineDryRun:
     """Integration tests for dialogue_pipeline --dry-run."""
 
-    def test_exits_successfully(self, tmp_path: Path) -> None:
+    def test_exits_successfully(self, tmp_path: Path, integration_book: Path) -> None:
         dialogue_file = _get_dialogue_fixture(tmp_path)
         result = run_dry_run(
             [
@@ -236,13 +247,13 @@ class TestDialoguePipelineDryRun:
                 "-o",
                 str(tmp_path),
                 "--dict-source",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "--dry-run",
             ]
         )
         assert result.returncode == 0, f"output: {result.stdout}"
 
-    def test_outputs_dry_run_summary(self, tmp_path: Path) -> None:
+    def test_outputs_dry_run_summary(self, tmp_path: Path, integration_book: Path) -> None:
         dialogue_file = _get_dialogue_fixture(tmp_path)
         result = run_dry_run(
             [
@@ -253,7 +264,7 @@ class TestDialoguePipelineDryRun:
                 "-o",
                 str(tmp_path),
                 "--dict-source",
-                str(INTEGRATION_BOOK),
+                str(integration_book),
                 "--dry-run",
             ]
         )
@@ -50,15 +50,15 @@ class TestXmlInputCallsParseBook2Xml:
         mock_gen_readings,
         tmp_path,
     ):
-        """XML入力時にparse_book2_xmlが呼ばれ、split_into_pagesは呼ばれない"""
+        """XML入力時にparse_book2_xmlが呼ばれ、iter_raw_pagesは呼ばれない"""
         mock_get_dict_path.return_value = tmp_path / "readings.json"
         mock_load_dict.return_value = {}
         mock_extract_terms.return_value = ["API", "REST"]
         mock_gen_readings.return_value = {"API": "エーピーアイ", "REST": "レスト"}
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml") as mock_parse_xml,
-            patch("src.generate_reading_dict.split_into_pages") as mock_split_pages,
+            patch("src.generate_reading_dict.load_book_items") as mock_parse_xml,
+            patch("src.generate_reading_dict.iter_raw_pages") as mock_split_pages,
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML)]),
         ):
             mock_parse_xml.return_value = [
@@ -86,7 +86,7 @@ class TestXmlInputCallsParseBook2Xml:
         mock_gen_readings,
         tmp_path,
     ):
-        """MD入力時にparse_book2_xmlは呼ばれず、split_into_pagesが呼ばれる"""
+        """MD入力時にparse_book2_xmlは呼ばれず、iter_raw_pagesが呼ばれる"""
         md_file = tmp_path / "test.md"
         md_file.write_text("# Test\nSome API content", encoding="utf-8")
 
@@ -96,7 +96,7 @@ class TestXmlInputCallsParseBook2Xml:
         mock_gen_readings.return_value = {"API": "エーピーアイ"}
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml") as mock_parse_xml,
+            patch("src.generate_reading_dict.load_book_items") as mock_parse_xml,
             patch("sys.argv", ["prog", str(md_file)]),
         ):
             from src.generate_reading_dict import main
@@ -148,7 +148,7 @@ class TestXmlChapterGroupingAndTermExtraction:
         ]
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=items),
+            patch("src.generate_reading_dict.load_book_items", return_value=items),
             patch("src.generate_reading_dict.extract_technical_terms") as mock_extract,
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML)]),
         ):
@@ -189,7 +189,7 @@ class TestXmlChapterGroupingAndTermExtraction:
         ]
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=items),
+            patch("src.generate_reading_dict.load_book_items", return_value=items),
             patch("src.generate_reading_dict.extract_technical_terms") as mock_extract,
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML)]),
         ):
@@ -230,7 +230,7 @@ class TestXmlChapterGroupingAndTermExtraction:
         ]
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=items),
+            patch("src.generate_reading_dict.load_book_items", return_value=items),
             patch("src.generate_reading_dict.extract_technical_terms") as mock_extract,
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML)]),
         ):
@@ -273,7 +273,7 @@ class TestXmlDictSavePath:
         ]
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=items),
+            patch("src.generate_reading_dict.load_book_items", return_value=items),
             patch("src.generate_reading_dict.save_dict") as mock_save,
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML)]),
         ):
@@ -309,7 +309,7 @@ class TestXmlDictSavePath:
         ]
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=items),
+            patch("src.generate_reading_dict.load_book_items", return_value=items),
             patch("src.generate_reading_dict.save_dict"),
             patch("src.generate_reading_dict.get_dict_path") as mock_get_path,
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML)]),
@@ -351,7 +351,7 @@ class TestXmlMergeOption:
         ]
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=items),
+            patch("src.generate_reading_dict.load_book_items", return_value=items),
             patch("src.generate_reading_dict.load_dict", return_value=existing_dict),
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML), "--merge"]),
         ):
@@ -392,7 +392,7 @@ class TestXmlMergeOption:
         ]
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=items),
+            patch("src.generate_reading_dict.load_book_items", return_value=items),
             patch("src.generate_reading_dict.load_dict", return_value=existing_dict),
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML), "--merge"]),
         ):
@@ -406,20 +406,88 @@ class TestXmlMergeOption:
             assert "Docker" in call_args, "New term 'Docker' should be sent to LLM"
 
 
+class TestSharedReadingStore:
+    """書籍横断の共有読みストア（SQLite）との連携テスト"""
+
+    ITEMS = [ContentItem(item_type="paragraph", text="API and Docker", chapter_number=1)]
+
+    def _run_main(self, tmp_path, argv, existing=None):
+        with (
+            patch("src.generate_reading_dict.get_dict_path", return_value=tmp_path / "readings.json"),
+            patch("src.generate_reading_dict.load_book_items", return_value=self.ITEMS),
+            patch("src.generate_reading_dict.load_dict", return_value=existing or {}),
+            patch("src.generate_reading_dict.extract_technical_terms", return_value=["API", "Docker"]),
+            patch("src.generate_reading_dict.generate_readings_batch", return_value={"Docker": "ドッカー"}) as gen,
+            patch("src.generate_reading_dict.save_dict") as save,
+            patch("src.generate_reading_dict.get_input_content_hash", return_value="bookhash"),
+            patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML), *argv]),
+        ):
+            from src.generate_reading_dict import main
+
+            main()
+        return gen, save
+
+    def test_store_hits_not_sent_to_llm(self, tmp_path):
+        """共有ストアにある用語はLLMに送られず、辞書に取り込まれる"""
+        from src.reading_store import ReadingStore
+
+        with ReadingStore.open() as store:
+            store.add({"API": "エーピーアイ"}, model="old-model", source_hash="otherbook")
+
+        gen, save = self._run_main(tmp_path, [])
+
+        assert gen.call_args[0][0] == ["Docker"]
+        assert save.call_args[0][0] == {"API": "エーピーアイ", "Docker": "ドッカー"}
+
+    def test_new_readings_recorded_with_provenance(self, tmp_path):
+        """LLMで生成した読みはモデル名と書籍ハッシュ付きで共有ストアに登録される"""
+        from src.reading_store import ReadingStore
+
+        self._run_main(tmp_path, ["--model", "test-model"])
+
+        with ReadingStore.open() as store:
+            assert store.lookup(["Docker"]) == {"Docker": "ドッカー"}
+            assert store.provenance("Docker") == ("test-model", "bookhash")
+
+    def test_book_dictionary_overrides_store(self, tmp_path):
+        """書籍ごとの辞書のエントリが共有ストアより優先される"""
+        from src.reading_store import ReadingStore
+
+        with ReadingStore.open() as store:
+            store.add({"API": "エーピーアイ"})
+
+        _, save = self._run_main(tmp_path, ["--merge"], existing={"API": "エイピーアイ"})
+
+        assert save.call_args[0][0]["API"] == "エイピーアイ"
+
+    def test_no_shared_store_option(self, tmp_path):
+        """--no-shared-store 指定時はストアを参照・更新しない"""
+        from src.reading_store import ReadingStore, get_reading_store_path
+
+        with ReadingStore.open() as store:
+            store.add({"API": "エーピーアイ"})
+
+        gen, _ = self._run_main(tmp_path, ["--no-shared-store"])
+
+        assert gen.call_args[0][0] == ["API", "Docker"]
+        with ReadingStore.open(get_reading_store_path()) as store:
+            assert store.lookup(["Docker"]) == {}
+
+
 # =============================================================================
 # Phase 3 RED Tests - US2: Markdownファイルの既存動作維持 + エッジケース
 # =============================================================================
 
 
 class TestMdInputUsesSplitIntoPages:
-    """T024: Markdown入力時に既存フロー（split_into_pages）が使われることをテスト"""
+    """T024: Markdown入力時にページ単位フロー（iter_raw_pages）が使われることをテスト"""
 
     @patch("src.generate_reading_dict.generate_readings_batch")
     @patch("src.generate_reading_dict.extract_technical_terms")
     @patch("src.generate_reading_dict.save_dict")
     @patch("src.generate_reading_dict.load_dict")
     @patch("src.generate_reading_dict.get_dict_path")
-    def test_md_input_calls_split_into_pages(
+    def test_md_input_calls_iter_raw_pages(
         self,
         mock_get_dict_path,
         mock_load_dict,
@@ -428,7 +496,7 @@ class TestMdInputUsesSplitIntoPages:
         mock_gen_readings,
         tmp_path,
     ):
-        """MD入力時にsplit_into_pagesが呼ばれ、ページ単位でextract_technical_termsが適用される"""
+        """MD入力時にiter_raw_pagesが呼ばれ、ページ単位でextract_technical_termsが適用される"""
         md_file = tmp_path / "test_book.md"
         md_file.write_text(
             "# Chapter 1\nSome API content\n\n---\n\n# Chapter 2\nDocker usage\n",
@@ -441,10 +509,10 @@ class TestMdInputUsesSplitIntoPages:
         mock_gen_readings.return_value = {"API": "エーピーアイ"}
 
         with (
-            patch("src.generate_reading_dict.split_into_pages") as mock_split,
+            patch("src.generate_reading_dict.iter_raw_pages") as mock_split,
             patch("sys.argv", ["prog", str(md_file)]),
         ):
-            # split_into_pages returns Page objects with .text attribute
+            # iter_raw_pages yields Page objects with .text attribute
             page1 = MagicMock()
             page1.text = "Chapter 1 Some API content"
             page2 = MagicMock()
@@ -484,7 +552,7 @@ class TestMdInputUsesSplitIntoPages:
         mock_gen_readings.return_value = {"API": "エーピーアイ"}
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml") as mock_parse_xml,
+            patch("src.generate_reading_dict.load_book_items") as mock_parse_xml,
             patch("sys.argv", ["prog", str(md_file)]),
         ):
             from src.generate_reading_dict import main
@@ -493,6 +561,44 @@ class TestMdInputUsesSplitIntoPages:
 
             mock_parse_xml.assert_not_called()
 
+    @patch("src.generate_reading_dict.generate_readings_batch")
+    @patch("src.generate_reading_dict.extract_technical_terms")
+    @patch("src.generate_reading_dict.save_dict")
+    @patch("src.generate_reading_dict.load_dict")
+    @patch("src.generate_reading_dict.get_dict_path")
+    def test_md_terms_extracted_without_tts_normalization(
+        self,
+        mock_get_dict_path,
+        mock_load_dict,
+        mock_save_dict,
+        mock_extract_terms,
+        mock_gen_readings,
+        tmp_path,
+    ):
+        """MD入力時の用語抽出はTTS正規化（読み変換・MeCab）を通さない"""
+        md_file = tmp_path / "book.md"
+        md_file.write_text(
+            "--- Page 1 (page_0001.png) ---\n# API 入門\nhttps://example.com を参照。\n",
+            encoding="utf-8",
+        )
+        mock_get_dict_path.return_value = tmp_path / "readings.json"
+        mock_load_dict.return_value = {}
+        mock_extract_terms.return_value = []
+
+        with (
+            patch("src.text_cleaner.clean_page_text") as mock_clean,
+            patch("sys.argv", ["prog", str(md_file)]),
+        ):
+            from src.generate_reading_dict import main
+
+            main()
+
+            mock_clean.assert_not_called()
+            mock_extract_terms.assert_called_once()
+            page_text = mock_extract_terms.call_args.args[0]
+            assert "API" in page_text
+            assert "https://" not in page_text
+
 
 class TestUnsupportedExtensionError:
     """T025: 未対応拡張子（.txt 等）でエラー終了することをテスト"""
@@ -569,7 +675,7 @@ class TestEmptyXmlGeneratesEmptyDict:
         mock_load_dict.return_value = {}
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=[]),
+            patch("src.generate_reading_dict.load_book_items", return_value=[]),
             patch("src.generate_reading_dict.extract_technical_terms") as mock_extract,
             patch("sys.argv", ["prog", str(DICT_TEST_EMPTY_XML)]),
         ):
@@ -597,7 +703,7 @@ class TestEmptyXmlGeneratesEmptyDict:
         mock_load_dict.return_value = {}
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=[]),
+            patch("src.generate_reading_dict.load_book_items", return_value=[]),
             patch("src.generate_reading_dict.extract_technical_terms"),
             patch("sys.argv", ["prog", str(DICT_TEST_EMPTY_XML)]),
         ):
@@ -622,7 +728,7 @@ class TestEmptyXmlGeneratesEmptyDict:
         mock_load_dict.return_value = {}
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=[]),
+            patch("src.generate_reading_dict.load_book_items", return_value=[]),
             patch("src.generate_reading_dict.extract_technical_terms"),
             patch("src.generate_reading_dict.save_dict"),
             patch("sys.argv", ["prog", str(DICT_TEST_EMPTY_XML)]),
@@ -664,7 +770,7 @@ class TestInvalidXmlErrorExit:
         import xml.etree.ElementTree as ET
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml") as mock_parse,
+            patch("src.generate_reading_dict.load_book_items") as mock_parse,
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML)]),
             patch("src.generate_reading_dict.get_dict_path") as mock_get_path,
             patch("src.generate_reading_dict.load_dict", return_value={}),
@@ -706,7 +812,7 @@ class TestChapterNumberNoneContentItem:
         ]
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=items),
+            patch("src.generate_reading_dict.load_book_items", return_value=items),
             patch("src.generate_reading_dict.extract_technical_terms") as mock_extract,
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML)]),
         ):
@@ -750,7 +856,7 @@ class TestChapterNumberNoneContentItem:
         ]
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=items),
+            patch("src.generate_reading_dict.load_book_items", return_value=items),
             patch("src.generate_reading_dict.extract_technical_terms") as mock_extract,
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML)]),
         ):
@@ -788,7 +894,7 @@ class TestChapterNumberNoneContentItem:
         ]
 
         with (
-            patch("src.generate_reading_dict.parse_book2_xml", return_value=items),
+            patch("src.generate_reading_dict.load_book_items", return_value=items),
             patch("src.generate_reading_dict.extract_technical_terms") as mock_extract,
             patch("sys.argv", ["prog", str(DICT_TEST_BOOK_XML)]),
         ):
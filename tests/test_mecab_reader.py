@@ -0,0 +1,60 @@
+"""Tests for MeCab kanji to kana conversion.
+
+Target functions:
+- src/mecab_reader.py::convert_to_kana()
+- src/mecab_reader.py::convert_lines_to_kana()
+- src/mecab_reader.py::convert_texts_to_kana()
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src import mecab_reader
+from src.mecab_reader import convert_lines_to_kana, convert_texts_to_kana, convert_to_kana
+
+
+@pytest.fixture(autouse=True)
+def clear_line_cache():
+    """Start each test with an empty line cache."""
+    mecab_reader._convert_line.cache_clear()
+
+
+class TestConvertToKana:
+    """convert_to_kana() のテスト"""
+
+    def test_converts_kanji_words(self):
+        """漢字を含む語だけカタカナ読みに変換する"""
+        assert convert_to_kana("漢字の読み") == "カンジのヨミ"
+
+    def test_preserves_newlines(self):
+        """改行位置（空行を含む）を保つ"""
+        assert convert_to_kana("漢字\n\nテスト文章です\n") == "カンジ\n\nテストブンショウです\n"
+
+    def test_text_without_kanji_is_not_tagged(self):
+        """漢字を含まないテキストは MeCab を呼ばずにそのまま返す"""
+        with patch("src.mecab_reader.analyze") as mock_analyze:
+            assert convert_to_kana("ひらがなとカタカナ、ASCII") == "ひらがなとカタカナ、ASCII"
+        mock_analyze.assert_not_called()
+
+
+class TestBatchConversion:
+    """convert_lines_to_kana() / convert_texts_to_kana() のテスト"""
+
+    def test_lines_match_single_conversion(self):
+        """行ごとの結果は convert_to_kana() と同じ"""
+        lines = ["第1章 はじめに", "", "English only", "信頼性は機能である。"]
+        assert convert_lines_to_kana(lines) == [convert_to_kana(line) for line in lines]
+
+    def test_texts_match_single_conversion(self):
+        """段落リストの結果は convert_to_kana() と同じで改行も保つ"""
+        texts = ["本章のまとめ\n監視とアラート", "", "かな\n\n漢字"]
+        assert convert_texts_to_kana(texts) == [convert_to_kana(text) for text in texts]
+
+    def test_repeated_lines_are_tagged_once(self):
+        """同じ行はキャッシュされ、1回だけ形態素解析する"""
+        with patch("src.mecab_reader._convert_words", side_effect=lambda line: line.upper()) as mock_words:
+            result = convert_lines_to_kana(["本章のまとめ", "本文", "本章のまとめ"])
+            convert_to_kana("本章のまとめ")
+        assert result == ["本章のまとめ", "本文", "本章のまとめ"]
+        assert mock_words.call_count == 2
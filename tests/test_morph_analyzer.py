@@ -0,0 +1,74 @@
+"""Tests for the shared MeCab analysis layer.
+
+Target functions:
+- src/morph_analyzer.py::analyze()
+- src/morph_analyzer.py::parse_feature()
+- src/morph_analyzer.py::feature_field()
+"""
+
+import pytest
+
+from src import mecab_reader, morph_analyzer, punctuation_normalizer
+from src.morph_analyzer import analyze, feature_field, get_tagger, parse_feature
+
+
+@pytest.fixture(autouse=True)
+def clear_analysis_cache():
+    """Start each test with an empty lattice cache."""
+    analyze.cache_clear()
+
+
+class TestAnalyze:
+    """analyze() のテスト"""
+
+    def test_surfaces_and_features(self):
+        """表層形と素性を保持する"""
+        lattice = analyze("漢字の読み")
+        assert lattice.surfaces == ("漢字", "の", "読み")
+        assert len(lattice) == 3
+        assert lattice.feature(0).kana == "カンジ"
+        assert lattice.feature(1).pos1 == "助詞"
+
+    def test_lattice_survives_later_tagging(self):
+        """後続の解析で tagger が再利用されても以前の結果は壊れない"""
+        lattice = analyze("漢字の読み")
+        analyze("別の文章です")
+        get_tagger()("さらに別の文章")
+        assert feature_field(lattice.features_raw[0], "kana") == "カンジ"
+
+    def test_same_text_reuses_lattice(self):
+        """同じテキストは再解析せずキャッシュを返す"""
+        first = analyze("本章のまとめ")
+        assert analyze("本章のまとめ") is first
+        assert analyze.cache_info().hits == 1
+
+    def test_stages_share_one_tagger_and_cache(self):
+        """句読点正規化とカナ変換は同じ解析結果を共有する"""
+        assert mecab_reader.analyze is morph_analyzer.analyze
+        assert punctuation_normalizer.analyze is morph_analyzer.analyze
+        analyze("漢字の読み")
+        mecab_reader._convert_line.cache_clear()
+        assert mecab_reader.convert_to_kana("漢字の読み") == "カンジのヨミ"
+        assert analyze.cache_info().hits == 1
+
+
+class TestFeatures:
+    """parse_feature() / feature_field() のテスト"""
+
+    @pytest.mark.parametrize("text", ["漢字の読み", "ｘｙｚｚｑ", "東京タワーへ行った。"])
+    def test_matches_fugashi_feature(self, text):
+        """fugashi の node.feature と同じ素性タプルを返す（未知語を含む）"""
+        expected = [node.feature for node in get_tagger()(text)]
+        lattice = analyze(text)
+        assert [lattice.feature(i) for i in range(len(lattice))] == expected
+        assert [feature_field(raw, "pos1") for raw in lattice.features_raw] == [f.pos1 for f in expected]
+
+    def test_quoted_field(self):
+        """カンマを含む（引用符付きの）素性も解析できる"""
+        raw = '補助記号,一般,*,*,*,*,",",",",","'
+        assert parse_feature(raw).pos1 == "補助記号"
+        assert feature_field(raw, "lForm") == ","
+
+    def test_unknown_field(self):
+        """辞書にない素性名は None"""
+        assert feature_field("名詞,普通名詞,一般", "no_such_field") is None
@@ -0,0 +1,138 @@
+"""Tests for number normalization.
+
+Target functions:
+- src/number_normalizer.py::normalize_numbers()
+- src/number_normalizer.py::number_to_japanese()
+- src/number_normalizer.py::decimal_to_japanese()
+- src/number_normalizer.py::read_with_counter()
+"""
+
+import pytest
+
+from src.number_normalizer import (
+    SMALL_NUMBER_READINGS,
+    decimal_to_japanese,
+    normalize_numbers,
+    number_to_japanese,
+    read_with_counter,
+)
+
+
+class TestNormalizeNumbers:
+    """normalize_numbers() の文脈判定テスト"""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("2024年1月1日", "にせんにじゅうよねんいちがついちにち"),
+            ("2024/3/14", "にせんにじゅうよねんさんがつじゅうよっか"),
+            ("2023年4月", "にせんにじゅうさんねんしがつ"),
+            ("12月25日", "じゅうにがつにじゅうごにち"),
+            ("1999年", "せんきゅうひゃくきゅうじゅうきゅうねん"),
+            ("10:30", "じゅうじさんじゅうふん"),
+            ("9時15分", "くじじゅうごふん"),
+            ("4時", "よじ"),
+            ("50%", "ごじゅうパーセント"),
+            ("3.5%", "さんてんごパーセント"),
+            ("3個", "さんこ"),
+            ("1人", "ひとり"),
+            ("第3章", "だいさん章"),
+            ("第3回", "第さんかい"),
+            ("3.14", "さんてんいちよん"),
+            ("価格は1000円です", "価格はせんえんです"),
+        ],
+    )
+    def test_contexts(self, text, expected):
+        """日付・時刻・パーセント・助数詞・第N章・単独の数字を判定する"""
+        assert normalize_numbers(text) == expected
+
+    def test_hour_followed_by_time(self):
+        """直後の数字が時刻として読まれる場合も「N時」を時刻として読む"""
+        assert normalize_numbers("4時6:13") == "よじろくじじゅうさんふん"
+
+    def test_hour_followed_by_year(self):
+        """「N時」の直後の年・日付は分として読まず、年・日付として読む"""
+        assert normalize_numbers("12時2024年") == "じゅうにじにせんにじゅうよねん"
+        assert normalize_numbers("10時12月5日") == "じゅうじじゅうにがついつか"
+        assert normalize_numbers("4:1805年") == "よん:せんはっぴゃくごねん"
+
+    def test_hour_followed_by_plain_digits(self):
+        """直後に単独の数字が続く「N時」は時刻として読まない"""
+        assert normalize_numbers("10時5") == "じゅう時ご"
+
+    def test_text_without_digits_is_unchanged(self):
+        """数字を含まないテキストはそのまま"""
+        text = "数字のない文章です。"
+        assert normalize_numbers(text) is text
+
+    def test_multiple_numbers(self):
+        """複数の数字を1回の走査で変換する"""
+        assert normalize_numbers("第2章の3個と50%") == "だいに章のさんことごじゅうパーセント"
+
+
+class TestNumberToJapanese:
+    """number_to_japanese() / decimal_to_japanese() のテスト"""
+
+    @pytest.mark.parametrize(
+        "n,expected",
+        [
+            (0, "ゼロ"),
+            (10, "じゅう"),
+            (300, "さんびゃく"),
+            (8000, "はっせん"),
+            (9999, "きゅうせんきゅうひゃくきゅうじゅうきゅう"),
+            (10000, "いちまん"),
+            (10001, "いちまんいち"),
+            (100000000, "いちおく"),
+            (1230000000000, "いちちょうにせんさんびゃくおく"),
+            (-12, "マイナスじゅうに"),
+        ],
+    )
+    def test_number_to_japanese(self, n, expected):
+        """読みテーブルと万・億・兆の組み立て"""
+        assert number_to_japanese(n) == expected
+
+    def test_small_number_table(self):
+        """0-9999の読みテーブル（0は空文字）"""
+        assert len(SMALL_NUMBER_READINGS) == 10000
+        assert SMALL_NUMBER_READINGS[0] == ""
+        assert SMALL_NUMBER_READINGS[3600] == "さんぜんろっぴゃく"
+
+    @pytest.mark.parametrize(
+        "s,expected",
+        [
+            ("3.14", "さんてんいちよん"),
+            (".5", "ゼロてんご"),
+            ("10.05", "じゅうてんゼロご"),
+            ("42", "よんじゅうに"),
+        ],
+    )
+    def test_decimal_to_japanese(self, s, expected):
+        """小数部は1桁ずつ読む"""
+        assert decimal_to_japanese(s) == expected
+
+
+class TestReadWithCounter:
+    """read_with_counter() のテスト"""
+
+    @pytest.mark.parametrize(
+        "n,counter,expected",
+        [
+            (1, "個", "いっこ"),
+            (2, "個", "にこ"),
+            (3, "本", "さんぼん"),
+            (20, "歳", "はたち"),
+            (50, "%", "ごじゅうパーセント"),
+            (5, "台", "ご台"),
+        ],
+    )
+    def test_readings(self, n, counter, expected):
+        """特殊読み・デフォルト読み・未知の助数詞"""
+        assert read_with_counter(n, counter) == expected
+
+    def test_memoized(self):
+        """同じ組み合わせはキャッシュから返す"""
+        read_with_counter.cache_clear()
+        read_with_counter(12, "回")
+        read_with_counter(12, "回")
+        assert read_with_counter.cache_info().hits == 1
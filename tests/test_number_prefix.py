@@ -4,7 +4,7 @@ Phase 3 RED Tests - US2: No.X -> ナンバーX 変換
 Tests for _clean_number_prefix function that converts No.X patterns to ナンバーX.
 """
 
-from src.text_cleaner import _clean_number_prefix
+from src.text_cleaner import _clean_chapter, _clean_number_prefix, _clean_number_prefix_and_chapter
 
 
 class TestCleanNumberPrefixBasic:
@@ -132,3 +132,12 @@ class TestCleanNumberPrefixEdgeCases:
         input_text = "ナンバー21を確認"
         result = _clean_number_prefix(input_text)
         assert result == input_text
+
+
+class TestCleanNumberPrefixAndChapter:
+    """No.X と Chapter X を1パスで変換する _clean_number_prefix_and_chapter のテスト"""
+
+    def test_same_as_sequential(self):
+        """個別に適用した場合と同じ結果"""
+        for text in ["Chapter 3のNo.5を参照", "no.1 chapter\t12 NO.7", "ChapterNo.5", "No.Chapter 2", "図なし"]:
+            assert _clean_number_prefix_and_chapter(text) == _clean_chapter(_clean_number_prefix(text))
@@ -0,0 +1,79 @@
+"""Tests for lazy page splitting of book.md.
+
+Target functions:
+- src/text_cleaner.py::iter_page_spans()
+- src/text_cleaner.py::iter_raw_pages()
+- src/text_cleaner.py::split_into_pages()
+- src/text_cleaner.py::strip_markdown()
+"""
+
+from unittest.mock import patch
+
+from src.text_cleaner import Page, iter_page_spans, iter_raw_pages, split_into_pages, strip_markdown
+
+BOOK_MD = """表紙
+--- Page 1 (page_0001.png) ---
+# はじめに
+API の説明。
+--- Page 2 (page_0002.png) ---
+
+--- Page 3 (page_0003.png) ---
+最後のページ"""
+
+
+class TestIterPageSpans:
+    """iter_page_spans() のテスト"""
+
+    def test_spans_cover_text_between_markers(self):
+        """マーカー間の範囲を返し、先頭マーカー前は含めない"""
+        spans = list(iter_page_spans(BOOK_MD))
+        assert [number for number, _, _ in spans] == [1, 2, 3]
+        assert [BOOK_MD[start:end] for _, start, end in spans] == [
+            "\n# はじめに\nAPI の説明。\n",
+            "\n\n",
+            "\n最後のページ",
+        ]
+
+    def test_no_markers(self):
+        """マーカーがなければ何も返さない"""
+        assert list(iter_page_spans("# Title\ntext")) == []
+
+    def test_is_lazy(self):
+        """最初のページは残りを走査する前に得られる"""
+        pages = iter_raw_pages(BOOK_MD)
+        assert next(pages) == Page(number=1, text="\n# はじめに\nAPI の説明。\n")
+
+
+class TestSplitIntoPages:
+    """split_into_pages() のテスト"""
+
+    def test_cleans_and_drops_empty_pages(self):
+        """クリーニング後に空のページは除外される"""
+        with patch("src.text_cleaner.clean_page_text", side_effect=lambda text: text.strip()):
+            pages = split_into_pages(BOOK_MD)
+        assert pages == [Page(number=1, text="# はじめに\nAPI の説明。"), Page(number=3, text="最後のページ")]
+
+
+class TestStripMarkdown:
+    """strip_markdown() のテスト"""
+
+    def test_removes_markup_but_keeps_terms(self):
+        """マークアップ・URL・コードを除去し、英字用語は読みに変換しない"""
+        text = "# Kubernetes 入門\n**API** を使う。詳細は https://example.com を参照。\n```\ncode_block\n```\n"
+        result = strip_markdown(text)
+        assert "Kubernetes" in result
+        assert "API" in result
+        assert "https://" not in result
+        assert "code_block" not in result
+        assert "#" not in result
+        assert "**" not in result
+
+    def test_skips_tts_normalization(self):
+        """句読点・数値・MeCab 変換は行わない"""
+        with (
+            patch("src.text_cleaner.normalize_numbers") as mock_numbers,
+            patch("src.text_cleaner.convert_to_kana") as mock_kana,
+        ):
+            assert strip_markdown("漢字と123") == "漢字と123"
+        mock_numbers.assert_not_called()
+        mock_kana.assert_not_called()
@@ -683,3 +683,48 @@ class TestNormalizeBracketsIntegration:
         result = normalize_punctuation(input_text)
 
         assert result == expected, f"コロンと鉤括弧の両方が変換されるべき: got '{result}', expected '{expected}'"
+
+
+class TestPunctuationNormalizer:
+    """PunctuationNormalizer（規則をコンパイル済みの正規化器）のテスト"""
+
+    def test_default_matches_normalize_punctuation(self):
+        """既定設定は normalize_punctuation と同じ結果"""
+        from src.punctuation_normalizer import PunctuationNormalizer, normalize_punctuation
+
+        input_text = (
+            "筆者は日本国内初のSREに関するテックカンファレンス「SRE NEXT」を立ち上げた\n\n注意：大規模に運用する"
+        )
+
+        assert PunctuationNormalizer().normalize(input_text) == normalize_punctuation(input_text)
+
+    def test_min_prefix_len(self):
+        """min_prefix_len で前置句の長さ条件を変えられる"""
+        from src.punctuation_normalizer import PunctuationNormalizer
+
+        input_text = "システム全体に関する議論"
+
+        assert PunctuationNormalizer(min_prefix_len=8).normalize_line(input_text) == input_text
+        assert PunctuationNormalizer(min_prefix_len=6).normalize_line(input_text) == "システム全体に関する、議論"
+
+    def test_custom_patterns(self):
+        """規則のパターンを差し替えられる"""
+        from src.punctuation_normalizer import PunctuationNormalizer
+
+        normalizer = PunctuationNormalizer(adverb_patterns=["要するに"], exclusion_suffixes=["ない"])
+
+        assert normalizer.normalize_line("要するに簡単だ") == "要するに、簡単だ"
+        assert normalizer.normalize_line("基本的に簡単だ") == "基本的に簡単だ"
+
+    def test_shared_normalizer_per_prefix_len(self):
+        """同じ min_prefix_len の正規化器は使い回される"""
+        from src.punctuation_normalizer import get_punctuation_normalizer
+
+        assert get_punctuation_normalizer(8) is get_punctuation_normalizer()
+        assert get_punctuation_normalizer(5).min_prefix_len == 5
+
+    def test_colon_cleanup_without_colon(self):
+        """コロンがなくても既存の「は、 」の空白は除去される"""
+        from src.punctuation_normalizer import _normalize_colons
+
+        assert _normalize_colons("項目は、 説明") == "項目は、説明"
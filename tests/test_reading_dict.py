@@ -0,0 +1,106 @@
+"""Tests for the compiled static reading rules.
+
+Target functions:
+- src/reading_dict.py::apply_reading_rules()
+- src/reading_dict.py::_compile_rules()
+"""
+
+import random
+
+import pytest
+
+from src.reading_dict import (
+    _COMPILED_RULES,
+    _RULE_PASSES,
+    _TERM_WORDS,
+    READING_RULES,
+    _compile_rules,
+    _literals_conflict,
+    _term,
+    apply_reading_rules,
+)
+
+
+def _apply_sequentially(text: str, rules=_COMPILED_RULES) -> str:
+    """Reference implementation: one pattern.sub per rule."""
+    for pattern, replacement in rules:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+class TestApplyReadingRules:
+    """apply_reading_rules() のテスト"""
+
+    def test_fewer_passes_than_rules(self):
+        """ルールは少数のパスにまとめられる"""
+        assert len(_RULE_PASSES) < len(READING_RULES) // 3
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "SREとCI/CDとCIの違い",
+            "EC2CIとS3の比較",
+            "GitHubとGitとVS Code",
+            "etc.やetc、...や…",
+            "a>=b、a<=b、a<>b、a!=b、a<>=b",
+            "#tag と # と C# と C++",
+            "$100、¥200、https://a/b",
+            "何か、何を、あの方",
+            "「カッコ」（括弧）[角]",
+        ],
+    )
+    def test_matches_sequential_rules(self, text):
+        """ルールを1つずつ適用した場合と同一の出力"""
+        assert apply_reading_rules(text) == _apply_sequentially(text)
+
+    def test_matches_sequential_rules_fuzz(self):
+        """ルールの語・記号を組み合わせたランダムな文字列で同一の出力"""
+        tokens = [_TERM_WORDS.get(pattern, pattern) for pattern, _ in READING_RULES]
+        tokens += list("&…—「」（）()[]\"'@#+-*=→>!<$¥/•～|:;！?") + ["...", "etc.", "の方", "何か"]
+        tokens += ["1", "23", "a", "Z", "S", "C", "I", "2", " ", "あ", "シ", "\n"]
+        rng = random.Random(0)
+        for _ in range(20000):
+            text = "".join(rng.choices(tokens, k=rng.randint(0, 12)))
+            assert apply_reading_rules(text) == _apply_sequentially(text)
+
+
+class TestCompileRules:
+    """_compile_rules() の衝突検出テスト"""
+
+    def test_overlapping_words_are_not_merged(self):
+        """重なりうる語は別パスになり、逐次適用と同じ結果になる"""
+        rules = [(_term("B-C"), "ビーシー"), (_term("A-B"), "エービー")]
+        passes = _compile_rules(rules)
+        assert len(passes) == 2
+        text = "A-B-C"
+        for rule_pass in passes:
+            text = rule_pass(text)
+        assert text == "A-ビーシー"
+
+    def test_independent_words_are_merged(self):
+        """独立した語は1パスにまとめられる"""
+        assert len(_compile_rules([(_term("SRE"), "エスアールイー"), (_term("API"), "エーピーアイ")])) == 1
+
+    def test_char_rules_are_merged(self):
+        """1文字ルールは出力が後続ルールに影響しない限り1パスにまとめられる"""
+        assert len(_compile_rules([(r"&", "アンド"), (r"[「」]", ""), (r"@", "アット")])) == 1
+        assert len(_compile_rules([(r"!", "="), (r"=", "イコール")])) == 2
+
+    def test_regex_rules_keep_own_pass(self):
+        """先読み等を含むルールは単独のパス"""
+        assert len(_compile_rules([(r"#(?=\w)", "シャープ"), (r"#", "")])) == 2
+
+    @pytest.mark.parametrize(
+        "earlier,later,conflict",
+        [
+            (("CI/CD", True, "シーアイシーディー"), ("CI", True, "シーアイ"), True),  # CI inside CI/CD
+            (("CI", True, "シーアイ"), ("EC2", True, "イーシーツー"), True),  # EC2 boundary sees the reading
+            (("SRE", True, "エスアールイー"), ("SLO", True, "エスエルオー"), False),
+            (("GitHub", True, "ギットハブ"), ("Git", True, "ギット"), False),  # Git in GitHub is not a word
+            (("<>", False, ""), (">=", False, "以上"), True),  # empty reading joins neighbours
+            (("の方", False, "のカタ"), ("何か", False, "ナニか"), False),
+        ],
+    )
+    def test_literals_conflict(self, earlier, later, conflict):
+        """重なり・境界変化・読みとの一致を衝突として検出する"""
+        assert _literals_conflict(earlier, later) is conflict
@@ -0,0 +1,168 @@
+"""Tests for the compiled reading-dictionary matcher.
+
+Target functions:
+- src/reading_matcher.py::ReadingMatcher
+- src/reading_matcher.py::load_reading_matcher()
+- src/llm_reading_generator.py::apply_llm_readings()
+"""
+
+import json
+import random
+import re
+
+import pytest
+
+from src.llm_reading_generator import apply_llm_readings
+from src.reading_matcher import ReadingMatcher, get_matcher_cache_path, get_reading_matcher, load_reading_matcher
+
+
+def _apply_sequentially(text: str, readings: dict[str, str]) -> str:
+    """Reference implementation: one re.sub per term, longest first."""
+    for term in sorted(readings, key=len, reverse=True):
+        text = re.sub(rf"(?<![A-Za-z]){re.escape(term)}(?![A-Za-z])", readings[term], text)
+    return text
+
+
+@pytest.fixture(autouse=True)
+def clear_matcher_memo(monkeypatch):
+    """Isolate the in-process matcher cache."""
+    monkeypatch.setattr("src.reading_matcher._MATCHER_MEMO", {})
+
+
+@pytest.fixture
+def dict_path(tmp_path):
+    """A readings.json file."""
+    path = tmp_path / "readings.json"
+    path.write_text(json.dumps({"API": "エーピーアイ", "REST API": "レストエーピーアイ"}), encoding="utf-8")
+    return path
+
+
+class TestReadingMatcher:
+    """ReadingMatcher.apply() のテスト"""
+
+    def test_longest_term_wins(self):
+        """長い用語が優先される"""
+        matcher = ReadingMatcher({"API": "エーピーアイ", "REST API": "レストエーピーアイ"})
+        assert matcher.apply("REST APIとAPI") == "レストエーピーアイとエーピーアイ"
+
+    def test_ascii_word_boundary(self):
+        """英字に隣接する部分一致は置換しない"""
+        matcher = ReadingMatcher({"API": "エーピーアイ"})
+        assert matcher.apply("APIs と RAPID と API2") == "APIs と RAPID と エーピーアイ2"
+
+    def test_empty_dictionary(self):
+        """空の辞書は偽で、テキストを変えない"""
+        matcher = ReadingMatcher({})
+        assert not matcher
+        assert matcher.apply("API") == "API"
+
+    def test_boundary_sees_replaced_neighbour(self):
+        """境界判定は先に置換された読みを隣接文字として扱う"""
+        readings = {"Foo": "フー", ".JS": "ジェイエス"}
+        matcher = ReadingMatcher(readings)
+        assert matcher.apply("Foo.JS") == _apply_sequentially("Foo.JS", readings) == "フージェイエス"
+
+    def test_earlier_term_of_same_length_wins(self):
+        """同じ長さの用語は辞書順で先のものが優先される"""
+        readings = {"B-C": "ビーシー", "A-B": "エービー"}
+        assert ReadingMatcher(readings).apply("A-B-C") == "A-ビーシー"
+
+    @pytest.mark.parametrize(
+        "readings,single_pass",
+        [
+            ({"API": "エーピーアイ", "SRE": "エスアールイー"}, True),
+            ({"API": "エーピーアイ", "ID": "I D"}, True),
+            ({"REST API": "レスト API", "API": "エーピーアイ"}, False),
+            ({"API": ""}, False),
+            ({"API": "\\g<0>"}, False),
+        ],
+    )
+    def test_falls_back_when_single_pass_is_not_exact(self, readings, single_pass):
+        """読みが後続の用語に一致しうる辞書は逐次置換に切り替える"""
+        matcher = ReadingMatcher(readings)
+        assert (matcher._trie is not None) is single_pass
+        text = "REST API と ID と API"
+        assert matcher.apply(text) == _apply_sequentially(text, readings)
+
+    @pytest.mark.parametrize("readings_pool", [["エー", "ビーZ", "Zシー", "ー"], ["エー", "A", "x.y", "ー"]])
+    def test_matches_sequential_replacement(self, readings_pool):
+        """ランダムな辞書・テキストで逐次置換と同一の出力"""
+        rng = random.Random(0)
+        alphabet = "ABab.-# 1"
+        for _ in range(2000):
+            readings = {
+                "".join(rng.choices(alphabet, k=rng.randint(1, 4))): rng.choice(readings_pool)
+                for _ in range(rng.randint(1, 8))
+            }
+            text = "".join(rng.choices(alphabet + "Zあエ", k=rng.randint(0, 40)))
+            assert ReadingMatcher(readings).apply(text) == _apply_sequentially(text, readings)
+
+    def test_payload_round_trip(self):
+        """to_payload() から同じ置換結果のマッチャーを復元できる"""
+        matcher = ReadingMatcher({"API": "エーピーアイ", "SRE": "エスアールイー"})
+        restored = ReadingMatcher.from_payload(matcher.to_payload())
+        assert restored.entries == matcher.entries
+        assert restored._trie == matcher._trie
+        assert restored.apply("SREとAPI") == "エスアールイーとエーピーアイ"
+
+    def test_unsupported_payload(self):
+        """バージョン違いのペイロードは ValueError"""
+        with pytest.raises(ValueError):
+            ReadingMatcher.from_payload({"version": -1, "entries": []})
+
+
+class TestApplyLlmReadings:
+    """apply_llm_readings() のテスト"""
+
+    def test_same_result_as_sequential(self):
+        """辞書を直接渡しても逐次置換と同じ結果"""
+        readings = {"Docker": "ドッカー", "Docker Compose": "ドッカーコンポーズ"}
+        text = "Docker ComposeとDockerfileとDocker"
+        assert apply_llm_readings(text, readings) == _apply_sequentially(text, readings)
+
+    def test_reuses_matcher_per_dictionary(self):
+        """同じ内容の辞書ではマッチャーを再利用する"""
+        matcher = get_reading_matcher({"API": "エーピーアイ"})
+        assert get_reading_matcher({"API": "エーピーアイ"}) is matcher
+        assert get_reading_matcher({"API": "アピ"}) is not matcher
+
+
+class TestLoadReadingMatcher:
+    """load_reading_matcher() のテスト"""
+
+    def test_missing_dictionary(self, tmp_path):
+        """辞書がなければ None"""
+        assert load_reading_matcher(tmp_path / "readings.json") is None
+
+    def test_cached_in_process(self, dict_path):
+        """同じ辞書ファイルは同じマッチャーを返す"""
+        matcher = load_reading_matcher(dict_path)
+        assert matcher is not None
+        assert load_reading_matcher(dict_path) is matcher
+        assert matcher.apply("REST API") == "レストエーピーアイ"
+
+    def test_persisted_next_to_dictionary(self, dict_path, monkeypatch):
+        """辞書の隣に保存され、別プロセスでは JSON を再構築せず読み込む"""
+        load_reading_matcher(dict_path)
+        assert get_matcher_cache_path(dict_path) == dict_path.parent / ".readings.json.matcher.bin"
+        assert get_matcher_cache_path(dict_path).exists()
+
+        monkeypatch.setattr("src.reading_matcher._MATCHER_MEMO", {})
+        monkeypatch.setattr("src.reading_matcher.json.loads", _fail)
+        assert load_reading_matcher(dict_path).apply("API") == "エーピーアイ"
+
+    def test_invalidated_when_dictionary_changes(self, dict_path, monkeypatch):
+        """辞書の内容が変わると再構築される"""
+        load_reading_matcher(dict_path)
+        dict_path.write_text(json.dumps({"API": "アピ"}), encoding="utf-8")
+        monkeypatch.setattr("src.reading_matcher._MATCHER_MEMO", {})
+        assert load_reading_matcher(dict_path).apply("API") == "アピ"
+
+    def test_corrupt_cache_is_rebuilt(self, dict_path):
+        """壊れた保存ファイルは無視して再構築する"""
+        get_matcher_cache_path(dict_path).write_bytes(b"\x00garbage")
+        assert load_reading_matcher(dict_path).apply("API") == "エーピーアイ"
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("dictionary JSON should not be parsed")
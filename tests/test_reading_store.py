@@ -0,0 +1,88 @@
+"""Tests for the cross-book reading store.
+
+Target functions:
+- src/reading_store.py::ReadingStore
+- src/reading_store.py::lookup_shared_readings()
+- src/reading_store.py::add_shared_readings()
+"""
+
+import pytest
+
+from src.reading_store import (
+    ReadingStore,
+    add_shared_readings,
+    get_reading_store_path,
+    lookup_shared_readings,
+    open_reading_store,
+)
+
+
+@pytest.fixture
+def store_path(tmp_path, monkeypatch):
+    """Point the default store location at a temporary data dir."""
+    monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+    return get_reading_store_path()
+
+
+class TestReadingStore:
+    """ReadingStore のテスト"""
+
+    def test_default_path_under_data_dir(self, store_path, tmp_path):
+        """既定の保存先は data/readings.sqlite3"""
+        assert store_path == tmp_path / "data" / "readings.sqlite3"
+
+    def test_add_and_lookup(self, store_path):
+        """登録した読みを一括検索できる"""
+        with ReadingStore.open() as store:
+            store.add({"API": "エーピーアイ", "SRE": "エスアールイー"}, model="m", source_hash="h")
+            assert store.lookup(["API", "SRE", "Unknown"]) == {"API": "エーピーアイ", "SRE": "エスアールイー"}
+            assert len(store) == 2
+        assert store_path.exists()
+
+    def test_persists_across_connections(self, store_path):
+        """別接続（別書籍の実行）からも参照できる"""
+        with ReadingStore.open() as store:
+            store.add({"Kubernetes": "クバネティス"})
+        with ReadingStore.open() as store:
+            assert store.lookup(["Kubernetes"]) == {"Kubernetes": "クバネティス"}
+
+    def test_lookup_is_case_sensitive(self, store_path):
+        """用語は完全一致で検索する"""
+        with ReadingStore.open() as store:
+            store.add({"Go": "ゴー"})
+            assert store.lookup(["go", "GO"]) == {}
+
+    def test_add_replaces_reading_and_provenance(self, store_path):
+        """同じ用語の再登録で読み・出自が更新される"""
+        with ReadingStore.open() as store:
+            store.add({"API": "アピ"}, model="old", source_hash="book1")
+            store.add({"API": "エーピーアイ"}, model="new", source_hash="book2")
+            assert store.lookup(["API"]) == {"API": "エーピーアイ"}
+            assert store.provenance("API") == ("new", "book2")
+            assert store.provenance("Unknown") is None
+
+    def test_bulk_lookup_beyond_batch_size(self, store_path):
+        """バッチサイズを超える件数も一括検索できる"""
+        readings = {f"TERM{i}": f"ターム{i}" for i in range(1200)}
+        with ReadingStore.open() as store:
+            store.add(readings)
+            assert store.lookup(list(readings) + ["missing"]) == readings
+
+
+class TestBestEffortHelpers:
+    """ストアが使えない場合も処理を止めないヘルパーのテスト"""
+
+    def test_round_trip(self, store_path):
+        """add_shared_readings で登録し lookup_shared_readings で取得する"""
+        add_shared_readings({"Docker": "ドッカー"}, model="m", source_hash="h")
+        assert lookup_shared_readings(["Docker", "API"]) == {"Docker": "ドッカー"}
+
+    def test_unavailable_store(self, tmp_path):
+        """作成できない場所では None / 空辞書を返す"""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        path = blocker / "readings.sqlite3"
+
+        assert open_reading_store(path) is None
+        assert lookup_shared_readings(["API"], path=path) == {}
+        add_shared_readings({"API": "エーピーアイ"}, path=path)
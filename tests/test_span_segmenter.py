@@ -0,0 +1,129 @@
+"""Tests for the shared TTS chunk segmenter.
+
+Target functions:
+- src/span_segmenter.py::SpanSegmenter
+- src/text_cleaner.py::split_text_into_chunks()
+- src/text_cleaner.py::split_span_into_chunks()
+- src/dialogue_text_splitter.py::split_text()
+"""
+
+from fractions import Fraction
+
+import pytest
+
+from src.dialogue_text_splitter import split_text
+from src.span_segmenter import SpanSegmenter
+from src.text_cleaner import split_span_into_chunks, split_text_into_chunks
+
+
+def _chunks(segmenter: SpanSegmenter, text: str) -> list[str]:
+    return [text[start:end] for start, end in segmenter.spans(text)]
+
+
+class TestSpanSegmenter:
+    """SpanSegmenter のテスト"""
+
+    def test_short_text_single_span(self):
+        """最大長以内のテキストはそのまま 1 スパン（空白のみなら空）"""
+        segmenter = SpanSegmenter([["。"]], max_length=10)
+        assert segmenter.spans(" 短い文。 ") == [(0, 6)]
+        assert segmenter.spans("   ") == []
+
+    def test_group_priority(self):
+        """優先度の高いグループの区切りを、後方に低優先度の区切りがあっても優先する"""
+        segmenter = SpanSegmenter([["。"], ["、"]], max_length=12)
+        text = "あいうえお。かきく、けこさしすせそ"
+        assert _chunks(segmenter, text) == ["あいうえお。", "かきく、けこさしすせそ"]
+
+    def test_latest_delimiter_within_group(self):
+        """同じグループ内では最も後ろで終わる区切りを使う"""
+        segmenter = SpanSegmenter([["。", "！"]], max_length=10)
+        text = "あいう。えお！かきくけこさし"
+        assert _chunks(segmenter, text) == ["あいう。えお！", "かきくけこさし"]
+
+    def test_min_split_ratio(self):
+        """チャンク先頭付近の区切りでは分割せず、最大長で切る"""
+        text = "あ。いうえおかきくけこさしすせそ"
+        assert _chunks(SpanSegmenter([["。"]], max_length=8), text) == ["あ。いうえおかき", "くけこさしすせそ"]
+        assert _chunks(SpanSegmenter([["。"]], max_length=8, min_split_ratio=0), text) == [
+            "あ。",
+            "いうえおかきくけ",
+            "こさしすせそ",
+        ]
+
+    def test_multi_char_delimiter(self):
+        """複数文字の区切りは末尾の後ろで分割する"""
+        segmenter = SpanSegmenter([["\n\n"]], max_length=10)
+        assert _chunks(segmenter, "あいうえお\n\nかきくけこ") == ["あいうえお", "かきくけこ"]
+
+    def test_spans_within_buffer(self):
+        """バッファ内の範囲を、コピーせずにオフセットで返す"""
+        segmenter = SpanSegmenter([["。"]], max_length=6)
+        buffer = "XXあいう。えおか。YY"
+        spans = segmenter.spans(buffer, 2, 10)
+        assert [buffer[start:end] for start, end in spans] == ["あいう。", "えおか。"]
+
+    def test_invalid_configuration(self):
+        """最大長 0 以下・空の区切りはエラー"""
+        with pytest.raises(ValueError):
+            SpanSegmenter([["。"]], max_length=0)
+        with pytest.raises(ValueError):
+            SpanSegmenter([[""]], max_length=10)
+
+    def test_exact_ratio(self):
+        """Fraction の比率は丸め誤差なく max_length // 3 と一致する"""
+        for max_length in range(1, 1000):
+            assert SpanSegmenter([], max_length, Fraction(1, 3)).min_split == max_length // 3
+
+
+class TestCallers:
+    """split_text_into_chunks / split_text が共通の分割器を使うことのテスト"""
+
+    def test_split_text_into_chunks_sentence_boundaries(self):
+        """書籍パイプラインは句点で区切り、各チャンクは最大長以内"""
+        text = "これは最初の文です。" * 30
+        chunks = split_text_into_chunks(text, 50)
+        assert all(len(chunk) <= 50 for chunk in chunks)
+        assert all(chunk.endswith("。") for chunk in chunks)
+        assert "".join(chunks) == text
+
+    def test_dialogue_split_within_max_length(self):
+        """対話分割は文末記号で区切り、各チャンクを最大長以内に収める"""
+        text = "今日は良い天気です。" * 10 + "しかし、明日は雨が降るかもしれません。" * 5
+        chunks = split_text(text, 40)
+        assert all(len(chunk) <= 40 for chunk in chunks)
+        assert all(chunk.endswith("。") for chunk in chunks)
+        assert "".join(chunks) == text
+
+    def test_dialogue_split_falls_back_to_comma(self):
+        """文末記号が無い長文は読点で区切る"""
+        text = "ここでは長い説明が続き、" * 10
+        chunks = split_text(text, 30)
+        assert all(len(chunk) <= 30 and chunk.endswith("、") for chunk in chunks)
+        assert "".join(chunks) == text
+
+    def test_dialogue_short_text_unchanged(self):
+        """最大長以内のテキストは分割しない"""
+        assert split_text("短い発話。", 300) == ["短い発話。"]
+        assert split_text("", 300) == []
+
+
+class TestSplitSpanIntoChunks:
+    """split_span_into_chunks() のテスト"""
+
+    @pytest.mark.parametrize(
+        "text,max_chars",
+        [
+            ("短い文。", 500),
+            ("   ", 500),
+            ("あいうえお。" * 30, 50),
+            ("長い文章、読点で区切る、" * 20 + "\n\n次の段落。", 40),
+            ("区切りなし" * 50, 30),
+            ("  前後に空白がある。  " * 10, 25),
+        ],
+    )
+    def test_spans_match_split_text_into_chunks(self, text, max_chars):
+        """バッファ内のどの位置でもスパン版と文字列版が一致する"""
+        buffer = "前置き" + text + "後置き"
+        spans = split_span_into_chunks(buffer, 3, 3 + len(text), max_chars)
+        assert [buffer[s:e] for s, e in spans] == split_text_into_chunks(text, max_chars)
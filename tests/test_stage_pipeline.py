@@ -0,0 +1,229 @@
+"""Tests for the bounded-queue staged pipeline.
+
+Target functions:
+- src/stage_pipeline.py::StagedPipeline
+- src/stage_pipeline.py::StageQueue
+- src/chapter_processor.py::process_chapters() (text / synthesis / writer stages)
+"""
+
+import argparse
+import logging
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.chapter_processor import process_chapters
+from src.stage_pipeline import StagedPipeline, StageStats
+from src.xml_parser import ContentItem, HeadingInfo
+
+
+class TestStagedPipeline:
+    """StagedPipeline のテスト"""
+
+    def test_items_pass_in_order(self):
+        """スレッドのステージから呼び出し側へ順序通りに渡る"""
+        with StagedPipeline() as pipeline:
+            numbers = pipeline.queue(2)
+
+            def produce(stats: StageStats) -> None:
+                for n in range(100):
+                    numbers.put(n)
+                numbers.close()
+
+            pipeline.start_thread("produce", produce)
+            assert list(numbers) == list(range(100))
+
+    def test_backpressure(self):
+        """キューが満杯の間、先行するステージは put で待つ"""
+        produced = []
+
+        with StagedPipeline() as pipeline:
+            numbers = pipeline.queue(2)
+
+            def produce(stats: StageStats) -> None:
+                for n in range(10):
+                    numbers.put(n)
+                    produced.append(n)
+                numbers.close()
+
+            pipeline.start_thread("produce", produce)
+            time.sleep(0.3)
+            # 消費前はキューの容量分しか進めない
+            assert len(produced) <= 3
+            assert list(numbers) == list(range(10))
+
+    def test_thread_error_is_raised(self):
+        """スレッドのステージの例外は with ブロックから送出され、待っているステージは中断する"""
+        with pytest.raises(ValueError, match="broken"):
+            with StagedPipeline() as pipeline:
+                numbers = pipeline.queue(2)
+
+                def produce(stats: StageStats) -> None:
+                    numbers.put(1)
+                    raise ValueError("broken")
+
+                pipeline.start_thread("produce", produce)
+                list(numbers)
+
+    def test_caller_error_aborts_threads(self):
+        """呼び出し側の例外で、満杯のキューを待つステージも終了する"""
+        with pytest.raises(RuntimeError, match="caller"):
+            with StagedPipeline() as pipeline:
+                numbers = pipeline.queue(1)
+
+                def produce(stats: StageStats) -> None:
+                    for n in range(10):
+                        numbers.put(n)
+
+                pipeline.start_thread("produce", produce)
+                raise RuntimeError("caller")
+
+        assert pipeline.abort.is_set()
+
+    def test_utilization_logged(self, caplog):
+        """終了時に各ステージの稼働率とボトルネックを記録する"""
+        with caplog.at_level(logging.INFO, logger="src.stage_pipeline"):
+            with StagedPipeline() as pipeline:
+                stats = pipeline.stage("work")
+                pipeline.stage("idle")
+                with stats.busy():
+                    sum(range(100_000))
+
+        assert stats.busy_seconds > 0
+        assert "Stage utilization over" in caplog.text
+        assert "(bottleneck: work)" in caplog.text
+
+
+class TestProcessChaptersStages:
+    """process_chapters のステージ構成のテスト"""
+
+    def _run(self, tmp_path, items, chapter=None, **patches):
+        args = argparse.Namespace(max_chunk_chars=500, style_id=13, speed=1.0, chapter=chapter)
+        generate = patches.get("generate", lambda synthesizer, text, **kwargs: (np.full(len(text), 0.5), 24000))
+        with (
+            patch("src.chapter_processor.clean_page_text", side_effect=patches.get("clean", lambda t: t)),
+            patch("src.chapter_processor.generate_audio", side_effect=generate) as mock_gen,
+            patch("src.chapter_processor.save_audio") as mock_save,
+            patch("src.chapter_processor.concatenate_audio_files") as mock_concat,
+        ):
+            wav_files = process_chapters(items, object(), tmp_path, args)
+        self.mock_concat = mock_concat
+        return wav_files, mock_gen, mock_save
+
+    def test_cleaning_runs_in_text_stage(self, tmp_path):
+        """クリーニングは合成とは別のスレッドで行い、結果は文書順に保存される"""
+        cleaning_threads = set()
+
+        def clean(text):
+            cleaning_threads.add(threading.current_thread().name)
+            return text
+
+        items = [ContentItem("paragraph", f"第{i}段落。", None, 1 + i // 3) for i in range(9)]
+        wav_files, mock_gen, mock_save = self._run(tmp_path, items, clean=clean)
+
+        assert cleaning_threads == {"stage-text"}
+        assert [call.kwargs["text"] for call in mock_gen.call_args_list] == [item.text for item in items]
+        assert [path.name for path in wav_files] == [
+            "ch01_untitled.wav",
+            "ch02_untitled.wav",
+            "ch03_untitled.wav",
+            "book.wav",
+        ]
+        assert [len(call.args[0]) for call in mock_save.call_args_list] == [15, 15, 15]
+
+    def test_cleaning_error_propagates(self, tmp_path):
+        """テキスト段階の例外は process_chapters から送出される"""
+
+        def clean(text):
+            raise ValueError("bad text")
+
+        with pytest.raises(ValueError, match="bad text"):
+            self._run(tmp_path, [ContentItem("paragraph", "本文。", None, None)], clean=clean)
+
+    def test_progress_logged_by_synthesis_stage(self, tmp_path, caplog):
+        """章・節の進捗ログは先行するテキスト段階ではなく、合成段階が到達した時点で出す"""
+        items = [
+            ContentItem("heading", "第一章", HeadingInfo(1, "1", "第一章"), 1),
+            ContentItem("heading", "節", HeadingInfo(2, "1.1", "節"), 1),
+            ContentItem("paragraph", "一章の本文。", None, 1),
+            ContentItem("paragraph", "二章の本文。", None, 2),
+        ]
+
+        def generate(synthesizer, text, **kwargs):
+            logging.getLogger("src.chapter_processor").info("synthesized %s", text)
+            return np.full(len(text), 0.5), 24000
+
+        with caplog.at_level(logging.INFO, logger="src.chapter_processor"):
+            self._run(tmp_path, items, generate=generate)
+
+        progress = [
+            record
+            for record in caplog.records
+            if record.getMessage().startswith(("Processing", "  Section", "synthesized"))
+        ]
+        assert [record.getMessage() for record in progress] == [
+            "Processing Chapter 1: 第一章",
+            "synthesized 第一章",
+            "  Section 1.1: 節",
+            "synthesized 節",
+            "synthesized 一章の本文。",
+            "Processing Chapter 2: untitled",
+            "synthesized 二章の本文。",
+        ]
+        assert {record.threadName for record in progress} == {threading.current_thread().name}
+
+    def test_synthesis_starts_before_input_is_read(self, tmp_path):
+        """入力を読み終える前に最初の章の合成が始まる"""
+        synthesized = threading.Event()
+        seen_before_rest = []
+
+        def items():
+            yield ContentItem("paragraph", "一章の本文。", None, 1)
+            seen_before_rest.append(synthesized.wait(timeout=5))
+            yield ContentItem("paragraph", "二章の本文。", None, 2)
+
+        def generate(synthesizer, text, **kwargs):
+            synthesized.set()
+            return np.full(len(text), 0.5), 24000
+
+        wav_files, _, _ = self._run(tmp_path, items(), generate=generate)
+
+        assert seen_before_rest == [True]
+        assert [path.name for path in wav_files] == ["ch01_untitled.wav", "ch02_untitled.wav", "book.wav"]
+
+    def test_out_of_order_chapters(self, tmp_path):
+        """番号順でない章は後回しにし、book.wav は章番号順に連結する"""
+        items = [
+            ContentItem("paragraph", "前書き。", None, None),
+            ContentItem("paragraph", "二章。", None, 2),
+            ContentItem("paragraph", "一章。", None, 1),
+            ContentItem("paragraph", "三章。", None, 3),
+        ]
+        wav_files, mock_gen, _ = self._run(tmp_path, items)
+
+        assert [call.kwargs["text"] for call in mock_gen.call_args_list] == ["二章。", "三章。", "一章。"]
+        assert [path.name for path in wav_files] == [
+            "ch01_untitled.wav",
+            "ch02_untitled.wav",
+            "ch03_untitled.wav",
+            "book.wav",
+        ]
+        assert [path.name for path in self.mock_concat.call_args.args[0]] == [
+            "ch01_untitled.wav",
+            "ch02_untitled.wav",
+            "ch03_untitled.wav",
+        ]
+
+    def test_single_chapter_run_keeps_book_wav(self, tmp_path):
+        """--chapter 実行では章ファイルだけを書き、既存の book.wav は変更しない"""
+        (tmp_path / "book.wav").write_bytes(b"full book")
+        items = [ContentItem("paragraph", "二章の本文。", None, 2)]
+
+        wav_files, _, _ = self._run(tmp_path, items, chapter=2)
+
+        assert [path.name for path in wav_files] == ["ch02_untitled.wav"]
+        self.mock_concat.assert_not_called()
+        assert (tmp_path / "book.wav").read_bytes() == b"full book"
@@ -0,0 +1,152 @@
+"""Tests for parallel chunk synthesis.
+
+Target functions:
+- src/synthesis_pool.py::SynthesisPool
+- src/synthesis_pool.py::get_worker_cpu_threads()
+- src/chapter_processor.py::process_chapters() (SynthesisPool)
+- src/xml_pipeline.py::parse_args() (--workers)
+"""
+
+import argparse
+import io
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from src.chapter_processor import process_chapters
+from src.synthesis_pool import SynthesisPool, get_worker_cpu_threads
+from src.voicevox_client import VoicevoxConfig
+from src.xml_parser import CHAPTER_MARKER, ContentItem, HeadingInfo
+from src.xml_pipeline import parse_args
+
+# File the fake synthesizer logs its calls to (inherited by forked workers)
+CALL_LOG: Path | None = None
+
+
+class FakeSynthesizer:
+    """VOICEVOX を使わない合成器（テキスト長 × 10 サンプルの WAV を返す）"""
+
+    def __init__(self, config: VoicevoxConfig):
+        self.config = config
+
+    def initialize(self) -> None:
+        pass
+
+    def load_model_for_style_id(self, style_id: int) -> None:
+        pass
+
+    def synthesize(self, text: str, style_id: int | None = None, speed_scale: float = 1.0) -> bytes:
+        assert CALL_LOG is not None
+        with open(CALL_LOG, "a", encoding="utf-8") as f:
+            f.write(f"{os.getpid()}\t{self.config.cpu_num_threads}\t{text}\n")
+        buffer = io.BytesIO()
+        sf.write(buffer, np.full(len(text) * 10, 0.5), 24000, format="WAV")
+        return buffer.getvalue()
+
+
+@pytest.fixture
+def fake_voicevox(tmp_path):
+    """ワーカーの VoicevoxSynthesizer を FakeSynthesizer に差し替え、呼び出しログを返す"""
+    global CALL_LOG
+    CALL_LOG = tmp_path / "calls.tsv"
+    CALL_LOG.touch()
+    with patch("src.synthesis_pool.VoicevoxSynthesizer", FakeSynthesizer):
+        yield CALL_LOG
+    CALL_LOG = None
+
+
+def _logged_calls(call_log: Path) -> list[tuple[int, int, str]]:
+    rows = [line.split("\t") for line in call_log.read_text(encoding="utf-8").splitlines()]
+    return [(int(pid), int(threads), text) for pid, threads, text in rows]
+
+
+class TestSynthesisPool:
+    """SynthesisPool のテスト"""
+
+    def test_results_in_input_order(self, fake_voicevox):
+        """並列合成の結果は入力順に並び、正規化されている"""
+        texts = ["あ", "いいいいい", "うう", "えええ"]
+        with SynthesisPool(VoicevoxConfig(), workers=2) as pool:
+            results = pool.synthesize(texts, style_id=13, speed=1.0)
+
+        assert [len(waveform) for waveform, _ in results] == [10, 50, 20, 30]
+        assert all(sr == 24000 for _, sr in results)
+        assert all(np.isclose(np.max(np.abs(waveform)), 0.9) for waveform, _ in results)
+        calls = _logged_calls(fake_voicevox)
+        assert os.getpid() not in {pid for pid, _, _ in calls}
+        assert {threads for _, threads, _ in calls} == {get_worker_cpu_threads(2)}
+
+    def test_longest_first_dispatch(self, fake_voicevox):
+        """長いチャンクから順にワーカーへ渡す"""
+        texts = ["あ", "いいいいい", "うう", "えええ"]
+        with SynthesisPool(VoicevoxConfig(), workers=1) as pool:
+            pool.synthesize(texts, style_id=13, speed=1.0)
+
+        assert [text for _, _, text in _logged_calls(fake_voicevox)] == ["いいいいい", "えええ", "うう", "あ"]
+
+    def test_cpu_threads_split_between_workers(self, fake_voicevox):
+        """未指定の CPU スレッド数はワーカー数で等分し、指定値はそのまま使う"""
+        assert SynthesisPool(VoicevoxConfig(), workers=2).config.cpu_num_threads == get_worker_cpu_threads(2)
+        assert SynthesisPool(VoicevoxConfig(cpu_num_threads=3), workers=2).config.cpu_num_threads == 3
+        assert get_worker_cpu_threads(10_000) == 1
+
+    def test_invalid_usage(self):
+        """ワーカー数 0 以下はエラー、開始前の合成もエラー"""
+        with pytest.raises(ValueError):
+            SynthesisPool(VoicevoxConfig(), workers=0)
+        with pytest.raises(RuntimeError):
+            SynthesisPool(VoicevoxConfig(), workers=1).synthesize(["あ"], style_id=13, speed=1.0)
+
+
+class TestProcessChaptersWithPool:
+    """SynthesisPool を使った章ごとの音声生成テスト"""
+
+    def test_chapter_audio_in_document_order(self, fake_voicevox, tmp_path):
+        """章ごとにまとめて並列合成し、効果音とチャンクを文書順に連結する"""
+        items = [
+            ContentItem("heading", CHAPTER_MARKER + "第一章", HeadingInfo(1, "1", "第一章"), 1),
+            ContentItem("paragraph", "みじかい。", None, 1),
+            ContentItem("paragraph", "すこしながいぶんしょうです。", None, 1),
+            ContentItem("paragraph", "にしょうめ。", None, 2),
+        ]
+        args = argparse.Namespace(max_chunk_chars=500, style_id=13, speed=1.0, chapter=None)
+        chapter_sound = np.ones(7, dtype=np.float32)
+        saved = {}
+
+        with (
+            patch("src.chapter_processor.save_audio", side_effect=lambda w, sr, p: saved.setdefault(p.name, w)),
+            patch("src.chapter_processor.concatenate_audio_files"),
+            SynthesisPool(VoicevoxConfig(), workers=2) as pool,
+        ):
+            process_chapters(
+                items,
+                synthesizer=pool,
+                output_dir=tmp_path / "out",
+                args=args,
+                chapter_sound=chapter_sound,
+                cleaned=True,
+            )
+
+        # 効果音 7 + 「第一章」30 + 「みじかい。」50 + 「すこしながいぶんしょうです。」140
+        assert len(saved["ch01_untitled.wav"]) == 7 + 30 + 50 + 140
+        assert np.all(saved["ch01_untitled.wav"][:7] == 1)
+        assert len(saved["ch02_untitled.wav"]) == 60
+        assert sorted(text for _, _, text in _logged_calls(fake_voicevox)) == sorted(
+            ["第一章", "みじかい。", "すこしながいぶんしょうです。", "にしょうめ。"]
+        )
+
+
+class TestParseArgsWorkers:
+    """--workers オプションのテスト"""
+
+    def test_workers_default_is_one(self):
+        """デフォルトは 1（このプロセスで合成）"""
+        assert parse_args(["-i", "book.xml"]).workers == 1
+
+    def test_workers_custom(self):
+        """--workers N を整数で受け取る"""
+        assert parse_args(["-i", "book.xml", "--workers", "4"]).workers == 4
@@ -12,6 +12,7 @@ Tasks:
 - T011: 出力ディレクトリ自動作成テスト
 """
 
+import json
 from pathlib import Path
 from unittest.mock import patch
 
@@ -22,6 +23,12 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 SAMPLE_BOOK2_XML = FIXTURES_DIR / "sample_book2.xml"
 
 
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    """Keep caches (parsed book, cleaned items) out of the real data dir."""
+    monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+
+
 # =============================================================================
 # T008: CLI 引数パーステスト
 # =============================================================================
@@ -147,7 +154,7 @@ class TestMainGeneratesCleanedText:
 
         output_dir = tmp_path / "output"
 
-        with patch("src.text_cleaner_cli.init_for_content"):
+        with patch("src.text_cleaner_cli.init_for_hash"):
             main(["--input", str(SAMPLE_BOOK2_XML), "--output", str(output_dir)])
 
         # 出力ディレクトリ内（ハッシュベースサブディレクトリ）に cleaned_text.txt が存在するべき
@@ -162,7 +169,7 @@ class TestMainGeneratesCleanedText:
 
         output_dir = tmp_path / "output"
 
-        with patch("src.text_cleaner_cli.init_for_content"):
+        with patch("src.text_cleaner_cli.init_for_hash"):
             main(["--input", str(SAMPLE_BOOK2_XML), "--output", str(output_dir)])
 
         cleaned_files = list(output_dir.rglob("cleaned_text.txt"))
@@ -177,7 +184,7 @@ class TestMainGeneratesCleanedText:
 
         output_dir = tmp_path / "output"
 
-        with patch("src.text_cleaner_cli.init_for_content"):
+        with patch("src.text_cleaner_cli.init_for_hash"):
             main(["--input", str(SAMPLE_BOOK2_XML), "--output", str(output_dir)])
 
         # WAV ファイルが生成されないことを確認
@@ -203,7 +210,7 @@ class TestMainGeneratesCleanedText:
 
         output_dir = tmp_path / "output"
 
-        with patch("src.text_cleaner_cli.init_for_content"):
+        with patch("src.text_cleaner_cli.init_for_hash"):
             main(["--input", str(xml_path), "--output", str(output_dir)])
 
         cleaned_files = list(output_dir.rglob("cleaned_text.txt"))
@@ -214,6 +221,29 @@ class TestMainGeneratesCleanedText:
         assert "===" in content, f"cleaned_text.txt に章区切りマーカー（=== 形式）が含まれるべき: {content!r}"
 
 
+class TestMainWritesCleanedItems:
+    """xml-tts 用の cleaned_items.jsonl 出力を検証する。"""
+
+    def test_cleaned_items_match_cleaned_text(self, tmp_path):
+        """cleaned_text.txt と同じディレクトリに同じクリーニング結果の項目を書き出す"""
+        from src.cleaned_items import has_cleaned_items, iter_cleaned_items_file
+        from src.dict_manager import get_xml_content_hash
+        from src.text_cleaner_cli import main
+
+        output_dir = tmp_path / "output"
+        with patch("src.text_cleaner_cli.init_for_hash"):
+            main(["--input", str(SAMPLE_BOOK2_XML), "--output", str(output_dir)])
+
+        content_hash = get_xml_content_hash(SAMPLE_BOOK2_XML)
+        items_path = output_dir / content_hash / "cleaned_items.jsonl"
+        assert has_cleaned_items(items_path, content_hash)
+
+        content = (output_dir / content_hash / "cleaned_text.txt").read_text(encoding="utf-8")
+        texts = [item.text.lstrip("\ue001\ue002") for item in iter_cleaned_items_file(items_path)]
+        assert texts
+        assert all(text in content for text in texts)
+
+
 class TestMainOverwritesExistingFile:
     """受け入れシナリオ 2: 既存ファイルの上書きを検証する。
 
@@ -229,7 +259,7 @@ class TestMainOverwritesExistingFile:
         output_dir = tmp_path / "output"
 
         # 1回目の実行
-        with patch("src.text_cleaner_cli.init_for_content"):
+        with patch("src.text_cleaner_cli.init_for_hash"):
             main(["--input", str(SAMPLE_BOOK2_XML), "--output", str(output_dir)])
 
         cleaned_files = list(output_dir.rglob("cleaned_text.txt"))
@@ -240,7 +270,7 @@ class TestMainOverwritesExistingFile:
         cleaned_files[0].write_text("DUMMY_CONTENT_TO_BE_OVERWRITTEN", encoding="utf-8")
 
         # 2回目の実行
-        with patch("src.text_cleaner_cli.init_for_content"):
+        with patch("src.text_cleaner_cli.init_for_hash"):
             main(["--input", str(SAMPLE_BOOK2_XML), "--output", str(output_dir)])
 
         # 上書きされているべき
@@ -316,7 +346,7 @@ class TestErrorHandling:
 
         # クラッシュせずに正常終了するか、適切なエラーを返すべき
         try:
-            with patch("src.text_cleaner_cli.init_for_content"):
+            with patch("src.text_cleaner_cli.init_for_hash"):
                 main(["--input", str(empty_xml)])
         except SystemExit as e:
             # 正常終了（code 0）も許容
@@ -343,7 +373,7 @@ class TestOutputDirectoryCreation:
         output_dir = tmp_path / "non_existent" / "nested" / "output"
         assert not output_dir.exists(), "テスト前提: 出力ディレクトリは存在しないべき"
 
-        with patch("src.text_cleaner_cli.init_for_content"):
+        with patch("src.text_cleaner_cli.init_for_hash"):
             main(["--input", str(SAMPLE_BOOK2_XML), "--output", str(output_dir)])
 
         # ディレクトリが作成されているべき
@@ -355,7 +385,7 @@ class TestOutputDirectoryCreation:
 
         output_dir = tmp_path / "output"
 
-        with patch("src.text_cleaner_cli.init_for_content"):
+        with patch("src.text_cleaner_cli.init_for_hash"):
             main(["--input", str(SAMPLE_BOOK2_XML), "--output", str(output_dir)])
 
         # output_dir 直下ではなく、ハッシュベースのサブディレクトリに格納されるべき
@@ -377,8 +407,168 @@ class TestOutputDirectoryCreation:
         output_dir.mkdir(parents=True)
 
         # エラーなしで実行されるべき
-        with patch("src.text_cleaner_cli.init_for_content"):
+        with patch("src.text_cleaner_cli.init_for_hash"):
             main(["--input", str(SAMPLE_BOOK2_XML), "--output", str(output_dir)])
 
         cleaned_files = list(output_dir.rglob("cleaned_text.txt"))
         assert len(cleaned_files) >= 1, "既存の出力ディレクトリでも cleaned_text.txt が生成されるべき"
+
+
+# =============================================================================
+# --jobs: プロセスプールによる並列クリーニング
+# =============================================================================
+
+
+class TestParallelCleaning:
+    """--jobs N でプロセスプールに分散しても出力が変わらないことを検証する。"""
+
+    def test_jobs_default_is_one(self):
+        """--jobs の既定値は 1"""
+        from src.text_cleaner_cli import parse_args
+
+        assert parse_args(["--input", str(SAMPLE_BOOK2_XML)]).jobs == 1
+
+    def test_jobs_must_be_positive(self):
+        """--jobs 0 はエラー"""
+        from src.text_cleaner_cli import parse_args
+
+        with pytest.raises(SystemExit):
+            parse_args(["--input", str(SAMPLE_BOOK2_XML), "--jobs", "0"])
+
+    def test_parallel_output_matches_sequential(self, tmp_path):
+        """並列実行でも順序・章区切りを含めて逐次実行と同じ cleaned_text.txt になる"""
+        from src.text_cleaner_cli import main
+
+        # Several worker tasks' worth of items across two chapters
+        chapters = "".join(
+            f'<chapter number="{n}" title="Chapter {n}">'
+            + "".join(f"<paragraph>第{n}章の{i}番目の段落。</paragraph>" for i in range(100))
+            + "</chapter>"
+            for n in (1, 2)
+        )
+        xml_path = tmp_path / "book.xml"
+        xml_path.write_text(f'<?xml version="1.0" encoding="UTF-8"?><book>{chapters}</book>', encoding="utf-8")
+
+        outputs = []
+        for jobs in ("1", "2"):
+            output_dir = tmp_path / f"jobs{jobs}"
+            with patch("src.text_cleaner_cli.init_for_hash"):
+                main(["--input", str(xml_path), "--output", str(output_dir), "--jobs", jobs])
+            (cleaned_file,) = output_dir.rglob("cleaned_text.txt")
+            outputs.append(cleaned_file.read_text(encoding="utf-8"))
+
+        assert outputs[0].count("=== Chapter") == 2
+        assert outputs[1] == outputs[0]
+
+    def test_clean_item_text_heading_period(self):
+        """見出しは末尾の句読点を 1 つの「。」にそろえる"""
+        from src.text_cleaner_cli import clean_item_text
+
+        with patch("src.text_cleaner_cli.clean_page_text", side_effect=lambda text: text):
+            assert clean_item_text("heading", "はじめに、！") == "はじめに。"
+            assert clean_item_text("paragraph", "本文、") == "本文、"
+
+
+# =============================================================================
+# 項目ごとのクリーニング結果キャッシュ
+# =============================================================================
+
+
+def _write_book(path, paragraphs):
+    """段落のリストから 1 章の XML を書き出す"""
+    body = "".join(f"<paragraph>{text}</paragraph>" for text in paragraphs)
+    path.write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?><book><chapter number="1" title="C">{body}</chapter></book>',
+        encoding="utf-8",
+    )
+
+
+class TestIncrementalCleaning:
+    """再実行時は入力が変わった項目だけをクリーニングすることを検証する。
+
+    項目数は章見出し 1 件 + 段落数。
+    """
+
+    def _run(self, xml_path, output_dir, *extra):
+        from src.text_cleaner_cli import main
+
+        with (
+            patch("src.text_cleaner_cli.init_for_hash"),
+            patch("src.text_cleaner_cli.clean_page_text", side_effect=lambda text: text.upper()) as mock_clean,
+            patch("src.text_cleaner_cli.logger") as mock_logger,
+        ):
+            main(["--input", str(xml_path), "--output", str(output_dir), *extra])
+        (cleaned_file,) = output_dir.rglob("cleaned_text.txt")
+        report = [c.args for c in mock_logger.info.call_args_list if "cache" in c.args[0]]
+        return cleaned_file.read_text(encoding="utf-8"), mock_clean.call_count, report
+
+    def test_rerun_hits_cache(self, tmp_path):
+        """同じ入力の再実行では全項目がキャッシュから取得され、出力は同じ"""
+        xml_path = tmp_path / "book.xml"
+        _write_book(xml_path, ["first", "second", "third"])
+
+        first, first_calls, first_report = self._run(xml_path, tmp_path / "out")
+        second, second_calls, second_report = self._run(xml_path, tmp_path / "out")
+
+        assert first_calls == 4
+        assert second_calls == 0
+        assert second == first
+        assert first_report[-1][1:] == (0, 4)
+        assert second_report[-1][1:] == (4, 0)
+
+    def test_edited_item_is_recomputed(self, tmp_path):
+        """1 段落を修正すると、その項目だけが再計算される"""
+        xml_path = tmp_path / "book.xml"
+        _write_book(xml_path, ["first", "second", "third"])
+        self._run(xml_path, tmp_path / "out")
+
+        _write_book(xml_path, ["first", "second fixed", "third"])
+        content, calls, report = self._run(xml_path, tmp_path / "out2")
+
+        assert calls == 1
+        assert "SECOND FIXED" in content
+        assert report[-1][1:] == (3, 1)
+
+    def _write_readings(self, xml_path, readings):
+        from src.dict_manager import get_dict_path_from_hash, get_xml_content_hash
+
+        dict_path = get_dict_path_from_hash(get_xml_content_hash(xml_path))
+        dict_path.parent.mkdir(parents=True, exist_ok=True)
+        dict_path.write_text(json.dumps(readings), encoding="utf-8")
+
+    def test_dictionary_change_invalidates_matching_items(self, tmp_path):
+        """読み辞書の用語が変わると、その用語を含む項目だけを再計算する"""
+        xml_path = tmp_path / "book.xml"
+        _write_book(xml_path, ["first", "second"])
+        self._write_readings(xml_path, {"second": "セカンド"})
+        self._run(xml_path, tmp_path / "out")
+
+        self._write_readings(xml_path, {"second": "セコンド"})
+        _, calls, report = self._run(xml_path, tmp_path / "out")
+
+        assert calls == 1
+        assert report[-1][1:] == (2, 1)
+
+    def test_unrelated_dictionary_edit_keeps_cache(self, tmp_path):
+        """どの項目にも現れない用語を辞書に追加しても再計算しない"""
+        xml_path = tmp_path / "book.xml"
+        _write_book(xml_path, ["first", "second"])
+        self._write_readings(xml_path, {"second": "セカンド"})
+        self._run(xml_path, tmp_path / "out")
+
+        self._write_readings(xml_path, {"second": "セカンド", "Docker": "ドッカー"})
+        _, calls, report = self._run(xml_path, tmp_path / "out")
+
+        assert calls == 0
+        assert report[-1][1:] == (3, 0)
+
+    def test_no_cache_option(self, tmp_path):
+        """--no-cache ではキャッシュを使わない"""
+        xml_path = tmp_path / "book.xml"
+        _write_book(xml_path, ["first", "second"])
+        self._run(xml_path, tmp_path / "out")
+
+        _, calls, report = self._run(xml_path, tmp_path / "out", "--no-cache")
+
+        assert calls == 3
+        assert report == []
@@ -0,0 +1,170 @@
+"""Tests for the byte-offset chapter index of book2.xml.
+
+Target functions:
+- src/xml_index.py::build_book_index()
+- src/xml_index.py::load_book_index()
+- src/xml_index.py::iter_book2_xml_chapter()
+"""
+
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src import xml_index
+from src.xml_index import (
+    build_book_index,
+    get_index_sidecar_path,
+    iter_book2_xml_chapter,
+    load_book_index,
+)
+from src.xml_parser import parse_book2_xml
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+CHAPTER_BOOK_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<book>
+    <metadata><title>Index Test</title></metadata>
+    <toc begin="1" end="3">
+        <entry level="1" number="1" title="Introduction" />
+        <entry level="2" number="2.2" title="Numbered Heading" />
+    </toc>
+    <front-matter>
+        <chapter number="9" title="Not Indexed" />
+    </front-matter>
+    <chapter number="1" title="Introduction">
+        <paragraph>Chapter one &amp; more.</paragraph>
+    </chapter>
+    <chapter number="2" title="Title with /&gt; inside">
+        <section number="2.1" title="Details">
+            <paragraph>Section content.</paragraph>
+            <list><item>First</item><item>Second</item></list>
+        </section>
+        <section number="2.2" title="Empty" />
+        <heading level="2">Numbered Heading</heading>
+        <paragraph readAloud="false">Hidden.</paragraph>
+    </chapter>
+    <chapter number="3" title="三章">
+        <paragraph>日本語の段落。</paragraph>
+    </chapter>
+</book>
+"""
+
+
+@pytest.fixture
+def chapter_book(tmp_path):
+    """Book with several chapters, aged so its index may be persisted."""
+    xml_path = tmp_path / "book.xml"
+    xml_path.write_text(CHAPTER_BOOK_XML, encoding="utf-8")
+    old = time.time_ns() - 60 * 1_000_000_000
+    os.utime(xml_path, ns=(old, old))
+    return xml_path
+
+
+class TestBuildBookIndex:
+    """build_book_index が chapter/section のバイト範囲を記録することを検証する。"""
+
+    def test_spans_cover_complete_elements(self, chapter_book):
+        """各スパンは開始タグから終了タグまでを正確に含む"""
+        index = build_book_index(chapter_book)
+        data = chapter_book.read_bytes()
+
+        for span in index.spans:
+            raw = data[span.start : span.end]
+            assert raw.startswith(f"<{span.tag}".encode())
+            assert raw.endswith(f"</{span.tag}>".encode()) or raw.endswith(b"/>")
+
+    def test_only_processed_elements_indexed(self, chapter_book):
+        """front-matter 内の chapter は索引されない"""
+        index = build_book_index(chapter_book)
+
+        assert [s.number for s in index.spans if s.tag == "chapter"] == ["1", "2", "3"]
+        assert [s.number for s in index.section_spans(2)] == ["2.1", "2.2"]
+
+    def test_toc_range_recorded(self, chapter_book):
+        """トップレベルの TOC 範囲が記録される"""
+        index = build_book_index(chapter_book)
+        data = chapter_book.read_bytes()
+
+        assert index.toc is not None
+        toc = data[index.toc[0] : index.toc[1]]
+        assert toc.startswith(b"<toc") and toc.endswith(b"</toc>")
+
+    def test_malformed_xml_raises_parse_error(self, tmp_path):
+        """不正な XML では ParseError"""
+        with pytest.raises(ET.ParseError):
+            build_book_index(FIXTURES_DIR / "dict_test_invalid.xml")
+
+
+class TestIterBook2XmlChapter:
+    """iter_book2_xml_chapter が全体パース＋フィルタと同じ結果を返すことを検証する。"""
+
+    @pytest.mark.parametrize("chapter", [1, 2, 3])
+    def test_matches_full_parse_filter(self, chapter_book, chapter):
+        """チャプター単位パースの結果が全体パースのフィルタ結果と一致する"""
+        expected = [item for item in parse_book2_xml(chapter_book) if item.chapter_number == chapter]
+
+        assert list(iter_book2_xml_chapter(chapter_book, chapter)) == expected
+
+    def test_heading_number_from_toc(self, chapter_book):
+        """範囲パースでも TOC から見出し番号を引ける"""
+        items = list(iter_book2_xml_chapter(chapter_book, 2))
+
+        headings = [i.heading_info for i in items if i.heading_info is not None]
+        numbers = [h.number for h in headings if h.title == "Numbered Heading"]
+        assert numbers == ["2.2"]
+
+    def test_unknown_chapter_yields_nothing(self, chapter_book):
+        """存在しないチャプターでは何も返さない"""
+        assert list(iter_book2_xml_chapter(chapter_book, 42)) == []
+
+    def test_fixture_book_matches_full_parse(self):
+        """既存フィクスチャでも全体パースと一致する"""
+        xml_path = FIXTURES_DIR / "dict_test_book.xml"
+        full = parse_book2_xml(xml_path)
+
+        for chapter in (1, 2):
+            expected = [item for item in full if item.chapter_number == chapter]
+            assert list(iter_book2_xml_chapter(xml_path, chapter)) == expected
+
+
+class TestLoadBookIndex:
+    """load_book_index の永続化（サイドカー）を検証する。"""
+
+    def test_index_persisted_and_reused(self, chapter_book):
+        """インデックスはサイドカーに保存され、次回は再構築しない"""
+        first = load_book_index(chapter_book)
+        assert get_index_sidecar_path(chapter_book).exists()
+
+        with patch.object(xml_index, "build_book_index") as mock_build:
+            second = load_book_index(chapter_book)
+            mock_build.assert_not_called()
+
+        assert second == first
+
+    def test_index_rebuilt_when_file_changes(self, chapter_book):
+        """XML が変更されるとインデックスは再構築される"""
+        load_book_index(chapter_book)
+
+        chapter_book.write_text(CHAPTER_BOOK_XML.replace("<metadata>", "<metadata>  "), encoding="utf-8")
+        old = time.time_ns() - 30 * 1_000_000_000
+        os.utime(chapter_book, ns=(old, old))
+
+        index = load_book_index(chapter_book)
+
+        assert index == build_book_index(chapter_book)
+        stored = json.loads(get_index_sidecar_path(chapter_book).read_text(encoding="utf-8"))
+        assert stored["index"]["spans"][0]["start"] == index.spans[0].start
+
+    def test_fresh_file_not_persisted(self, tmp_path):
+        """更新直後のファイルのインデックスは保存しない"""
+        xml_path = tmp_path / "fresh.xml"
+        xml_path.write_text(CHAPTER_BOOK_XML, encoding="utf-8")
+
+        load_book_index(xml_path)
+
+        assert not get_index_sidecar_path(xml_path).exists()
@@ -13,11 +13,14 @@ Test Fixture: tests/fixtures/sample_book2.xml
 
 from pathlib import Path
 
+import pytest
+
 from src.xml_parser import (
     CHAPTER_MARKER,
     SECTION_MARKER,
     ContentItem,
     HeadingInfo,
+    iter_book2_xml,
     parse_book2_xml,
 )
 
@@ -891,3 +894,78 @@ class TestParseBook2XmlAssignsChapterNumbers:
             f"chapter 1 の heading に chapter_number=1 が設定されるべきだが、見つからない。"
             f"heading items: {heading_info}"
         )
+
+
+# --- iter_book2_xml: streaming parser ---
+
+
+class TestIterBook2Xml:
+    """iter_book2_xml が parse_book2_xml と同じ結果を逐次的に返すことを検証する。"""
+
+    def test_returns_iterator(self):
+        """list ではなくイテレータを返す"""
+        result = iter_book2_xml(SAMPLE_BOOK2_XML)
+
+        assert iter(result) is result
+
+    def test_matches_parse_book2_xml(self):
+        """parse_book2_xml と同じ ContentItem 列を同じ順序で返す"""
+        assert list(iter_book2_xml(SAMPLE_BOOK2_XML)) == parse_book2_xml(SAMPLE_BOOK2_XML)
+
+    def test_matches_parse_book2_xml_with_chapters(self):
+        """chapter/section 構造でも同じ結果（chapter_number、TOC番号を含む）"""
+        xml_path = FIXTURES_DIR / "dict_test_book.xml"
+
+        items = list(iter_book2_xml(xml_path))
+
+        assert items == parse_book2_xml(xml_path)
+        assert any(item.chapter_number is not None for item in items)
+
+    def test_toc_number_lookup_for_heading(self):
+        """<heading> の番号は TOC から引かれる"""
+        items = list(iter_book2_xml(FIXTURES_DIR / "integration_book.xml"))
+
+        numbered = [i for i in items if i.item_type == "heading" and i.heading_info and i.heading_info.number]
+        assert numbered, "TOC に一致する見出しには番号が付与されるべき"
+
+    def test_yields_items_before_parse_finishes(self, tmp_path):
+        """ファイル末尾が壊れていても、それ以前のアイテムは先に取得できる"""
+        xml_path = tmp_path / "truncated.xml"
+        xml_path.write_text(
+            "<book><paragraph>First.</paragraph><paragraph>Second.</paragraph><paragraph>",
+            encoding="utf-8",
+        )
+
+        iterator = iter_book2_xml(xml_path)
+        first = next(iterator)
+
+        assert first.text == "First."
+
+    def test_nested_skipped_sections(self, tmp_path):
+        """front-matter 内や未知の要素内のコンテンツはスキップされる"""
+        xml_path = tmp_path / "nested.xml"
+        xml_path.write_text(
+            """<book>
+    <front-matter><paragraph>Skip me.</paragraph></front-matter>
+    <div><paragraph>Also skipped.</paragraph></div>
+    <chapter number="1" title="Intro">
+        <section number="1.1" title="Part">
+            <list><item>One</item><item>Two</item></list>
+            <paragraph readAloud="false">Hidden.</paragraph>
+            <paragraph>Kept.</paragraph>
+        </section>
+    </chapter>
+</book>""",
+            encoding="utf-8",
+        )
+
+        items = list(iter_book2_xml(xml_path))
+
+        assert items == parse_book2_xml(xml_path)
+        assert [i.text for i in items if i.item_type != "heading"] == ["One", "Two", "Kept."]
+        assert all(i.chapter_number == 1 for i in items)
+
+    def test_missing_file_raises(self, tmp_path):
+        """存在しないファイルでは FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            list(iter_book2_xml(tmp_path / "missing.xml"))
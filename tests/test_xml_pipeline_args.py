@@ -295,3 +295,23 @@ class TestParseArgsCleanedTextOption:
         assert args.cleaned_text == "/path/to/cleaned.txt"
         assert args.speed == 1.5
         assert args.style_id == 1
+
+
+class TestParseArgsChapterOption:
+    """--chapter オプション（インデックスによるチャプター単位パース）のテスト。"""
+
+    def test_chapter_option_default_is_none(self):
+        """--chapter 未指定時のデフォルトは None（全チャプター）"""
+        from src.xml_pipeline import parse_args
+
+        args = parse_args(["-i", str(SAMPLE_BOOK2_XML)])
+
+        assert args.chapter is None
+
+    def test_chapter_option_is_int(self):
+        """--chapter の値は int として受け取る"""
+        from src.xml_pipeline import parse_args
+
+        args = parse_args(["-i", str(SAMPLE_BOOK2_XML), "--chapter", "7"])
+
+        assert args.chapter == 7
@@ -58,8 +58,8 @@ class TestCleanedTextFileContainsCleanedContent:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.chapter_processor.generate_audio") as mock_gen,
@@ -107,8 +107,8 @@ class TestCleanedTextFileContainsCleanedContent:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.chapter_processor.generate_audio") as mock_gen,
@@ -154,8 +154,8 @@ class TestCleanedTextFileContainsCleanedContent:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.chapter_processor.generate_audio") as mock_gen,
@@ -201,8 +201,8 @@ class TestCleanedTextFileContainsCleanedContent:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.chapter_processor.generate_audio") as mock_gen,
@@ -260,8 +260,8 @@ class TestCleanedTextFileHasChapterMarkers:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.chapter_processor.generate_audio") as mock_gen,
@@ -312,8 +312,8 @@ class TestCleanedTextFileHasChapterMarkers:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.chapter_processor.generate_audio") as mock_gen,
@@ -364,8 +364,8 @@ class TestCleanedTextFileHasChapterMarkers:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.chapter_processor.generate_audio") as mock_gen,
@@ -414,8 +414,8 @@ class TestCleanedTextFileHasChapterMarkers:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.chapter_processor.generate_audio") as mock_gen,
@@ -103,8 +103,8 @@ class TestMainWithCleanedTextSkipsCleaning:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.xml_pipeline.clean_page_text") as mock_clean,
@@ -156,8 +156,8 @@ class TestMainWithCleanedTextSkipsCleaning:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.chapter_processor.generate_audio") as mock_gen,
@@ -265,11 +265,11 @@ class TestBackwardCompatibilityWithoutCleanedText:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
-            patch("src.xml_pipeline.clean_page_text") as mock_clean,
+            patch("src.text_cleaner_cli.clean_page_text") as mock_clean,
             patch("src.chapter_processor.generate_audio") as mock_gen,
             patch("src.chapter_processor.save_audio"),
             patch("src.chapter_processor.concatenate_audio_files"),
@@ -311,8 +311,8 @@ class TestBackwardCompatibilityWithoutCleanedText:
         output_dir = tmp_path / "output"
 
         with (
-            patch("src.xml_pipeline.init_for_content"),
-            patch("src.xml_pipeline.get_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.init_for_hash"),
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
             patch("src.xml_pipeline.VoicevoxConfig"),
             patch("src.xml_pipeline.VoicevoxSynthesizer"),
             patch("src.chapter_processor.generate_audio") as mock_gen,
@@ -337,3 +337,135 @@ class TestBackwardCompatibilityWithoutCleanedText:
         # cleaned_text.txt が生成されるべき
         cleaned_text_files = list(output_dir.rglob("cleaned_text.txt"))
         assert len(cleaned_text_files) >= 1, "--cleaned-text 未指定時は cleaned_text.txt が新規生成されるべき"
+
+
+class TestCleanedItemsArtifact:
+    """cleaned_items.jsonl を介してクリーニングを 1 回で済ませるテスト"""
+
+    XML_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<book>
+  <chapter number="1" title="Test">
+    <paragraph>合計は123個です。</paragraph>
+  </chapter>
+</book>"""
+
+    def _run(self, xml_path, output_dir, *extra_args):
+        from src.xml_pipeline import main
+
+        with (
+            patch("src.xml_pipeline.init_for_hash") as mock_init,
+            patch("src.xml_pipeline.get_streaming_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.get_xml_content_hash", return_value="testhash"),
+            patch("src.xml_pipeline.VoicevoxConfig"),
+            patch("src.xml_pipeline.VoicevoxSynthesizer"),
+            patch("src.chapter_processor.clean_page_text") as mock_tts_clean,
+            patch("src.chapter_processor.generate_audio") as mock_gen,
+            patch("src.chapter_processor.save_audio"),
+            patch("src.chapter_processor.concatenate_audio_files"),
+        ):
+            mock_gen.return_value = (np.zeros(2400, dtype=np.float32), 24000)
+            main(
+                [
+                    "--input",
+                    str(xml_path),
+                    "--output",
+                    str(output_dir),
+                    "--chapter-sound",
+                    "",
+                    "--section-sound",
+                    "",
+                    *extra_args,
+                ]
+            )
+        spoken = [call.kwargs["text"] for call in mock_gen.call_args_list]
+        return mock_init, mock_tts_clean, spoken
+
+    def test_synthesis_uses_cleaned_items(self, tmp_path, mock_pid_management, monkeypatch):
+        """通常実行では cleaned_items.jsonl を出力し、音声合成時に再クリーニングしない"""
+        monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+        xml_path = tmp_path / "test_book.xml"
+        xml_path.write_text(self.XML_CONTENT, encoding="utf-8")
+        output_dir = tmp_path / "output"
+
+        _, mock_tts_clean, spoken = self._run(xml_path, output_dir)
+
+        assert (output_dir / "testhash" / "cleaned_items.jsonl").exists()
+        assert not mock_tts_clean.called
+        assert "ゴウケイはひゃくにじゅうさんこです。" in spoken
+
+    def test_cleaned_text_option_skips_all_cleaning(self, tmp_path, mock_pid_management, monkeypatch):
+        """--cleaned-text 指定時は隣の cleaned_items.jsonl を使い、辞書読込・クリーニングを行わない"""
+        monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+        xml_path = tmp_path / "test_book.xml"
+        xml_path.write_text(self.XML_CONTENT, encoding="utf-8")
+        output_dir = tmp_path / "output"
+        self._run(xml_path, output_dir)
+
+        # 成果物の本文を差し替え、合成がそれを読むことを確認する
+        items_path = output_dir / "testhash" / "cleaned_items.jsonl"
+        items_path.write_text(
+            items_path.read_text(encoding="utf-8").replace("ひゃくにじゅうさん", "ひゃく"), encoding="utf-8"
+        )
+
+        with patch("src.text_cleaner_cli.clean_page_text") as mock_clean:
+            mock_init, mock_tts_clean, spoken = self._run(
+                xml_path, output_dir, "--cleaned-text", str(output_dir / "testhash" / "cleaned_text.txt")
+            )
+
+        assert not mock_clean.called
+        assert not mock_tts_clean.called
+        assert not mock_init.called
+        assert "ゴウケイはひゃくこです。" in spoken
+
+    def test_current_artifact_reused_stale_rebuilt(self, tmp_path, mock_pid_management, monkeypatch):
+        """再実行時は有効な成果物を再利用し、読み辞書が変わった成果物は作り直す"""
+        monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+        xml_path = tmp_path / "test_book.xml"
+        xml_path.write_text(self.XML_CONTENT, encoding="utf-8")
+        output_dir = tmp_path / "output"
+        self._run(xml_path, output_dir)
+
+        with patch("src.text_cleaner_cli.clean_page_text", side_effect=lambda t: t) as mock_clean:
+            self._run(xml_path, output_dir)
+        assert not mock_clean.called
+
+        dict_path = tmp_path / "data" / "testhash" / "readings.json"
+        dict_path.parent.mkdir(parents=True, exist_ok=True)
+        dict_path.write_text('{"合計": "ごうけい"}', encoding="utf-8")
+        with patch("src.text_cleaner_cli.clean_page_text", side_effect=lambda t: t) as mock_clean:
+            self._run(xml_path, output_dir)
+        assert mock_clean.called
+
+    def test_chapter_run_keeps_book_artifact(self, tmp_path, mock_pid_management, monkeypatch):
+        """--chapter 実行は章ごとのファイルに出力し、書籍全体の成果物を上書きしない"""
+        monkeypatch.setattr("src.dict_manager.DATA_BASE_DIR", tmp_path / "data")
+        xml_path = tmp_path / "test_book.xml"
+        chapter_two = '<chapter number="2" title="Two"><paragraph>二章。</paragraph></chapter>'
+        xml_path.write_text(self.XML_CONTENT.replace("</book>", chapter_two + "</book>"), encoding="utf-8")
+        book_dir = tmp_path / "output" / "testhash"
+
+        _, _, spoken = self._run(xml_path, tmp_path / "output", "--chapter", "2")
+
+        assert (book_dir / "cleaned_items_ch02.jsonl").exists()
+        assert (book_dir / "cleaned_text_ch02.txt").exists()
+        assert not (book_dir / "cleaned_items.jsonl").exists()
+        assert spoken[-1] == "ニショウ。"
+
+        # 書籍全体の成果物があれば章の実行もそれを使う
+        self._run(xml_path, tmp_path / "output")
+        book_items = (book_dir / "cleaned_items.jsonl").read_bytes()
+        with patch("src.text_cleaner_cli.clean_page_text") as mock_clean:
+            self._run(xml_path, tmp_path / "output", "--chapter", "1")
+        assert not mock_clean.called
+        assert (book_dir / "cleaned_items.jsonl").read_bytes() == book_items
+
+    def test_cleaned_text_without_artifact_cleans_during_synthesis(self, tmp_path, mock_pid_management):
+        """cleaned_items.jsonl が無い場合は合成時にクリーニングする（従来動作）"""
+        xml_path = tmp_path / "test_book.xml"
+        xml_path.write_text(self.XML_CONTENT, encoding="utf-8")
+        cleaned_text_path = tmp_path / "cleaned_text.txt"
+        cleaned_text_path.write_text("事前に生成されたテキスト。\n", encoding="utf-8")
+
+        _, mock_tts_clean, _ = self._run(xml_path, tmp_path / "output", "--cleaned-text", str(cleaned_text_path))
+
+        assert mock_tts_clean.called